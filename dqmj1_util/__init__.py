@@ -1,3 +1,4 @@
+from dqmj1_util._batch import BatchResult, read_roms
 from dqmj1_util._character_encoding import (
     CHARACTER_ENCODINGS,
     CharacterEncoding,
@@ -6,19 +7,24 @@ from dqmj1_util._character_encoding import (
     StringToDmqj1BytesEncodingError,
 )
 from dqmj1_util._guide import GuideData, write_guide
+from dqmj1_util._patch import PatchFormat
 from dqmj1_util._region import Region
-from dqmj1_util._rom import Rom
+from dqmj1_util._rom import CacheStats, Rom
 from dqmj1_util._string_tables import StringTables
 
 __all__ = [
     "CHARACTER_ENCODINGS",
+    "BatchResult",
+    "CacheStats",
     "CharacterEncoding",
     "Dmqj1BytesToStringDecodingError",
     "GetBytesMatchError",
     "GuideData",
+    "PatchFormat",
     "Region",
     "Rom",
     "StringTables",
     "StringToDmqj1BytesEncodingError",
+    "read_roms",
     "write_guide",
 ]
@@ -0,0 +1,312 @@
+from __future__ import annotations
+
+import argparse
+import concurrent.futures
+import dataclasses
+import json
+import os
+import pathlib
+import sys
+import traceback
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass
+from typing import IO, Any, Callable, Optional
+
+from dqmj1_util._region import Region
+from dqmj1_util._rom import BTL_ENMY_PRM_PATH, SKILL_TBL_PATH, Rom
+from dqmj1_util.raw._btl_enmy_prm import BtlEnmyPrmArray
+from dqmj1_util.raw._skill_tbl import SkillTblArray
+from dqmj1_util.raw._util import flatten_structured_array
+
+SUCCESS = 0
+FAILURE = 1
+
+ROM_FILE_EXTENSION = ".nds"
+
+
+def _read_string_tables(rom: Rom) -> Any:
+    return dataclasses.asdict(rom.view_string_tables())
+
+
+def _read_encounters(rom: Rom) -> Any:
+    return [dataclasses.asdict(encounter) for encounter in rom.encounters]
+
+
+def _read_skill_sets(rom: Rom) -> Any:
+    return [dataclasses.asdict(skill_set) for skill_set in rom.skill_sets]
+
+
+def _read_skills(rom: Rom) -> Any:
+    return [dataclasses.asdict(skill) for skill in rom.skills]
+
+
+def _read_btl_enmy_prm(rom: Rom) -> Any:
+    btl_enmy_prm = BtlEnmyPrmArray.from_bytes(rom.read_file(BTL_ENMY_PRM_PATH))
+
+    return {
+        name: column.tolist()
+        for name, column in flatten_structured_array(btl_enmy_prm.entries).items()
+    }
+
+
+def _read_skill_tbl(rom: Rom) -> Any:
+    skill_tbl = SkillTblArray.from_bytes(rom.read_file(SKILL_TBL_PATH), rom.region)
+
+    return {
+        name: column.tolist()
+        for name, column in flatten_structured_array(skill_tbl.entries).items()
+    }
+
+
+TABLE_READERS: dict[str, Callable[[Rom], Any]] = {
+    "string_tables": _read_string_tables,
+    "encounters": _read_encounters,
+    "skill_sets": _read_skill_sets,
+    "skills": _read_skills,
+    "btl_enmy_prm": _read_btl_enmy_prm,
+    "skill_tbl": _read_skill_tbl,
+}
+"""
+Functions for reading each of the tables that can be extracted in a batch, as JSON compatible data.
+
+Simple data is given as a list of objects, and raw tables as an object of columns (in the same
+format as their :code:`to_pd` methods).
+"""
+
+
+class UnknownTableError(ValueError):
+    def __init__(self, table: str):
+        super().__init__(
+            f"Unknown table: {table}. Supported tables are: {', '.join(TABLE_READERS.keys())}"
+        )
+
+
+@dataclass
+class BatchResult:
+    """
+    Result of extracting tables from a single ROM in a batch.
+
+    Either :attr:`tables` or :attr:`error` is set, depending on whether extraction succeeded.
+    """
+
+    rom_filepath: pathlib.Path
+    tables: Optional[dict[str, Any]] = None
+    """
+    Extracted tables, by name, as JSON compatible data.
+    """
+    error: Optional[str] = None
+    """
+    Description (including the traceback) of the error that occurred if extraction failed.
+    """
+
+    def to_json(self) -> dict[str, Any]:
+        data: dict[str, Any] = {"rom_filepath": str(self.rom_filepath)}
+        if self.error is not None:
+            data["error"] = self.error
+        else:
+            data["tables"] = self.tables
+
+        return data
+
+
+def extract_tables(
+    rom_filepath: pathlib.Path,
+    tables: Sequence[str],
+    region: Region = Region.NorthAmerica,
+    cache_dir: Optional[pathlib.Path] = None,
+) -> BatchResult:
+    """
+    Extracts the given tables from the given ROM, capturing any error in the result rather than
+    raising it.
+
+    Run in the worker processes of :func:`read_roms`.
+    """
+    try:
+        rom = Rom(rom_filepath, region=region, lazy=True, cache_dir=cache_dir)
+
+        return BatchResult(
+            rom_filepath=rom_filepath,
+            tables={table: TABLE_READERS[table](rom) for table in tables},
+        )
+    except Exception:
+        return BatchResult(rom_filepath=rom_filepath, error=traceback.format_exc())
+
+
+def read_roms(
+    rom_filepaths: Iterable[os.PathLike[Any] | str | tuple[os.PathLike[Any] | str, Region]],
+    tables: Sequence[str],
+    region: Region = Region.NorthAmerica,
+    workers: Optional[int] = None,
+    max_in_flight: Optional[int] = None,
+    cache_dir: Optional[os.PathLike[Any] | str] = None,
+) -> Iterator[BatchResult]:
+    """
+    Extracts the given tables from each of the given ROMs in parallel, using a pool of worker
+    processes.
+
+    Results are yielded as each ROM finishes (so not necessarily in the order given). A failure for
+    one ROM is reported in its result, and does not stop the other ROMs from being processed.
+
+    :param rom_filepaths: Filepaths of the ROMs to read, each optionally paired with the region
+        the ROM is for (ex. :code:`("rom.nds", Region.Japan)`). Can be a lazy iterable, as only a
+        limited number of ROMs are submitted to the workers at a time.
+    :param tables: Names of the tables to extract, see :data:`TABLE_READERS`.
+    :param region: Region the ROMs that are not paired with a region are for.
+    :param workers: Number of worker processes. Defaults to the number of CPUs.
+    :param max_in_flight: Maximum number of ROMs submitted to the workers at a time, which bounds
+        the memory used for pending results. Defaults to twice the number of workers.
+    :param cache_dir: Directory to use for the :class:`Rom` disk cache, if any.
+    """
+    for table in tables:
+        if table not in TABLE_READERS:
+            raise UnknownTableError(table)
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if max_in_flight is None:
+        max_in_flight = 2 * workers
+
+    cache_path = pathlib.Path(cache_dir) if cache_dir is not None else None
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        in_flight: dict[concurrent.futures.Future[BatchResult], pathlib.Path] = {}
+
+        for rom_filepath in rom_filepaths:
+            if len(in_flight) >= max_in_flight:
+                yield from _wait_for_results(in_flight)
+
+            rom_region = region
+            if isinstance(rom_filepath, tuple):
+                rom_filepath, rom_region = rom_filepath
+
+            rom_path = pathlib.Path(rom_filepath)
+            future = executor.submit(extract_tables, rom_path, tables, rom_region, cache_path)
+            in_flight[future] = rom_path
+
+        while len(in_flight) > 0:
+            yield from _wait_for_results(in_flight)
+
+
+def _wait_for_results(
+    in_flight: dict[concurrent.futures.Future[BatchResult], pathlib.Path],
+) -> Iterator[BatchResult]:
+    done, _ = concurrent.futures.wait(in_flight, return_when=concurrent.futures.FIRST_COMPLETED)
+
+    for future in done:
+        rom_filepath = in_flight.pop(future)
+        try:
+            yield future.result()
+        except Exception as e:
+            # Errors are normally captured by the worker, so this is for errors in the pool itself
+            # (ex. a worker process being killed)
+            yield BatchResult(rom_filepath=rom_filepath, error=repr(e))
+
+
+def find_rom_filepaths(paths: Iterable[pathlib.Path]) -> Iterator[pathlib.Path]:
+    """
+    Yields the given ROM filepaths, expanding directories into the ROM files within them.
+    """
+    for path in paths:
+        if path.is_dir():
+            yield from sorted(path.rglob(f"*{ROM_FILE_EXTENSION}"))
+        else:
+            yield path
+
+
+def find_rom_regions(
+    paths: Iterable[pathlib.Path], region: Region, path_regions: dict[pathlib.Path, Region]
+) -> Iterator[tuple[pathlib.Path, Region]]:
+    """
+    Yields the ROM filepaths found in the given paths (see :func:`find_rom_filepaths`), each
+    paired with the region given for the ROM file or the path it was found in, or otherwise the
+    given default region.
+    """
+    for path in paths:
+        for rom_filepath in find_rom_filepaths([path]):
+            yield rom_filepath, path_regions.get(rom_filepath, path_regions.get(path, region))
+
+
+def write_results(results: Iterable[BatchResult], output_stream: IO[str]) -> bool:
+    """
+    Writes the given results as JSON lines (one JSON object per ROM) to the given output stream.
+
+    Returns whether all of the results were successful.
+    """
+    all_successful = True
+    for result in results:
+        if result.error is not None:
+            all_successful = False
+
+        output_stream.write(json.dumps(result.to_json(), separators=(",", ":")))
+        output_stream.write("\n")
+
+    return all_successful
+
+
+@dataclass
+class Args:
+    rom_filepaths: list[pathlib.Path]
+    tables: list[str]
+    region: str
+    path_region: Optional[list[list[str]]]
+    workers: Optional[int]
+    cache_dir: Optional[pathlib.Path]
+    output_filepath: Optional[pathlib.Path]
+
+
+def main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(
+        description="Extracts tables from many ROMs in parallel, writing them as JSON lines."
+    )
+
+    parser.add_argument(
+        "rom_filepaths", nargs="+", type=pathlib.Path, help="ROM files or directories of ROMs"
+    )
+    parser.add_argument("--tables", nargs="+", required=True, choices=list(TABLE_READERS.keys()))
+    parser.add_argument(
+        "--region", choices=[region.name for region in Region], default=Region.NorthAmerica.name
+    )
+    parser.add_argument(
+        "--path_region",
+        nargs=2,
+        action="append",
+        metavar=("PATH", "REGION"),
+        help="Region of the ROM file or directory of ROMs at the given path, overriding --region. "
+        "Can be given multiple times",
+    )
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--cache_dir", type=pathlib.Path, default=None)
+    parser.add_argument(
+        "--output_filepath", type=pathlib.Path, default=None, help="Defaults to stdout"
+    )
+
+    args = Args(**vars(parser.parse_args(argv)))
+
+    path_regions: dict[pathlib.Path, Region] = {}
+    for path, region in args.path_region or []:
+        if region not in Region.__members__:
+            parser.error(
+                f"invalid region for --path_region {path}: {region} (choose from "
+                f"{', '.join(Region.__members__)})"
+            )
+
+        path_regions[pathlib.Path(path)] = Region[region]
+
+    results = read_roms(
+        find_rom_regions(args.rom_filepaths, Region[args.region], path_regions),
+        args.tables,
+        workers=args.workers,
+        cache_dir=args.cache_dir,
+    )
+
+    if args.output_filepath is not None:
+        with args.output_filepath.open("w", encoding="utf8") as output_stream:
+            all_successful = write_results(results, output_stream)
+    else:
+        all_successful = write_results(results, sys.stdout)
+
+    return SUCCESS if all_successful else FAILURE
+
+
+def main_without_args() -> int:
+    return main(sys.argv[1:])
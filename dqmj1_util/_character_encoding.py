@@ -1,7 +1,19 @@
 # ruff: noqa: RUF001
 
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable
+from typing import Optional
+
 from dqmj1_util._region import Region
 
+STRING_TERMINATOR_PATTERN = re.compile(b"\xff|\xfe\x00")
+"""
+Matches the end of a string in the game's data. The check against 0xFE 0x00 is due to an edge case
+at 0x02079c16.
+"""
+
 
 class StringToDmqj1BytesEncodingError(ValueError):
     def __init__(self, string: str) -> None:
@@ -9,11 +21,16 @@ class StringToDmqj1BytesEncodingError(ValueError):
 
 
 class Dmqj1BytesToStringDecodingError(ValueError):
-    def __init__(self, bs: list[int] | bytes):
+    def __init__(self, bs: list[int] | bytes | memoryview):
         super().__init__(f"Failed to convert bytes {[hex(byte) for byte in bs]} to a string.")
 
 
 class GetBytesMatchError(AssertionError):
+    """
+    Deprecated: no longer raised, since characters are matched using a prefix trie of the
+    encoding. Kept so that existing code that references it keeps working.
+    """
+
     def __init__(self, a: list[int] | bytes, b: list[int] | bytes):
         super().__init__(f"{a!r} != {b!r}")
 
@@ -23,30 +40,55 @@ class CharacterEncoding:
         self,
         byte_to_char_map: list[tuple[list[int], str]],
     ) -> None:
-        self.__byte_to_char_map = byte_to_char_map
         self.__char_to_byte_map = {c: b for b, c in byte_to_char_map}
+        self.__decoding_trie = _DecodingTrieNode.from_byte_to_char_map(byte_to_char_map)
 
     def read_string(self, bs: list[int] | bytes) -> str:
-        if len(bs) == 0:
-            # TODO: better understand why this edge case occurs
-            return ""
+        return self.read_strings(bytes(bs), [0], max_string_length=len(bs))[0]
+
+    def read_strings(
+        self, data: bytes | memoryview, offsets: Iterable[int], max_string_length: int = 100
+    ) -> list[str]:
+        """
+        Reads the strings that start at each of the given offsets into the data.
+
+        Equivalent to calling :meth:`read_string` on the :code:`max_string_length` bytes at each
+        offset, but finds the end of each string with a regular expression search and decodes it
+        through a memoryview, so neither the data nor each string is copied.
+
+        :param data: Data to read the strings from (ex. the arm9 binary).
+        :param offsets: Offsets into the data that each string starts at.
+        :param max_string_length: Maximum number of bytes to search for the end of each string.
+        """
+        view = memoryview(data)
+
+        strings = []
+        for offset in offsets:
+            start = offset
+            limit = min(offset + max_string_length, len(view))
+            if start >= limit:
+                # TODO: better understand why this edge case occurs
+                strings.append("")
+                continue
 
-        buffer: list[int] = []
-        for i, byte in enumerate(bs):
             # Note: The skipping of 0x0A at possible string start is due to an edge case I
             # saw at 0x0207d792
-            if (byte == 0x00 or byte == 0x0A) and len(buffer) == 0:
-                continue
-            # Note: The check against 0xFE is due to an edge case at 0x02079c16.
-            elif byte == 0xFF or (byte == 0xFE and bs[i + 1] == 0x0):
-                string = self.bytes_to_string(buffer)
+            while start < limit and view[start] in (0x00, 0x0A):
+                start += 1
 
-                buffer = []
-                return string
-            else:
-                buffer.append(byte)
+            # Unlike bytes.find, regular expressions can search a memoryview without copying it
+            match = STRING_TERMINATOR_PATTERN.search(view, start, limit)
+            if match is None:
+                if view[limit - 1] == 0xFE:
+                    # Possibly the start of a "\xfe\x00" terminator that was cut off by the end of
+                    # the data, which has always been reported as an IndexError
+                    raise IndexError(limit)
 
-        raise ValueError(buffer)
+                raise ValueError(list(view[start:limit]))
+
+            strings.append(self.bytes_to_string(view[start : match.start()]))
+
+        return strings
 
     def string_to_bytes(self, string: str) -> bytes:
         try:
@@ -78,7 +120,7 @@ class CharacterEncoding:
 
         return bytes(string_bytes)
 
-    def bytes_to_string(self, bs: list[int] | bytes) -> str:
+    def bytes_to_string(self, bs: list[int] | bytes | memoryview) -> str:
         chars = []
         i = 0
         while i != len(bs):
@@ -94,30 +136,50 @@ class CharacterEncoding:
 
         return "".join(chars)
 
-    def __get_bytes_match(self, bs: list[int] | bytes, i: int) -> tuple[str, int]:
-        matches = list(self.__byte_to_char_map)
+    def __get_bytes_match(self, bs: list[int] | bytes | memoryview, i: int) -> tuple[str, int]:
+        node = self.__decoding_trie
         offset = 0
-        while len(matches) >= 1:
-            remaining_matches = []
-            for match_bytes, match_char in matches:
-                if match_bytes[offset] == bs[i + offset]:
-                    if len(match_bytes) == offset + 1:
-                        return match_char, i + offset + 1
-                    else:
-                        remaining_matches.append((match_bytes, match_char))
-            matches = remaining_matches
+        while True:
+            child = node.children.get(bs[i + offset])
+            if child is None:
+                # No character starts with these bytes, so fall back to a literal of the first byte
+                return "[" + hex(bs[i]) + "]", i + 1
+            elif child.char is not None:
+                return child.char, i + offset + 1
 
+            node = child
             offset += 1
 
-        if len(matches) == 0 or (len(matches) == 1 and len(matches[0][0]) <= offset):
-            return "[" + hex(bs[i]) + "]", i + 1
-        elif len(matches) == 1:
-            if matches[0][0] != bs[i : i + offset]:
-                raise GetBytesMatchError(matches[0][0], bs[i : i + offset])
 
-            return matches[0][1], i + offset
-        else:
-            raise AssertionError
+class _DecodingTrieNode:
+    """
+    Node in a prefix trie of the byte sequences of a character encoding.
+
+    Lets the decoder find the character that a byte sequence represents with one dictionary lookup
+    per byte, instead of comparing against every entry in the byte to char map.
+    """
+
+    __slots__ = ("char", "children")
+
+    def __init__(self) -> None:
+        self.char: Optional[str] = None
+        self.children: dict[int, _DecodingTrieNode] = {}
+
+    @staticmethod
+    def from_byte_to_char_map(
+        byte_to_char_map: list[tuple[list[int], str]],
+    ) -> _DecodingTrieNode:
+        root = _DecodingTrieNode()
+        for match_bytes, match_char in byte_to_char_map:
+            node = root
+            for byte in match_bytes:
+                node = node.children.setdefault(byte, _DecodingTrieNode())
+
+            # Earlier entries take priority over later entries for the same bytes
+            if node.char is None:
+                node.char = match_char
+
+        return root
 
 
 BYTE_TO_CHAR_MAP_NA_AND_EU = [
@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import os
+import pathlib
+import tempfile
+import threading
+import zlib
+from collections.abc import Iterable
+from typing import Any, Callable, Optional
+
+from dqmj1_util._region import Region
+
+CACHE_FORMAT_VERSION = 1
+"""
+Version of the format of the cached data. Must be incremented whenever the format of any of the
+cached data changes (ex. a field is added to :class:`Encounter`), so that old cache files are not
+used.
+"""
+
+HEADER_CHECKSUM_LOCATION = 0x15E
+
+CACHE_FILE_SUFFIX = ".json.zlib"
+
+
+def rom_fingerprint(
+    header: bytes | memoryview, arm9: bytes, files: Iterable[bytes], region: Region
+) -> str:
+    """
+    Returns a fingerprint identifying the contents of a ROM that data is cached for.
+
+    Based on the ROM header's checksum (CRC), hashes of the arm9 binary and the given data files,
+    the region, and the cache format version.
+    """
+    hasher = hashlib.blake2b(digest_size=16)
+    hasher.update(f"{CACHE_FORMAT_VERSION}:{region.name}:".encode())
+    hasher.update(bytes(header[HEADER_CHECKSUM_LOCATION : HEADER_CHECKSUM_LOCATION + 2]))
+
+    for data in [arm9, *files]:
+        # Include the lengths so that data can't "move" between the binaries and keep the same hash
+        hasher.update(len(data).to_bytes(8, "little"))
+        hasher.update(data)
+
+    return hasher.hexdigest()
+
+
+class DiskCache:
+    """
+    Persistent cache of data read from a ROM, stored in a directory as one zlib compressed JSON
+    file per ROM fingerprint.
+
+    The fingerprint is only computed, and the cache file only read, when the cache is first used.
+    Since the file is named after the fingerprint, modified ROMs automatically get a new cache
+    file rather than reading stale data.
+    """
+
+    def __init__(self, directory: pathlib.Path, fingerprint_function: Callable[[], str]) -> None:
+        self._directory = directory
+        self._fingerprint_function = fingerprint_function
+
+        self._fingerprint: Optional[str] = None
+        self._entries: Optional[dict[str, Any]] = None
+
+        self._lock = threading.Lock()
+
+    @property
+    def directory(self) -> pathlib.Path:
+        return self._directory
+
+    @property
+    def fingerprint(self) -> str:
+        if self._fingerprint is None:
+            self._fingerprint = self._fingerprint_function()
+
+        return self._fingerprint
+
+    @property
+    def filepath(self) -> pathlib.Path:
+        return self._directory / f"{self.fingerprint}{CACHE_FILE_SUFFIX}"
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Returns the JSON data cached under the given key, or None if nothing is cached for it.
+        """
+        with self._lock:
+            return self.__entries().get(key)
+
+    def set(self, key: str, value: Any) -> None:
+        """
+        Caches the given JSON serializable data under the given key, writing the cache file.
+        """
+        with self._lock:
+            entries = self.__entries()
+            entries[key] = value
+
+            self.__write(entries)
+
+    def __entries(self) -> dict[str, Any]:
+        if self._entries is None:
+            self._entries = self.__read()
+
+        return self._entries
+
+    def __read(self) -> dict[str, Any]:
+        try:
+            data = json.loads(zlib.decompress(self.filepath.read_bytes()))
+        except (OSError, zlib.error, ValueError):
+            # Missing or corrupted cache files are treated as empty, and are overwritten on write
+            return {}
+
+        if (
+            not isinstance(data, dict)
+            or data.get("version") != CACHE_FORMAT_VERSION
+            or data.get("fingerprint") != self.fingerprint
+            or not isinstance(data.get("entries"), dict)
+        ):
+            return {}
+
+        entries: dict[str, Any] = data["entries"]
+        return entries
+
+    def __write(self, entries: dict[str, Any]) -> None:
+        data = {
+            "version": CACHE_FORMAT_VERSION,
+            "fingerprint": self.fingerprint,
+            "entries": entries,
+        }
+        compressed = zlib.compress(json.dumps(data, separators=(",", ":")).encode("utf-8"))
+
+        self._directory.mkdir(parents=True, exist_ok=True)
+
+        # Write to a temporary file and then move it into place, so that other processes reading
+        # the cache never see a partially written file
+        file_descriptor, temp_filepath = tempfile.mkstemp(
+            dir=self._directory, suffix=CACHE_FILE_SUFFIX + ".tmp"
+        )
+        try:
+            with os.fdopen(file_descriptor, "wb") as output_stream:
+                output_stream.write(compressed)
+
+            pathlib.Path(temp_filepath).replace(self.filepath)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                pathlib.Path(temp_filepath).unlink()
+            raise
@@ -1,14 +1,26 @@
 from __future__ import annotations
 
 import argparse
+import concurrent.futures
+import contextlib
+import functools
+import itertools
 import os
 import pathlib
 import sys
+import tempfile
+from collections.abc import Iterable, Sequence
 from dataclasses import asdict, dataclass
-from typing import Any
+from typing import Any, NamedTuple, Optional
 
 import jinja2 as j2
 
+from dqmj1_util._guide._manifest import (
+    GuideManifest,
+    ManifestEntry,
+    create_hasher,
+    hash_data,
+)
 from dqmj1_util._rom import Rom
 from dqmj1_util.simple._encounter import Encounter
 from dqmj1_util.simple._skill import Skill
@@ -18,99 +30,369 @@ SUCCESS = 0
 FAILURE = 1
 
 
-def write_guide(guide_data: GuideData, output_directory: os.PathLike[Any] | str) -> None:
+PAGES_PER_TASK = 16
+"""
+Number of pages sent to a worker process at a time when rendering in parallel, to reduce the
+overhead of sending the page data to the workers.
+"""
+
+PAGE_WRITE_BUFFER_SIZE = 64 * 1024
+"""
+Size of the buffer that rendered HTML is written through, so that pages are written to disk in
+chunks of a bounded size as they are rendered.
+"""
+
+NEW_FILE_MODE = 0o666
+"""
+Permissions that newly created files are given before the umask is applied, as by :func:`open`.
+"""
+
+
+class Page(NamedTuple):
+    """
+    Page of the guide to render.
+    """
+
+    path: pathlib.PurePosixPath
+    """
+    Path of the page's file, relative to the guide's output directory.
+    """
+    template: str
+    context: dict[str, Any]
+
+
+_worker_env: Optional[j2.Environment] = None
+
+
+def write_guide(
+    guide_data: GuideData,
+    output_directory: os.PathLike[Any] | str,
+    workers: Optional[int] = None,
+    incremental: bool = False,
+    template_cache_dir: Optional[os.PathLike[Any] | str] = None,
+) -> list[pathlib.PurePosixPath]:
+    """
+    Writes the guide's pages for the given data into the given directory.
+
+    Pages are streamed into their files as they are rendered (with list pages rendered one row at a
+    time), so the rendered HTML of a page is never held in memory as a whole. When writing
+    incrementally, a manifest of the hashes of each page's inputs and output is kept in the output
+    directory (see :class:`GuideManifest`).
+
+    Returns the paths (relative to the output directory) of the pages that were written.
+
+    :param guide_data: Data to write the guide for.
+    :param output_directory: Directory to write the guide into. Created if it does not exist.
+    :param workers: If more than 1, renders and writes the pages in parallel using this many worker
+        processes. The output is the same as when rendering serially.
+    :param incremental: If True, uses the manifest from the last time the guide was written into
+        the output directory to skip rendering pages whose templates and data are unchanged, and
+        writing pages whose rendered HTML is unchanged. Pages that are no longer part of the guide
+        are deleted. If False, every page is written and any existing manifest is deleted, as it
+        would no longer match the pages.
+    :param template_cache_dir: Directory to store compiled templates in, so that they are not
+        compiled again by later processes. See :func:`create_environment`.
+    """
     output_directory = pathlib.Path(output_directory)
     output_directory.mkdir(exist_ok=True, parents=True)
 
-    skill_sets_directory = output_directory / "skill_sets"
-    skill_sets_directory.mkdir(exist_ok=True)
+    pages = list_pages(guide_data)
 
-    skills_directory = output_directory / "skills"
-    skills_directory.mkdir(exist_ok=True)
+    for directory in sorted({page.path.parent for page in pages}):
+        (output_directory / directory).mkdir(exist_ok=True, parents=True)
 
-    skills = guide_data.skills
-    skill_sets = guide_data.skill_sets
-    encounters = guide_data.encounters
-
-    env = j2.Environment(
-        loader=j2.PackageLoader("dqmj1_util._guide"),
-        autoescape=j2.select_autoescape(),
+    template_cache_path = (
+        pathlib.Path(template_cache_dir) if template_cache_dir is not None else None
     )
-    index_template = env.get_template("index.html")
-    skills_template = env.get_template("skills.html")
-    skill_sets_template = env.get_template("skill_sets.html")
-    encounters_template = env.get_template("encounters.html")
-
-    skill_template = env.get_template("skill.html")
-    skill_set_template = env.get_template("skill_set.html")
-
-    processed_skills = process_skills(skills, skill_sets)
-    processed_encounters = process_encounters(encounters)
-    processed_skill_sets = process_skill_sets(skill_sets)
-
-    index_filepath = output_directory / "index.html"
-    with index_filepath.open("w", encoding="utf8") as output_stream:
-        output_stream.write(
-            index_template.render(
-                title="DQMJ1 Guide",
-                base_path="",
+    env = get_environment(template_cache_path)
+
+    manifest = GuideManifest()
+    input_hashes: dict[str, str] = {}
+    if incremental:
+        previous_manifest = GuideManifest.read(output_directory)
+        templates_hash = hash_templates(env)
+
+        pages_to_render: list[Page] = []
+        for page in pages:
+            key = page.path.as_posix()
+            input_hash = hash_data([templates_hash, page.template, page.context])
+
+            previous_entry = previous_manifest.entries.get(key)
+            if (
+                previous_entry is not None
+                and previous_entry.input_hash == input_hash
+                and (output_directory / page.path).is_file()
+            ):
+                manifest.entries[key] = previous_entry
+            else:
+                pages_to_render.append(page)
+                input_hashes[key] = input_hash
+    else:
+        # Inputs are only hashed when writing incrementally, so the manifest can't be kept up to
+        # date
+        previous_manifest = GuideManifest()
+        GuideManifest.delete(output_directory)
+
+        pages_to_render = pages
+
+    previous_output_hashes = [
+        previous_entry.output_hash if previous_entry is not None else None
+        for previous_entry in (
+            previous_manifest.entries.get(page.path.as_posix()) for page in pages_to_render
+        )
+    ]
+
+    with contextlib.ExitStack() as stack:
+        if workers is not None and workers > 1 and len(pages_to_render) > 0:
+            # Each worker writes the pages it renders, so rendered pages are never sent between
+            # processes
+            executor = stack.enter_context(
+                concurrent.futures.ProcessPoolExecutor(
+                    max_workers=workers,
+                    initializer=_init_worker,
+                    initargs=(template_cache_path,),
+                )
+            )
+            results: Iterable[tuple[str, bool]] = executor.map(
+                _write_page_in_worker,
+                pages_to_render,
+                itertools.repeat(output_directory),
+                previous_output_hashes,
+                chunksize=PAGES_PER_TASK,
             )
+        else:
+            results = (
+                _write_page(env, page, output_directory, previous_output_hash)
+                for page, previous_output_hash in zip(pages_to_render, previous_output_hashes)
+            )
+
+        written_paths: list[pathlib.PurePosixPath] = []
+        for page, (output_hash, is_written) in zip(pages_to_render, results):
+            if incremental:
+                key = page.path.as_posix()
+                manifest.entries[key] = ManifestEntry(
+                    input_hash=input_hashes[key], output_hash=output_hash
+                )
+
+            if is_written:
+                written_paths.append(page.path)
+
+    if incremental:
+        resolved_output_directory = output_directory.resolve()
+        for key in previous_manifest.entries.keys() - manifest.entries.keys():
+            # The manifest is read from disk, so never delete anything outside of the output
+            # directory
+            stale_filepath = (output_directory / key).resolve()
+            if stale_filepath.is_relative_to(resolved_output_directory):
+                stale_filepath.unlink(missing_ok=True)
+
+        manifest.write(output_directory)
+
+    return written_paths
+
+
+def list_pages(guide_data: GuideData) -> list[Page]:
+    """
+    Returns all of the pages of the guide for the given data, in the order they are written.
+    """
+    processed_skills = process_skills(guide_data.skills, guide_data.skill_sets)
+    processed_encounters = process_encounters(guide_data.encounters)
+    processed_skill_sets = process_skill_sets(guide_data.skill_sets)
+    processed_species = process_species(
+        processed_encounters, processed_skill_sets, guide_data.species_names
+    )
+
+    encounters_by_skill = index_encounters_by_skill(processed_encounters)
+
+    pages = [
+        Page(
+            pathlib.PurePosixPath("index.html"),
+            "index.html",
+            {"title": "DQMJ1 Guide", "base_path": ""},
+        ),
+        Page(
+            pathlib.PurePosixPath("skills.html"),
+            "skills.html",
+            {"title": "DQMJ1 - Skills", "skills": processed_skills, "base_path": ""},
+        ),
+        Page(
+            pathlib.PurePosixPath("skill_sets.html"),
+            "skill_sets.html",
+            {"title": "DQMJ1 - Skill Sets", "skill_sets": processed_skill_sets, "base_path": ""},
+        ),
+        Page(
+            pathlib.PurePosixPath("encounters.html"),
+            "encounters.html",
+            {"title": "DQMJ1 - Encounters", "encounters": processed_encounters, "base_path": ""},
+        ),
+    ]
+
+    pages.extend(
+        Page(
+            pathlib.PurePosixPath("skills") / f"{skill['id']}.html",
+            "skill.html",
+            {
+                "title": f"DQMJ1 - {skill['name']}",
+                "skill": skill,
+                "encounters": encounters_by_skill.get(skill["id"], []),
+                "base_path": "../",
+            },
         )
+        for skill in processed_skills
+    )
 
-    skills_filepath = output_directory / "skills.html"
-    with skills_filepath.open("w", encoding="utf8") as output_stream:
-        output_stream.write(
-            skills_template.render(
-                title="DQMJ1 - Skills",
-                skills=processed_skills,
-                base_path="",
-            )
+    pages.extend(
+        Page(
+            pathlib.PurePosixPath("skill_sets") / f"{skill_set['id']}.html",
+            "skill_set.html",
+            {"title": f"DQMJ1 - {skill_set['name']}", "skill_set": skill_set, "base_path": "../"},
         )
+        for skill_set in processed_skill_sets
+    )
 
-    skill_sets_filepath = output_directory / "skill_sets.html"
-    with skill_sets_filepath.open("w", encoding="utf8") as output_stream:
-        output_stream.write(
-            skill_sets_template.render(
-                title="DQMJ1 - Skill Sets",
-                skill_sets=processed_skill_sets,
-                base_path="",
-            )
+    pages.extend(
+        Page(
+            pathlib.PurePosixPath("encounters") / f"{encounter['id']}.html",
+            "encounter.html",
+            {
+                "title": f"DQMJ1 - {encounter['species']}",
+                "encounter": encounter,
+                "base_path": "../",
+            },
         )
+        for encounter in processed_encounters
+    )
 
-    encounters_filepath = output_directory / "encounters.html"
-    with encounters_filepath.open("w", encoding="utf8") as output_stream:
-        output_stream.write(
-            encounters_template.render(
-                title="DQMJ1 - Encounters",
-                encounters=processed_encounters,
-                base_path="",
-            )
+    pages.extend(
+        Page(
+            pathlib.PurePosixPath("species") / f"{species['id']}.html",
+            "species.html",
+            {"title": f"DQMJ1 - {species['name']}", "species": species, "base_path": "../"},
         )
+        for species in processed_species
+    )
 
-    for skill in processed_skills:
-        skill_filepath = skills_directory / f"{skill['id']}.html"
-        with skill_filepath.open("w", encoding="utf8") as output_stream:
-            output_stream.write(
-                skill_template.render(
-                    title=f"DQMJ1 - {skill['name']}",
-                    skill=skill,
-                    base_path="../",
-                )
-            )
+    return pages
 
-    for skill_set in processed_skill_sets:
-        skill_set_filepath = skill_sets_directory / f"{skill_set['id']}.html"
-        with skill_set_filepath.open("w", encoding="utf8") as output_stream:
-            output_stream.write(
-                skill_set_template.render(
-                    title=f"DQMJ1 - {skill_set['name']}",
-                    skill_set=skill_set,
-                    base_path="../",
-                )
-            )
 
+@functools.cache
+def get_environment(template_cache_dir: Optional[pathlib.Path] = None) -> j2.Environment:
+    """
+    Returns the Jinja environment that the guide's templates are rendered with, creating it the
+    first time it is needed.
+
+    The environment is shared by all of the guides written in the process, so each template is
+    only compiled once per process (or not at all, if a template cache directory is given and its
+    compiled code is cached there).
+
+    :param template_cache_dir: See :func:`create_environment`.
+    """
+    return create_environment(template_cache_dir)
+
+
+def create_environment(template_cache_dir: Optional[pathlib.Path] = None) -> j2.Environment:
+    """
+    Creates a Jinja environment for rendering the guide's templates.
+
+    If a template cache directory is given, compiled templates are stored in a bytecode cache in
+    it, so that later processes can skip compiling them. Cached code is keyed by a checksum of the
+    template's source, so it is not used if the template changes.
+
+    :param template_cache_dir: Directory to store the compiled templates in. If None, compiled
+        templates are not cached on disk.
+    """
+    bytecode_cache = None
+    if template_cache_dir is not None:
+        template_cache_dir.mkdir(exist_ok=True, parents=True)
+        bytecode_cache = j2.FileSystemBytecodeCache(str(template_cache_dir))
+
+    return j2.Environment(
+        loader=j2.PackageLoader("dqmj1_util._guide"),
+        autoescape=j2.select_autoescape(),
+        bytecode_cache=bytecode_cache,
+    )
 
-def process_encounters(encounters: list[Encounter]) -> list[dict[str, Any]]:
+
+def hash_templates(env: j2.Environment) -> str:
+    """
+    Returns a hash of the sources of all of the templates in the given environment, so that
+    changes to any template (including base templates that pages extend) change the hash.
+    """
+    if env.loader is None:
+        raise ValueError
+
+    return hash_data(
+        {name: env.loader.get_source(env, name)[0] for name in sorted(env.list_templates())}
+    )
+
+
+def _write_page(
+    env: j2.Environment,
+    page: Page,
+    output_directory: pathlib.Path,
+    previous_output_hash: Optional[str],
+) -> tuple[str, bool]:
+    """
+    Renders the given page, streaming the rendered HTML into the page's file as it is generated
+    rather than rendering the whole page into a single string first.
+
+    The page is rendered into a temporary file, which then replaces the page's file. If the output
+    has the given previous hash and the page's file exists, the page's file is left untouched.
+
+    Returns the hash of the page's output, and whether the page's file was written.
+    """
+    filepath = output_directory / page.path
+    hasher = create_hasher()
+
+    file_descriptor, temp_filepath = tempfile.mkstemp(dir=filepath.parent, suffix=".html.tmp")
+    try:
+        with os.fdopen(
+            file_descriptor, "w", encoding="utf8", buffering=PAGE_WRITE_BUFFER_SIZE
+        ) as output_stream:
+            for chunk in env.get_template(page.template).generate(**page.context):
+                hasher.update(chunk.encode("utf-8"))
+                output_stream.write(chunk)
+
+        output_hash = hasher.hexdigest()
+        if output_hash == previous_output_hash and filepath.is_file():
+            pathlib.Path(temp_filepath).unlink()
+            return output_hash, False
+
+        # Temporary files are only readable by their owner, so give the page the permissions a
+        # newly created file would have
+        pathlib.Path(temp_filepath).chmod(NEW_FILE_MODE & ~_get_umask())
+        pathlib.Path(temp_filepath).replace(filepath)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            pathlib.Path(temp_filepath).unlink()
+        raise
+
+    return output_hash, True
+
+
+@functools.cache
+def _get_umask() -> int:
+    # The umask can only be read by setting it, so only do so once
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+
+def _init_worker(template_cache_dir: Optional[pathlib.Path]) -> None:
+    global _worker_env
+    _worker_env = get_environment(template_cache_dir)
+
+
+def _write_page_in_worker(
+    page: Page, output_directory: pathlib.Path, previous_output_hash: Optional[str]
+) -> tuple[str, bool]:
+    if _worker_env is None:
+        raise RuntimeError
+
+    return _write_page(_worker_env, page, output_directory, previous_output_hash)
+
+
+def process_encounters(encounters: Sequence[Encounter]) -> list[dict[str, Any]]:
     processed = []
     for i, encounter in enumerate(encounters):
         after = asdict(encounter)
@@ -143,7 +425,7 @@ def process_encounters(encounters: list[Encounter]) -> list[dict[str, Any]]:
     return processed[1:858]
 
 
-def process_skills(skills: list[Skill], skill_sets: list[SkillSet]) -> list[dict[str, Any]]:
+def process_skills(skills: Sequence[Skill], skill_sets: Sequence[SkillSet]) -> list[dict[str, Any]]:
     processed: list[dict[str, Any]] = []
     for i, skill in enumerate(skills):
         after = asdict(skill)
@@ -170,7 +452,7 @@ def process_skills(skills: list[Skill], skill_sets: list[SkillSet]) -> list[dict
     return processed
 
 
-def process_skill_sets(skill_sets: list[SkillSet]) -> list[dict[str, Any]]:
+def process_skill_sets(skill_sets: Sequence[SkillSet]) -> list[dict[str, Any]]:
     processed = []
     for i, skill_set in enumerate(skill_sets):
         after = asdict(skill_set)
@@ -182,17 +464,102 @@ def process_skill_sets(skill_sets: list[SkillSet]) -> list[dict[str, Any]]:
     return processed[1:-1]
 
 
+def process_species(
+    processed_encounters: Sequence[dict[str, Any]],
+    processed_skill_sets: Sequence[dict[str, Any]],
+    species_names: Sequence[str] = (),
+) -> list[dict[str, Any]]:
+    """
+    Returns the species that have encounters or learn skill sets, each with summaries of their
+    encounters and the skill sets they learn, sorted by species id.
+
+    Built in a single pass over the encounters and skill sets, rather than searching them for each
+    species.
+
+    Species are named using the given species names (by species id), falling back to the names of
+    their encounters for species not in the given names.
+    """
+    species_by_id: dict[int, dict[str, Any]] = {}
+
+    def get_species(species_id: int) -> dict[str, Any]:
+        if species_id not in species_by_id:
+            species_by_id[species_id] = {
+                "id": species_id,
+                "name": species_names[species_id]
+                if species_id < len(species_names)
+                else f"Species {species_id}",
+                "encounters": [],
+                "skill_sets": [],
+            }
+
+        return species_by_id[species_id]
+
+    for encounter in processed_encounters:
+        species = get_species(encounter["species_id"])
+        if encounter["species_id"] >= len(species_names):
+            species["name"] = encounter["species"]
+
+        species["encounters"].append(summarize_encounter(encounter))
+
+    # The ids of the species that learn each skill set, with unused slots set to 0
+    for skill_set in processed_skill_sets:
+        for species_id in skill_set["species_learnt_by"]:
+            if species_id != 0:
+                get_species(species_id)["skill_sets"].append(
+                    {"id": skill_set["id"], "name": skill_set["name"]}
+                )
+
+    return [species_by_id[species_id] for species_id in sorted(species_by_id)]
+
+
+def index_encounters_by_skill(
+    processed_encounters: Sequence[dict[str, Any]],
+) -> dict[int, list[dict[str, Any]]]:
+    """
+    Returns summaries of the encounters that have each skill, by skill id.
+    """
+    encounters_by_skill: dict[int, list[dict[str, Any]]] = {}
+    for encounter in processed_encounters:
+        summary = summarize_encounter(encounter)
+        for skill in encounter["skills"]:
+            encounters_by_skill.setdefault(skill["id"], []).append(summary)
+
+    return encounters_by_skill
+
+
+def summarize_encounter(processed_encounter: dict[str, Any]) -> dict[str, Any]:
+    """
+    Returns the parts of the given encounter that are shown on other pages that link to it.
+
+    Only these parts are included in the data of the other pages, so that changes to the rest of
+    the encounter do not cause those pages to be rendered again when writing incrementally.
+    """
+    return {
+        "id": processed_encounter["id"],
+        "species": processed_encounter["species"],
+        "level": processed_encounter["level"],
+    }
+
+
 @dataclass
 class GuideData:
-    skills: list[Skill]
-    skill_sets: list[SkillSet]
-    encounters: list[Encounter]
+    skills: Sequence[Skill]
+    skill_sets: Sequence[SkillSet]
+    encounters: Sequence[Encounter]
+    species_names: Sequence[str] = ()
+    """
+    Names of the species, by species id (ex. :attr:`StringTables.species_names`). Used to name the
+    species pages of species that have no encounters.
+    """
 
 
 @dataclass(frozen=True)
 class Args:
     rom_filepath: pathlib.Path
     output_directory: pathlib.Path
+    workers: Optional[int]
+    incremental: bool
+    template_cache_dir: Optional[pathlib.Path]
 
 
 def main(argv: list[str]) -> int:
@@ -200,6 +567,23 @@ def main(argv: list[str]) -> int:
 
     parser.add_argument("--rom_filepath", required=True, type=pathlib.Path)
     parser.add_argument("--output_directory", required=True, type=pathlib.Path)
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Number of worker processes to render the pages with. Defaults to rendering serially",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Only render and write the pages that changed since the guide was last written",
+    )
+    parser.add_argument(
+        "--template_cache_dir",
+        type=pathlib.Path,
+        default=None,
+        help="Directory to store compiled templates in. Defaults to not storing them",
+    )
 
     args = Args(**vars(parser.parse_args(argv)))
 
@@ -209,9 +593,16 @@ def main(argv: list[str]) -> int:
         skills=rom.skills,
         skill_sets=rom.skill_sets,
         encounters=rom.encounters,
+        species_names=rom.view_string_tables().species_names,
     )
 
-    write_guide(guide_data, args.output_directory)
+    write_guide(
+        guide_data,
+        args.output_directory,
+        workers=args.workers,
+        incremental=args.incremental,
+        template_cache_dir=args.template_cache_dir,
+    )
 
     return SUCCESS
 
@@ -220,4 +611,4 @@ def main_without_args() -> int:
     return main(sys.argv[1:])
 
 
-__all__ = ["GuideData", "main_without_args", "write_guide"]
+__all__ = ["GuideData", "GuideManifest", "main_without_args", "write_guide"]
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import os
+import pathlib
+import tempfile
+from dataclasses import dataclass, field
+from typing import Any
+
+MANIFEST_FORMAT_VERSION = 1
+"""
+Version of the format of the manifest, and of how page hashes are computed. Must be incremented
+whenever either changes, so that pages are not skipped based on hashes computed differently.
+"""
+
+MANIFEST_FILENAME = ".guide_manifest.json"
+
+HASH_ENCODER = json.JSONEncoder(sort_keys=True, separators=(",", ":"))
+
+
+def hash_data(data: Any) -> str:
+    """
+    Returns a hash of the given JSON serializable data, independent of the order of dict keys.
+
+    The data is encoded and hashed piece by piece, so its JSON is never held in memory as a whole.
+    """
+    hasher = create_hasher()
+    for chunk in HASH_ENCODER.iterencode(data):
+        hasher.update(chunk.encode("utf-8"))
+
+    return hasher.hexdigest()
+
+
+def create_hasher() -> hashlib.blake2b:
+    """
+    Creates a hasher for incrementally hashing data (ex. a page's rendered HTML).
+    """
+    return hashlib.blake2b(digest_size=16)
+
+
+@dataclass(frozen=True)
+class ManifestEntry:
+    input_hash: str
+    """
+    Hash of everything the page was rendered from (the templates and the page's data).
+    """
+    output_hash: str
+    """
+    Hash of the page's rendered HTML.
+    """
+
+
+@dataclass
+class GuideManifest:
+    """
+    Record of the pages written into a guide's output directory and the hashes of their inputs and
+    outputs, stored as a JSON file in the directory.
+
+    Used to skip rendering pages whose inputs have not changed, and writing pages whose output has
+    not changed, when the guide is written again.
+    """
+
+    entries: dict[str, ManifestEntry] = field(default_factory=dict)
+    """
+    Entries for each page, by the page's path relative to the output directory.
+    """
+
+    @staticmethod
+    def read(directory: pathlib.Path) -> GuideManifest:
+        """
+        Reads the manifest from the given output directory. A missing, corrupted, or outdated
+        manifest is read as empty, so that all of the pages are written.
+        """
+        try:
+            data = json.loads((directory / MANIFEST_FILENAME).read_text(encoding="utf8"))
+        except (OSError, ValueError):
+            return GuideManifest()
+
+        if (
+            not isinstance(data, dict)
+            or data.get("version") != MANIFEST_FORMAT_VERSION
+            or not isinstance(data.get("pages"), dict)
+        ):
+            return GuideManifest()
+
+        try:
+            entries = {
+                path: ManifestEntry(
+                    input_hash=entry["input_hash"], output_hash=entry["output_hash"]
+                )
+                for path, entry in data["pages"].items()
+            }
+        except (KeyError, TypeError):
+            return GuideManifest()
+
+        return GuideManifest(entries)
+
+    @staticmethod
+    def delete(directory: pathlib.Path) -> None:
+        """
+        Deletes the manifest from the given output directory, if it has one.
+        """
+        (directory / MANIFEST_FILENAME).unlink(missing_ok=True)
+
+    def write(self, directory: pathlib.Path) -> None:
+        """
+        Writes the manifest into the given output directory.
+        """
+        data = {
+            "version": MANIFEST_FORMAT_VERSION,
+            "pages": {
+                path: {"input_hash": entry.input_hash, "output_hash": entry.output_hash}
+                for path, entry in sorted(self.entries.items())
+            },
+        }
+
+        # Write to a temporary file and then move it into place, so that an interrupted write never
+        # leaves a partially written manifest
+        file_descriptor, temp_filepath = tempfile.mkstemp(
+            dir=directory, suffix=MANIFEST_FILENAME + ".tmp"
+        )
+        try:
+            with os.fdopen(file_descriptor, "w", encoding="utf8") as output_stream:
+                json.dump(data, output_stream, indent=1)
+
+            pathlib.Path(temp_filepath).replace(directory / MANIFEST_FILENAME)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                pathlib.Path(temp_filepath).unlink()
+            raise
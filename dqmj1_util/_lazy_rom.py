@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import mmap
+import os
+import pathlib
+import struct
+from typing import Any, Optional, Self, cast
+
+import ndspy.fnt
+import ndspy.rom
+
+HEADER_SIZE = 0x200
+
+ARM9_OFFSET_LOCATION = 0x20
+ARM9_LENGTH_LOCATION = 0x2C
+FNT_FAT_LOCATION = 0x40
+
+
+class RomFileTooSmallError(ValueError):
+    def __init__(self, size: int):
+        super().__init__(
+            f"ROM file is {size} bytes, which is too small to contain a {HEADER_SIZE} byte header"
+        )
+
+
+class RomFileNotFoundError(ValueError):
+    def __init__(self, filename: str):
+        super().__init__(f'Cannot find file ID of "{filename}"')
+
+
+class LazyRomFileClosedError(ValueError):
+    def __init__(self) -> None:
+        super().__init__("Tried to read from a LazyRomFile that has already been closed")
+
+
+class LazyRomFile:
+    """
+    Read-only view of a ROM file that memory maps the file and only parses the header, file
+    allocation table (FAT), and filename table (FNT) up front.
+
+    The arm9 binary and NitroFS files are only copied out of the file when they are first
+    requested, which avoids reading and splitting the whole ROM like
+    :meth:`ndspy.rom.NintendoDSRom.fromFile` does.
+    """
+
+    def __init__(self, filepath: os.PathLike[Any] | str) -> None:
+        with pathlib.Path(filepath).open("rb") as input_stream:
+            # The memory map keeps its own handle to the file, so the file can be closed right away
+            self._mmap: Optional[mmap.mmap] = mmap.mmap(
+                input_stream.fileno(), 0, access=mmap.ACCESS_READ
+            )
+
+        data = self._mmap
+        if len(data) < HEADER_SIZE:
+            size = len(data)
+            self.close()
+            raise RomFileTooSmallError(size)
+
+        self._header = data[0:HEADER_SIZE]
+
+        (self._arm9_offset,) = struct.unpack_from("<I", data, ARM9_OFFSET_LOCATION)
+        (self._arm9_length,) = struct.unpack_from("<I", data, ARM9_LENGTH_LOCATION)
+        fnt_offset, fnt_length, fat_offset, fat_length = struct.unpack_from(
+            "<4I", data, FNT_FAT_LOCATION
+        )
+
+        self._filenames = ndspy.fnt.load(data[fnt_offset : fnt_offset + fnt_length])
+
+        fat = struct.unpack_from(f"<{fat_length // 4}I", data, fat_offset)
+        self._file_ranges = list(zip(fat[0::2], fat[1::2]))
+
+        self._arm9: Optional[bytes] = None
+        self._files: dict[int, bytes] = {}
+
+    @property
+    def header(self) -> bytes:
+        """
+        The ROM header.
+        """
+        return self._header
+
+    @property
+    def filenames(self) -> ndspy.fnt.Folder:
+        """
+        Root folder of the ROM's filename table.
+        """
+        return self._filenames
+
+    @property
+    def closed(self) -> bool:
+        return self._mmap is None
+
+    @property
+    def arm9(self) -> bytes:
+        """
+        The arm9 binary, copied out of the ROM file on first access.
+        """
+        if self._arm9 is None:
+            data = self.__data()
+            self._arm9 = data[self._arm9_offset : self._arm9_offset + self._arm9_length]
+
+        return self._arm9
+
+    def get_file_range_by_name(self, filename: str) -> tuple[int, int]:
+        """
+        Returns the start and end offsets in the ROM file of the NitroFS file with the given path.
+        """
+        file_id = self._filenames.idOf(filename)
+        if file_id is None:
+            raise RomFileNotFoundError(filename)
+
+        return self._file_ranges[file_id]
+
+    def get_file_by_id(self, file_id: int) -> bytes:
+        """
+        Returns the data of the NitroFS file with the given id, copying it out of the ROM file on
+        first access.
+        """
+        data = self._files.get(file_id)
+        if data is None:
+            start, end = self._file_ranges[file_id]
+            data = self.__data()[start:end]
+            self._files[file_id] = data
+
+        return data
+
+    def get_file_by_name(self, filename: str) -> bytes:
+        """
+        Returns the data of the NitroFS file with the given path, copying it out of the ROM file on
+        first access.
+
+        Raises a :class:`RomFileNotFoundError` (a :class:`ValueError`, like
+        :meth:`ndspy.rom.NintendoDSRom.getFileByName` raises) if there is no such file.
+        """
+        file_id = self._filenames.idOf(filename)
+        if file_id is None:
+            raise RomFileNotFoundError(filename)
+
+        return self.get_file_by_id(file_id)
+
+    def to_ndspy_rom(self) -> ndspy.rom.NintendoDSRom:
+        """
+        Reads the whole ROM file into a :class:`ndspy.rom.NintendoDSRom`.
+
+        The returned ROM holds its own copy of the data, so this file can be closed afterwards.
+        """
+        # NintendoDSRom copies the data into a bytearray, so the memory map can be passed directly
+        return ndspy.rom.NintendoDSRom(cast("bytes", self.__data()))
+
+    def close(self) -> None:
+        """
+        Releases the memory map of the ROM file. Data that was already read stays available.
+        """
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def __data(self) -> mmap.mmap:
+        if self._mmap is None:
+            raise LazyRomFileClosedError
+
+        return self._mmap
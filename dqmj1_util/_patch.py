@@ -0,0 +1,383 @@
+from __future__ import annotations
+
+import enum
+import zlib
+from collections.abc import Sequence
+from typing import IO
+
+import numpy as np
+
+Buffer = bytes | bytearray | memoryview
+
+IPS_MAGIC = b"PATCH"
+IPS_EOF = b"EOF"
+IPS_EOF_OFFSET = int.from_bytes(IPS_EOF, "big")
+IPS_MAX_OFFSET = 0xFFFFFF
+IPS_MAX_RECORD_SIZE = 0xFFFF
+
+BPS_MAGIC = b"BPS1"
+BPS_SOURCE_READ = 0
+BPS_TARGET_READ = 1
+BPS_SOURCE_COPY = 2
+BPS_TARGET_COPY = 3
+
+MERGE_GAP = 4
+"""
+Changed byte ranges separated by at most this many unchanged bytes are merged into a single change,
+since that is smaller than the overhead of starting a new IPS record or BPS action.
+"""
+
+
+class PatchFormat(enum.Enum):
+    """
+    Format of a patch file describing the changes made to a ROM.
+    """
+
+    IPS = "ips"
+    """
+    International Patching System. Widely supported, but can only patch the first 16 MiB of a file.
+    """
+
+    BPS = "bps"
+    """
+    Beat Patching System. Supports files of any size and includes checksums of the original and
+    patched files.
+    """
+
+
+class IpsOffsetTooLargeError(ValueError):
+    def __init__(self, offset: int):
+        super().__init__(
+            f"IPS patches can only modify the first {IPS_MAX_OFFSET + 1} bytes of a file, but a "
+            f"change starts at offset {offset:#x}. Use a BPS patch instead."
+        )
+
+
+class UnknownPatchFormatError(ValueError):
+    def __init__(self, magic: bytes):
+        super().__init__(f"Patch file starts with {magic!r}, which is not a known patch format")
+
+
+class InvalidPatchError(ValueError):
+    def __init__(self, patch_format: PatchFormat, reason: str):
+        super().__init__(f"Invalid {patch_format.name} patch: {reason}")
+
+
+class PatchChecksumError(ValueError):
+    def __init__(self, name: str, expected: int, actual: int):
+        super().__init__(
+            f"BPS patch {name} checksum mismatch, expected {expected:#010x} but got {actual:#010x}"
+        )
+
+
+def diff(source: Buffer, target: Buffer, offset: int = 0) -> list[tuple[int, bytes]]:
+    """
+    Returns the byte ranges where the target differs from the source, as (offset, target data)
+    pairs sorted by offset. Data past the end of the source is always included.
+
+    The comparison is vectorized with NumPy, so large files can be compared quickly.
+
+    :param source: Original data.
+    :param target: Modified data.
+    :param offset: Offset to add to the offsets of the changes (ex. the offset of the compared data
+        within a larger file).
+    """
+    common_length = min(len(source), len(target))
+    is_changed = np.frombuffer(source, dtype=np.uint8, count=common_length) != np.frombuffer(
+        target, dtype=np.uint8, count=common_length
+    )
+
+    changed_ranges: list[tuple[int, int]] = []
+    if common_length > 0:
+        edges = np.flatnonzero(np.diff(is_changed, prepend=False, append=False))
+        for start, end in zip(edges[0::2].tolist(), edges[1::2].tolist()):
+            if len(changed_ranges) > 0 and start - changed_ranges[-1][1] <= MERGE_GAP:
+                changed_ranges[-1] = (changed_ranges[-1][0], end)
+            else:
+                changed_ranges.append((start, end))
+
+    if len(target) > common_length:
+        if len(changed_ranges) > 0 and common_length - changed_ranges[-1][1] <= MERGE_GAP:
+            changed_ranges[-1] = (changed_ranges[-1][0], len(target))
+        else:
+            changed_ranges.append((common_length, len(target)))
+
+    return [(offset + start, bytes(target[start:end])) for start, end in changed_ranges]
+
+
+def merge_changes(source: Buffer, changes: Sequence[tuple[int, bytes]]) -> list[tuple[int, bytes]]:
+    """
+    Merges the given changes (sorted by offset, and not overlapping) where they are adjacent or
+    separated by at most :data:`MERGE_GAP` unchanged bytes, as :func:`diff` does for the changes it
+    finds. Useful for combining the changes from diffing separate ranges of the same data.
+    """
+    merged: list[tuple[int, bytes]] = []
+    for offset, data in changes:
+        if len(merged) > 0:
+            previous_offset, previous_data = merged[-1]
+            previous_end = previous_offset + len(previous_data)
+            if offset - previous_end <= MERGE_GAP:
+                merged[-1] = (
+                    previous_offset,
+                    previous_data + bytes(source[previous_end:offset]) + data,
+                )
+                continue
+
+        merged.append((offset, data))
+
+    return merged
+
+
+def write_ips(
+    source: Buffer,
+    changes: Sequence[tuple[int, bytes]],
+    target_size: int,
+    output_stream: IO[bytes],
+) -> None:
+    """
+    Writes an IPS patch with the given changes (as returned by :func:`diff`).
+
+    If the target is smaller than the source, the patch ends with the commonly supported truncation
+    extension.
+    """
+    output_stream.write(IPS_MAGIC)
+
+    previous_end = 0
+    previous_data = b""
+    for offset, data in changes:
+        start = 0
+        while start < len(data):
+            record_offset = offset + start
+
+            prefix = b""
+            if record_offset == IPS_EOF_OFFSET:
+                # A record offset that reads as "EOF" would end the patch, so start the record a
+                # byte earlier. That byte is either the end of the previous record (of this change
+                # or of a previous adjacent change), or unchanged from the source.
+                if start > 0:
+                    prefix = data[start - 1 : start]
+                elif previous_end == record_offset and len(previous_data) > 0:
+                    prefix = previous_data[-1:]
+                else:
+                    prefix = bytes(source[record_offset - 1 : record_offset])
+                record_offset -= 1
+
+            if record_offset > IPS_MAX_OFFSET:
+                raise IpsOffsetTooLargeError(record_offset)
+
+            record_size = min(len(data) - start, IPS_MAX_RECORD_SIZE - len(prefix))
+
+            output_stream.write(record_offset.to_bytes(3, "big"))
+            output_stream.write((len(prefix) + record_size).to_bytes(2, "big"))
+            output_stream.write(prefix)
+            output_stream.write(data[start : start + record_size])
+
+            start += record_size
+
+        previous_end = offset + len(data)
+        previous_data = data
+
+    output_stream.write(IPS_EOF)
+    if target_size < len(source):
+        output_stream.write(target_size.to_bytes(3, "big"))
+
+
+def apply_ips(source: Buffer, patch: Buffer) -> bytearray:
+    """
+    Returns the result of applying the given IPS patch to the given source data.
+    """
+    if bytes(patch[0 : len(IPS_MAGIC)]) != IPS_MAGIC:
+        raise InvalidPatchError(PatchFormat.IPS, "missing header")
+
+    target = bytearray(source)
+
+    position = len(IPS_MAGIC)
+    while True:
+        if position + 3 > len(patch):
+            raise InvalidPatchError(PatchFormat.IPS, "missing EOF marker")
+        if bytes(patch[position : position + 3]) == IPS_EOF:
+            position += 3
+            break
+
+        offset = int.from_bytes(patch[position : position + 3], "big")
+        size = int.from_bytes(patch[position + 3 : position + 5], "big")
+        position += 5
+
+        if size == 0:
+            # Run length encoded record
+            run_size = int.from_bytes(patch[position : position + 2], "big")
+            data = bytes(patch[position + 2 : position + 3]) * run_size
+            position += 3
+        else:
+            data = bytes(patch[position : position + size])
+            position += size
+
+        if offset + len(data) > len(target):
+            target.extend(b"\x00" * (offset + len(data) - len(target)))
+        target[offset : offset + len(data)] = data
+
+    if position + 3 <= len(patch):
+        truncated_size = int.from_bytes(patch[position : position + 3], "big")
+        del target[truncated_size:]
+
+    return target
+
+
+def write_bps(
+    source: Buffer,
+    changes: Sequence[tuple[int, bytes]],
+    target_size: int,
+    output_stream: IO[bytes],
+) -> None:
+    """
+    Writes a BPS patch with the given changes (as returned by :func:`diff`).
+
+    Unchanged data is read from the source, so the full target data is never needed.
+    """
+    patch = bytearray(BPS_MAGIC)
+    patch += encode_bps_number(len(source))
+    patch += encode_bps_number(target_size)
+    patch += encode_bps_number(0)  # No metadata
+
+    target_crc = 0
+    output_offset = 0
+    for offset, data in changes:
+        if offset > output_offset:
+            patch += encode_bps_number(((offset - output_offset - 1) << 2) | BPS_SOURCE_READ)
+            target_crc = zlib.crc32(source[output_offset:offset], target_crc)
+
+        patch += encode_bps_number(((len(data) - 1) << 2) | BPS_TARGET_READ)
+        patch += data
+        target_crc = zlib.crc32(data, target_crc)
+
+        output_offset = offset + len(data)
+
+    if target_size > output_offset:
+        patch += encode_bps_number(((target_size - output_offset - 1) << 2) | BPS_SOURCE_READ)
+        target_crc = zlib.crc32(source[output_offset:target_size], target_crc)
+
+    patch += zlib.crc32(source).to_bytes(4, "little")
+    patch += target_crc.to_bytes(4, "little")
+    patch += zlib.crc32(patch).to_bytes(4, "little")
+
+    output_stream.write(patch)
+
+
+def apply_bps(source: Buffer, patch: Buffer) -> bytearray:
+    """
+    Returns the result of applying the given BPS patch to the given source data.
+
+    Checks the patch, source, and target checksums stored in the patch.
+    """
+    if bytes(patch[0 : len(BPS_MAGIC)]) != BPS_MAGIC:
+        raise InvalidPatchError(PatchFormat.BPS, "missing header")
+    if len(patch) < len(BPS_MAGIC) + 12:
+        raise InvalidPatchError(PatchFormat.BPS, "too short")
+
+    footer_start = len(patch) - 12
+    expected_source_crc = int.from_bytes(patch[footer_start : footer_start + 4], "little")
+    expected_target_crc = int.from_bytes(patch[footer_start + 4 : footer_start + 8], "little")
+    expected_patch_crc = int.from_bytes(patch[footer_start + 8 :], "little")
+
+    patch_crc = zlib.crc32(patch[0 : footer_start + 8])
+    if patch_crc != expected_patch_crc:
+        raise PatchChecksumError("patch", expected_patch_crc, patch_crc)
+
+    source_crc = zlib.crc32(source)
+    if source_crc != expected_source_crc:
+        raise PatchChecksumError("source", expected_source_crc, source_crc)
+
+    position = len(BPS_MAGIC)
+    source_size, position = decode_bps_number(patch, position)
+    target_size, position = decode_bps_number(patch, position)
+    metadata_size, position = decode_bps_number(patch, position)
+    position += metadata_size
+
+    if source_size != len(source):
+        raise InvalidPatchError(PatchFormat.BPS, "source size does not match")
+
+    target = bytearray(target_size)
+    output_offset = 0
+    source_relative_offset = 0
+    target_relative_offset = 0
+    while position < footer_start:
+        action, position = decode_bps_number(patch, position)
+        command = action & 3
+        length = (action >> 2) + 1
+
+        if output_offset + length > target_size:
+            raise InvalidPatchError(PatchFormat.BPS, "writes past the end of the target")
+
+        if command == BPS_SOURCE_READ:
+            target[output_offset : output_offset + length] = source[
+                output_offset : output_offset + length
+            ]
+        elif command == BPS_TARGET_READ:
+            target[output_offset : output_offset + length] = patch[position : position + length]
+            position += length
+        elif command == BPS_SOURCE_COPY:
+            relative_offset, position = decode_bps_number(patch, position)
+            source_relative_offset += (-1 if relative_offset & 1 else 1) * (relative_offset >> 1)
+            target[output_offset : output_offset + length] = source[
+                source_relative_offset : source_relative_offset + length
+            ]
+            source_relative_offset += length
+        else:
+            relative_offset, position = decode_bps_number(patch, position)
+            target_relative_offset += (-1 if relative_offset & 1 else 1) * (relative_offset >> 1)
+            # The copied range can overlap the range being written, so copy byte by byte
+            for i in range(0, length):
+                target[output_offset + i] = target[target_relative_offset + i]
+            target_relative_offset += length
+
+        output_offset += length
+
+    target_crc = zlib.crc32(target)
+    if target_crc != expected_target_crc:
+        raise PatchChecksumError("target", expected_target_crc, target_crc)
+
+    return target
+
+
+def apply_patch(source: Buffer, patch: Buffer) -> bytearray:
+    """
+    Returns the result of applying the given patch to the given source data, detecting whether it
+    is an IPS or BPS patch.
+    """
+    if bytes(patch[0 : len(BPS_MAGIC)]) == BPS_MAGIC:
+        return apply_bps(source, patch)
+    elif bytes(patch[0 : len(IPS_MAGIC)]) == IPS_MAGIC:
+        return apply_ips(source, patch)
+
+    raise UnknownPatchFormatError(bytes(patch[0:5]))
+
+
+def encode_bps_number(number: int) -> bytes:
+    encoded = bytearray()
+    while True:
+        byte = number & 0x7F
+        number >>= 7
+        if number == 0:
+            encoded.append(0x80 | byte)
+            return bytes(encoded)
+
+        encoded.append(byte)
+        number -= 1
+
+
+def decode_bps_number(data: Buffer, position: int) -> tuple[int, int]:
+    number = 0
+    shift = 1
+    while True:
+        if position >= len(data):
+            raise InvalidPatchError(PatchFormat.BPS, "truncated number")
+
+        byte = data[position]
+        position += 1
+
+        number += (byte & 0x7F) * shift
+        if byte & 0x80:
+            return number, position
+
+        shift <<= 7
+        number += shift
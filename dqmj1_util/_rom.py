@@ -1,17 +1,30 @@
 from __future__ import annotations
 
+import asyncio
+import concurrent.futures
+import contextlib
 import copy
+import dataclasses
+import functools
 import io
+import mmap
 import os
 import pathlib
-from collections.abc import Iterable
-from typing import Any, Callable, Generic, Optional, TypeVar, cast
+import shutil
+import threading
+from collections.abc import Iterable, Iterator, Sequence
+from typing import Any, Callable, Generic, NamedTuple, Optional, TypeVar, cast, overload
 
 import ndspy.rom
 
+from dqmj1_util._disk_cache import DiskCache, rom_fingerprint
+from dqmj1_util._lazy_rom import HEADER_SIZE as ROM_HEADER_SIZE
+from dqmj1_util._lazy_rom import LazyRomFile
+from dqmj1_util._patch import PatchFormat, diff, merge_changes, write_bps, write_ips
+from dqmj1_util._patch import apply_patch as apply_patch_to_data
 from dqmj1_util._region import Region
 from dqmj1_util._string_tables import StringTables
-from dqmj1_util.raw._btl_enmy_prm import BtlEnmyPrm
+from dqmj1_util.raw._btl_enmy_prm import BtlEnmyPrm, BtlEnmyPrmEntry
 from dqmj1_util.raw._skill_tbl import SkillTbl, SkillTblEntryJp, SkillTblEntryNaEu
 from dqmj1_util.simple._encounter import Encounter
 from dqmj1_util.simple._skill import Skill
@@ -20,7 +33,31 @@ from dqmj1_util.simple._skill_set import SkillSet
 BTL_ENMY_PRM_PATH = "BtlEnmyPrm.bin"
 SKILL_TBL_PATH = "SkillTbl.bin"
 
+NUM_SKILLS = 285
+
 T = TypeVar("T")
+U = TypeVar("U")
+
+
+@dataclasses.dataclass
+class CacheStats:
+    """
+    Counts of how accesses to a piece of cached data were served.
+    """
+
+    hits: int = 0
+    """
+    Accesses where the data was already loaded and up to date.
+    """
+    misses: int = 0
+    """
+    Accesses where the data had not been loaded yet.
+    """
+    recomputes: int = 0
+    """
+    Accesses where the data (or only some of its items) had to be reloaded because data it is
+    derived from was modified.
+    """
 
 
 class CachedData(Generic[T]):
@@ -28,28 +65,61 @@ class CachedData(Generic[T]):
     Utility class for cacheable data. Only loads data on request and marks data as dirty if it
     is modified. Supports both read only and read/writeable data.
 
-    Tracks "children" (data that is derived from this data) to automatically clear them when
-    the parent data is written to.
+    Forms a dependency graph with the other cached data that this data is derived from (its
+    "inputs"). Each cached data has a version that is incremented whenever it is modified, and
+    records the versions of its inputs when it is loaded. When accessed, it is only reloaded if one
+    of its inputs has been modified since then, rather than when it was merely loaded.
+
+    If only single items of an input were modified (see :meth:`edit_item`) and an item loader is
+    provided, then only the same items of this data (which must be a list) are reloaded, and are in
+    turn marked as modified for any data derived from this data. Otherwise the data is reloaded in
+    full.
+
+    Writeable data that has been modified is not reloaded when its inputs are modified, so that
+    the modifications are not lost.
 
-    Designed assuming that writeable data will not be a child of any other writeable data.
+    Safe to read from multiple threads. Loading is done by a single thread while holding a lock,
+    with any other threads accessing the data waiting for it rather than also loading it. Once
+    loaded, reading up to date data does not take the lock.
     """
 
     def __init__(
         self,
         load_function: Callable[[], T],
         writeable: bool = False,
-        children: Optional[Iterable[CachedData[Any]]] = None,
+        inputs: Optional[Iterable[CachedData[Any]]] = None,
+        copy_function: Callable[[T], T] = copy.deepcopy,
+        item_loader: Optional[Callable[[int], Any]] = None,
     ) -> None:
+        """
+        :param load_function: Function that loads the data.
+        :param writeable: Whether the data can be modified.
+        :param inputs: Cached data that this data is derived from.
+        :param copy_function: Function that copies the data.
+        :param item_loader: Function that loads the item at the given index of the data, for
+            reloading just the items of the data derived from modified items of its inputs. Can
+            return None for data whose items are loaded lazily, to clear the item.
+        """
         self._load_function = load_function
+        self._item_loader = item_loader
+        self._copy_function = copy_function
         self._is_writable = writeable
-        self._children = list(children) if children is not None else []
+        self._inputs = list(inputs) if inputs is not None else []
 
         self._data: Optional[T] = None
         self._is_dirty = False
+        self._dirty_items: set[int] = set()
+        self._is_shared = False
 
-        for child in self._children:
-            if child.is_writeable:
-                raise RuntimeError
+        self._version = 0
+        self._whole_version = 0
+        self._item_versions: dict[int, int] = {}
+        self._input_versions: list[int] = []
+
+        self._stats = CacheStats()
+
+        # Reentrant, since editing and refreshing the data may load it while holding the lock
+        self._lock = threading.RLock()
 
     @property
     def is_writeable(self) -> bool:
@@ -59,33 +129,373 @@ class CachedData(Generic[T]):
     def is_dirty(self) -> bool:
         return self._is_dirty
 
+    @property
+    def dirty_items(self) -> frozenset[int]:
+        """
+        Indices of the items that have been modified, if the data as a whole is not dirty.
+        """
+        return frozenset(self._dirty_items)
+
+    @property
+    def is_modified(self) -> bool:
+        """
+        Whether the data as a whole or any of its items are dirty.
+        """
+        return self._is_dirty or len(self._dirty_items) > 0
+
+    @property
+    def version(self) -> int:
+        """
+        Incremented each time the data (or an item of it) is modified.
+        """
+        return self._version
+
+    @property
+    def stats(self) -> CacheStats:
+        """
+        Counts of how accesses to the data were served. Hits are counted without locking, so may be
+        slightly undercounted when the data is read from multiple threads at once.
+        """
+        return dataclasses.replace(self._stats)
+
+    @property
+    def is_stale(self) -> bool:
+        """
+        Whether the data has been loaded, but data it is derived from (directly or indirectly) has
+        been modified since then.
+        """
+        if self._data is None:
+            return False
+
+        return any(
+            data.version != input_version or data.is_stale
+            for data, input_version in zip(self._inputs, self._input_versions)
+        )
+
+    def changed_items_since(self, version: int) -> Optional[set[int]]:
+        """
+        Returns the indices of the items that have been modified since the given version, or None
+        if the data as a whole has been modified since then.
+        """
+        with self._lock:
+            if self._whole_version > version:
+                return None
+
+            return {
+                index
+                for index, item_version in self._item_versions.items()
+                if item_version > version
+            }
+
     def mark_dirty(self) -> None:
-        self._is_dirty = True
+        with self._lock:
+            self._is_dirty = True
+            self._dirty_items.clear()
 
-        for child in self._children:
-            child.clear()
+            self._mark_changed()
 
-    def mark_clean(self) -> None:
-        self._is_dirty = False
+    def mark_item_dirty(self, index: int) -> None:
+        with self._lock:
+            if not self._is_dirty:
+                self._dirty_items.add(index)
 
-    def clear(self) -> None:
-        self._is_dirty = False
-        self._data = None
+            self._mark_item_changed(index)
+
+    def mark_clean(self) -> None:
+        with self._lock:
+            self._is_dirty = False
+            self._dirty_items.clear()
 
     def set(self, value: T) -> None:
         if not self.is_writeable:
             raise RuntimeError
 
-        self.mark_dirty()
-        self._data = value
+        with self._lock:
+            self._data = value
+            self._is_shared = False
+            self._input_versions = [data.version for data in self._inputs]
 
-    def get(self) -> T:
-        if self._data is None:
-            self._data = self._load_function()
+            self.mark_dirty()
+
+    def share(self, other: CachedData[T]) -> None:
+        """
+        Makes this use the data (and dirty state and versions) of the other cached data, without
+        copying it.
 
-        # Always do a deep copy, because if the data is mutable then modifying it directly would
+        The shared data is copied before either of them modifies it in place (see :meth:`edit`).
+        The inputs of this must be shared from the inputs of the other cached data as well.
+        """
+        self._data = other._data
+        self._is_dirty = other._is_dirty
+        self._dirty_items = set(other._dirty_items)
+
+        self._version = other._version
+        self._whole_version = other._whole_version
+        self._item_versions = dict(other._item_versions)
+        self._input_versions = list(other._input_versions)
+
+        if self._data is not None:
+            self._is_shared = True
+            other._is_shared = True
+
+    def get(self) -> T:
+        """
+        Returns a copy of the data, which can be freely modified (ex. before being set again).
+        """
+        # Always return a copy, because if the data is mutable then modifying it directly would
         # bypass the dirty marker
-        return copy.deepcopy(self._data)
+        return self._copy_function(self.view())
+
+    def peek(self) -> Optional[T]:
+        """
+        Returns the data without copying it if it has already been loaded, otherwise returns None.
+
+        The returned data must not be modified, and may be out of date if this data has inputs.
+        """
+        return self._data
+
+    def view(self) -> T:
+        """
+        Returns the data without copying it, loading it if it has not been loaded yet or reloading
+        it if any of its inputs have been modified since it was loaded.
+
+        The returned data must not be modified, as that would bypass the dirty marker. Use
+        :meth:`edit` to modify the data in place instead.
+        """
+        # Data is only ever loaded as a whole, so up to date data can be returned without locking
+        data = self._data
+        if data is not None and not self.is_stale:
+            self._stats.hits += 1
+            return data
+
+        with self._lock:
+            # Another thread may have loaded the data while this one was waiting for the lock
+            if self._data is None:
+                self._stats.misses += 1
+                self._load()
+            elif self._refresh():
+                self._stats.recomputes += 1
+            else:
+                self._stats.hits += 1
+
+            if self._data is None:
+                raise RuntimeError
+
+            return self._data
+
+    @contextlib.contextmanager
+    def edit(self) -> Iterator[T]:
+        """
+        Context manager that provides the data for modifying in place, without copying it.
+
+        The data is marked as dirty once the context manager exits.
+        """
+        data = self._view_for_edit()
+        try:
+            yield data
+        finally:
+            self.mark_dirty()
+
+    @contextlib.contextmanager
+    def edit_item(self, index: int, get_item: Callable[[T, int], U]) -> Iterator[U]:
+        """
+        Context manager that provides a single item of the data for modifying in place, without
+        copying it.
+
+        Only the item is marked as dirty once the context manager exits, so only the same item of
+        the data derived from this data is reloaded.
+
+        :param index: Index of the item, which must not be negative.
+        :param get_item: Function that returns the item at the given index of the data.
+        """
+        item = get_item(self._view_for_edit(), index)
+        try:
+            yield item
+        finally:
+            self.mark_item_dirty(index)
+
+    def _view_for_edit(self) -> T:
+        if not self.is_writeable:
+            raise RuntimeError
+
+        with self._lock:
+            data = self.view()
+            if self._is_shared:
+                # Copy on write, so that other users of the shared data are not affected
+                data = self._copy_function(data)
+                self._data = data
+                self._is_shared = False
+
+            return data
+
+    def refresh(self) -> None:
+        """
+        Brings the data up to date with its inputs, if it has been loaded.
+        """
+        # Data that has not been loaded will be up to date once it is loaded
+        if not self.is_stale:
+            return
+
+        with self._lock:
+            if self._data is not None and self._refresh():
+                self._stats.recomputes += 1
+
+    def _load(self) -> None:
+        # The data is set before the input versions, so that threads reading without the lock never
+        # see up to date versions alongside out of date data
+        self._data = self._load_function()
+        self._is_shared = False
+        self._input_versions = [data.version for data in self._inputs]
+
+    def _refresh(self) -> bool:
+        """
+        Brings the already loaded data up to date with its inputs, reloading it in full or
+        reloading just the modified items.
+
+        Returns whether anything was reloaded.
+        """
+        if len(self._inputs) == 0:
+            return False
+
+        changed_items: Optional[set[int]] = set()
+        for data, input_version in zip(self._inputs, self._input_versions):
+            data.refresh()
+
+            if data.version == input_version:
+                continue
+
+            input_changed_items = data.changed_items_since(input_version)
+            if input_changed_items is None or changed_items is None:
+                changed_items = None
+            else:
+                changed_items |= input_changed_items
+
+        if (changed_items is not None and len(changed_items) == 0) or self.is_modified:
+            # Modified data is kept rather than being overwritten by reloading it
+            self._input_versions = [data.version for data in self._inputs]
+            return False
+
+        if changed_items is None or self._item_loader is None or not isinstance(self._data, list):
+            self._load()
+            self._mark_changed()
+            return True
+
+        items: list[Any] = self._data
+        if self._is_shared:
+            items = list(items)
+            self._data = cast("T", items)
+            self._is_shared = False
+
+        for index in changed_items:
+            if index < len(items):
+                items[index] = self._item_loader(index)
+                self._mark_item_changed(index)
+
+        self._input_versions = [data.version for data in self._inputs]
+        return True
+
+    def _mark_changed(self) -> None:
+        self._version += 1
+        self._whole_version = self._version
+        self._item_versions.clear()
+
+    def _mark_item_changed(self, index: int) -> None:
+        self._version += 1
+        self._item_versions[index] = self._version
+
+
+class SequenceView(Sequence[T]):
+    """
+    Read-only, lazy view of a sequence of data.
+
+    Only gets the items that are accessed, rather than building the whole sequence up front.
+    """
+
+    def __init__(self, get_item: Callable[[int], T], length: int) -> None:
+        self._get_item = get_item
+        self._length = length
+
+    def __repr__(self) -> str:
+        return f"SequenceView(length={self._length})"
+
+    @overload
+    def __getitem__(self, index: int) -> T: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[T]: ...
+
+    def __getitem__(self, index: int | slice) -> T | list[T]:
+        if isinstance(index, slice):
+            return [self._get_item(i) for i in range(*index.indices(self._length))]
+
+        return self._get_item(check_index(index, self._length))
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __eq__(self, other: object) -> bool:
+        """
+        Compares equal to other sequences (ex. lists) with equal items, like a list would.
+        """
+        if not isinstance(other, Sequence) or isinstance(other, (str, bytes)):
+            return NotImplemented
+
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+
+def check_index(index: int, length: int) -> int:
+    """
+    Checks that the given index is valid for a sequence of the given length, converting negative
+    indices into the equivalent positive index.
+    """
+    if index < 0:
+        index += length
+    if not 0 <= index < length:
+        raise IndexError(index)
+
+    return index
+
+
+class ModifiedFile(NamedTuple):
+    """
+    Data file that has been modified, so needs to be written when the ROM is written.
+    """
+
+    path: str
+    size: int
+    """
+    Size of the file's data, including the modifications.
+    """
+    write_into: Callable[[bytearray], None]
+    """
+    Writes the modified data into a buffer of the file's size. If :attr:`ranges` is set, then only
+    those ranges are written, so the buffer must already contain the file's current data.
+    """
+    ranges: Optional[list[tuple[int, int]]] = None
+    """
+    Start and end offsets of the modified ranges of the file's data, or None if the whole file is
+    written.
+    """
+
+    @property
+    def written_ranges(self) -> list[tuple[int, int]]:
+        return self.ranges if self.ranges is not None else [(0, self.size)]
+
+
+class ForkedRomOverwriteError(RuntimeError):
+    def __init__(self, filepath: pathlib.Path):
+        super().__init__(
+            f"ROM has been forked, so it can't be written over the original ROM file that the forks "
+            f"read from: {filepath}"
+        )
+
+
+class SourceRomModifiedError(RuntimeError):
+    def __init__(self, filepath: pathlib.Path):
+        super().__init__(
+            f"ROM file was modified after it was opened, so it can't be used as the original ROM: "
+            f"{filepath}"
+        )
 
 
 class Rom:
@@ -93,10 +503,19 @@ class Rom:
     ROM containing the game's internal binaries and data files.
 
     Used to read data from and write data to the game ROM.
+
+    Reading data is safe from multiple threads at once (ex. sharing one ROM between the threads of
+    a web server), with each piece of data only being loaded by one thread. Modifying data should
+    not be done while other threads are accessing the ROM.
     """
 
     def __init__(
-        self, filepath: os.PathLike[Any] | str, region: Region = Region.NorthAmerica
+        self,
+        filepath: os.PathLike[Any] | str,
+        region: Region = Region.NorthAmerica,
+        lazy: bool = False,
+        cache_dir: Optional[os.PathLike[Any] | str] = None,
+        string_table_workers: Optional[int] = None,
     ) -> None:
         """
         Create a ROM object from the filepath to the ROM file.
@@ -105,31 +524,102 @@ class Rom:
 
         :param filepath: Filepath to the ROM file to work with.
         :param region: Region the ROM file is for.
+        :param lazy: If True, memory maps the ROM file and only reads the binaries and data files
+            that are actually used, rather than reading the whole ROM up front. The whole ROM is
+            still read if :attr:`~Rom.rom` is accessed or the ROM is written.
+        :param cache_dir: If provided, decoded data (string tables, encounters, skill sets, skills)
+            is cached in files in this directory and reused the next time the same ROM is opened.
+            Cache files are keyed by a fingerprint of the ROM's contents, so they are not used if
+            the ROM changes. Note that changes made via :attr:`~Rom.rom` are not detected.
+        :param string_table_workers: If more than 1, the string tables are decoded in parallel
+            using this many worker processes (see :meth:`StringTables.from_arm9`). Can reduce the
+            time taken to load :attr:`~Rom.string_tables` for the Japanese version of the game.
         """
         self._filepath = pathlib.Path(filepath)
         self._region = region
-
-        self._rom = ndspy.rom.NintendoDSRom.fromFile(self._filepath)
-
-        self._encounters = CachedData(self._load_encounters)
-        self._skill_sets = CachedData(self._load_skill_sets)
-        self._skills = CachedData(self._load_skills)
-
-        self._btl_enmy_prm = CachedData(
-            self._load_btl_enmy_prm, writeable=True, children=[self._encounters]
+        self._string_table_workers = string_table_workers
+
+        self._source_stat = self._filepath.stat()
+
+        self._rom: Optional[ndspy.rom.NintendoDSRom] = None
+        self._rom_lock = threading.Lock()
+        self._is_rom_exposed = False
+        self._is_rom_shared = False
+        self._is_source_shared = False
+        self._lazy_rom_file: Optional[LazyRomFile] = None
+        if lazy:
+            self._lazy_rom_file = LazyRomFile(self._filepath)
+        else:
+            self._rom = ndspy.rom.NintendoDSRom.fromFile(self._filepath)
+
+        self._disk_cache: Optional[DiskCache] = None
+        if cache_dir is not None:
+            self._disk_cache = DiskCache(pathlib.Path(cache_dir), self._compute_fingerprint)
+
+        self._executor: Optional[concurrent.futures.Executor] = None
+
+        self._init_cached_data()
+
+    def _init_cached_data(self) -> None:
+        self._string_tables = CachedData(self._load_string_tables, copy_function=StringTables.copy)
+        self._btl_enmy_prm = CachedData(self._load_btl_enmy_prm, writeable=True)
+        self._skill_tbl = CachedData(self._load_skill_tbl, writeable=True)
+
+        # Items of the lazily loaded lists are cleared rather than reloaded, see _get_lazy_item()
+        self._encounters = CachedData(
+            self._load_encounters,
+            inputs=[self._btl_enmy_prm, self._string_tables],
+            item_loader=lambda _: None,
         )
-        self._skill_tbl = CachedData(
-            self._load_skill_tbl, writeable=True, children=[self._skill_sets]
+        self._skill_sets = CachedData(
+            self._load_skill_sets,
+            inputs=[self._skill_tbl, self._string_tables],
+            item_loader=lambda _: None,
         )
+        self._skills = CachedData(self._load_skills, inputs=[self._string_tables])
 
-        self._string_tables = CachedData(
-            self._load_string_tables,
-            children=[self._encounters, self._skill_sets, self._skills],
-        )
+        self._lazy_item_lock = threading.Lock()
 
     def __repr__(self) -> str:
         return f"Rom(filepath={self._filepath}, region={self._region})"
 
+    def _get_cached_data(self) -> dict[str, CachedData[Any]]:
+        return {
+            "string_tables": self._string_tables,
+            "btl_enmy_prm": self._btl_enmy_prm,
+            "skill_tbl": self._skill_tbl,
+            "encounters": self._encounters,
+            "skill_sets": self._skill_sets,
+            "skills": self._skills,
+        }
+
+    def fork(self) -> Rom:
+        """
+        Returns a copy of the ROM that can be modified and written independently of this one (ex.
+        for generating many variants of a base ROM).
+
+        Forks are cheap to create, as they share the ROM data and any already decoded data with
+        this ROM rather than copying it. Data is only copied once it is modified (ex. via
+        :meth:`~Rom.edit_btl_enmy_prm`), so each fork only uses memory for its own changes.
+
+        Forks also share the original ROM file, so neither the fork nor this ROM can be written
+        over it (see :meth:`~Rom.write`).
+        """
+        rom_fork: Rom = copy.copy(self)
+        rom_fork._init_cached_data()
+
+        for fork_data, data in zip(
+            rom_fork._get_cached_data().values(), self._get_cached_data().values()
+        ):
+            fork_data.share(data)
+
+        self._is_rom_shared = True
+        rom_fork._is_rom_shared = True
+        self._is_source_shared = True
+        rom_fork._is_source_shared = True
+
+        return rom_fork
+
     @property
     def filepath(self) -> pathlib.Path:
         """
@@ -146,6 +636,24 @@ class Rom:
         """
         return self._region
 
+    @property
+    def is_lazy(self) -> bool:
+        """
+        Whether the ROM was opened lazily and has not yet been fully read in.
+        """
+        return self._lazy_rom_file is not None
+
+    @property
+    def cache_stats(self) -> dict[str, CacheStats]:
+        """
+        Counts of the cache hits, misses, and recomputes of each piece of data cached by the ROM
+        (ex. :code:`"encounters"`), for checking how well the caching works for a workload.
+
+        Data is only recomputed when data it is derived from is modified (ex. encounters when
+        :attr:`~Rom.btl_enmy_prm` is modified).
+        """
+        return {name: data.stats for name, data in self._get_cached_data().items()}
+
     @property
     def rom(self) -> ndspy.rom.NintendoDSRom:
         """
@@ -153,9 +661,67 @@ class Rom:
         read/modify/write the game's ROM.
 
         Can be mutated in order to apply custom changes to the game's code and data files.
+
+        If the ROM was opened lazily, then accessing this reads in the whole ROM.
         """
+        # The ROM may be modified in any way once it is exposed, so writes need a full rebuild
+        self._is_rom_exposed = True
+
+        rom = self._get_rom()
+        if self._is_rom_shared:
+            # Forks share the ROM, so it needs to be fully copied before it can be modified freely
+            rom = copy.deepcopy(rom)
+            self._rom = rom
+            self._is_rom_shared = False
+
+        return rom
+
+    def _get_rom(self) -> ndspy.rom.NintendoDSRom:
+        if self._rom is None:
+            with self._rom_lock:
+                # Another thread may have read in the ROM while this one was waiting for the lock
+                if self._rom is None:
+                    if self._lazy_rom_file is None:
+                        raise RuntimeError
+
+                    self._rom = self._lazy_rom_file.to_ndspy_rom()
+                    self._is_rom_shared = False
+
+                    # Not closed explicitly, as forks or other threads may still be reading from
+                    # it. The memory map is released once it is no longer referenced.
+                    self._lazy_rom_file = None
+
         return self._rom
 
+    def _get_writeable_rom(self) -> ndspy.rom.NintendoDSRom:
+        """
+        Returns the ROM for replacing its files, first copying it if it is shared with forks.
+
+        Only the list of files and any files that were already written to are copied, not the
+        original files, so the original file data must never be modified in place.
+        """
+        rom = self._get_rom()
+        if self._is_rom_shared:
+            rom = copy.copy(rom)
+            # Files that were written to are bytearrays, which may be reused by later writes
+            rom.files = [
+                bytearray(file) if isinstance(file, bytearray) else file for file in rom.files
+            ]
+            self._rom = rom
+            self._is_rom_shared = False
+
+        return rom
+
+    def read_file(self, path: str) -> bytes:
+        """
+        Returns the data of the file at the given path in the ROM's filesystem (ex.
+        :code:`"BtlEnmyPrm.bin"`).
+
+        Does not include any modifications that have not yet been written. If the ROM was opened
+        lazily, then only the given file is read in.
+        """
+        return bytes(self._get_file(path))
+
     def write(self, filepath: os.PathLike[Any] | str) -> None:
         """
         Writes the ROM (with any applied modifications) to the given filepath.
@@ -163,47 +729,453 @@ class Rom:
         Make sure you have applied any modifications you want to make prior to calling this method.
         You can do that by assigning modified data to properties like :attr:`~Rom.btl_enmy_prm` or
         :attr:`~Rom.skill_tbl`.
+
+        If the modified data files are the same size as the originals and :attr:`~Rom.rom` has not
+        been accessed, then the ROM file is written by copying the original ROM file and
+        overwriting only the modified data files, rather than rebuilding the whole ROM.
+
+        ROMs that have been forked (see :meth:`~Rom.fork`) can't be written over the original ROM
+        file, since the forks may still read data from it.
+        """
+        filepath = pathlib.Path(filepath)
+        if self._is_source_shared and filepath.exists() and filepath.samefile(self._filepath):
+            raise ForkedRomOverwriteError(filepath)
+
+        modified_files = self._get_modified_files()
+
+        if self._write_patched_copy(filepath, modified_files):
+            return
+
+        for modified_file in modified_files:
+            self._write_file(modified_file)
+
+        self._get_rom().saveToFile(filepath)
+
+    def write_patch(
+        self, filepath: os.PathLike[Any] | str, patch_format: PatchFormat = PatchFormat.BPS
+    ) -> None:
+        """
+        Writes a patch file containing the modifications made to the ROM, which can be applied to
+        the original ROM file (ex. via :meth:`~Rom.apply_patch`) to get the modified ROM.
+
+        Patches are usually orders of magnitude smaller than the full ROM. If only data files were
+        modified (and they are the same size as the originals), then only those files are compared
+        against the original ROM file.
+
+        :param filepath: Filepath to write the patch file to.
+        :param patch_format: Format of patch to write. IPS patches can only modify the first 16 MiB
+            of the ROM, so BPS is used by default.
+        """
+        if not self._is_source_unchanged():
+            raise SourceRomModifiedError(self._filepath)
+
+        modified_files = self._get_modified_files()
+        file_ranges = self._get_patchable_file_ranges(modified_files)
+
+        with (
+            self._filepath.open("rb") as input_stream,
+            mmap.mmap(input_stream.fileno(), 0, access=mmap.ACCESS_READ) as source_mmap,
+            memoryview(source_mmap) as source,
+        ):
+            if file_ranges is not None:
+                changes = []
+                for (start, _), modified_file in zip(file_ranges, modified_files):
+                    buffer = self._get_modified_file_data(modified_file)
+
+                    for range_start, range_end in modified_file.written_ranges:
+                        changes.extend(
+                            diff(
+                                source[start + range_start : start + range_end],
+                                buffer[range_start:range_end],
+                                offset=start + range_start,
+                            )
+                        )
+                # Adjacent modified ranges would otherwise give adjacent changes
+                changes = merge_changes(source, sorted(changes))
+
+                target_size = len(source)
+            else:
+                for modified_file in modified_files:
+                    self._write_file(modified_file)
+
+                target = self._get_rom().save()
+
+                changes = diff(source, target)
+                target_size = len(target)
+
+            with pathlib.Path(filepath).open("wb") as output_stream:
+                if patch_format == PatchFormat.IPS:
+                    write_ips(source, changes, target_size, output_stream)
+                else:
+                    write_bps(source, changes, target_size, output_stream)
+
+    @staticmethod
+    def apply_patch(
+        rom_filepath: os.PathLike[Any] | str,
+        patch_filepath: os.PathLike[Any] | str,
+        output_filepath: os.PathLike[Any] | str,
+    ) -> None:
+        """
+        Applies the given IPS or BPS patch file (ex. written by :meth:`~Rom.write_patch`) to the
+        given ROM file, and writes the patched ROM to the given output filepath.
+
+        :param rom_filepath: Filepath of the original ROM file.
+        :param patch_filepath: Filepath of the patch file. The patch format is detected from the
+            file's contents.
+        :param output_filepath: Filepath to write the patched ROM file to.
+        """
+        source = pathlib.Path(rom_filepath).read_bytes()
+        patch = pathlib.Path(patch_filepath).read_bytes()
+
+        pathlib.Path(output_filepath).write_bytes(apply_patch_to_data(source, patch))
+
+    def _get_modified_files(self) -> list[ModifiedFile]:
+        """
+        Returns each of the data files that have been modified.
+
+        If only some entries of a table have been modified, then only those entries are written.
+        """
+        modified_files: list[ModifiedFile] = []
+        if self._btl_enmy_prm.is_modified:
+            btl_enmy_prm = self._btl_enmy_prm.view()
+            if self._btl_enmy_prm.is_dirty:
+                modified_files.append(
+                    ModifiedFile(BTL_ENMY_PRM_PATH, btl_enmy_prm.bin_size, btl_enmy_prm.write_into)
+                )
+            else:
+                btl_enmy_prm_indices = sorted(self._btl_enmy_prm.dirty_items)
+                modified_files.append(
+                    ModifiedFile(
+                        BTL_ENMY_PRM_PATH,
+                        btl_enmy_prm.bin_size,
+                        lambda buffer: btl_enmy_prm.write_entries_into(
+                            buffer, btl_enmy_prm_indices
+                        ),
+                        [btl_enmy_prm.entry_range(index) for index in btl_enmy_prm_indices],
+                    )
+                )
+
+        if self._skill_tbl.is_modified:
+            skill_tbl = self._skill_tbl.view()
+            if self._skill_tbl.is_dirty:
+                modified_files.append(
+                    ModifiedFile(SKILL_TBL_PATH, skill_tbl.bin_size, skill_tbl.write_into)
+                )
+            else:
+                skill_tbl_indices = sorted(self._skill_tbl.dirty_items)
+                modified_files.append(
+                    ModifiedFile(
+                        SKILL_TBL_PATH,
+                        skill_tbl.bin_size,
+                        lambda buffer: skill_tbl.write_entries_into(buffer, skill_tbl_indices),
+                        [skill_tbl.entry_range(index) for index in skill_tbl_indices],
+                    )
+                )
+
+        return modified_files
+
+    def _get_modified_file_data(self, modified_file: ModifiedFile) -> bytearray:
+        """
+        Returns the full data of the given modified file, without modifying the ROM.
+        """
+        if modified_file.ranges is None:
+            buffer = bytearray(modified_file.size)
+        else:
+            buffer = bytearray(self._get_file(modified_file.path))
+        modified_file.write_into(buffer)
+
+        return buffer
+
+    def _get_patchable_file_ranges(
+        self, modified_files: Sequence[ModifiedFile]
+    ) -> Optional[list[tuple[int, int]]]:
+        """
+        Returns the byte ranges of the given modified files in the source ROM file, if the ROM can
+        be written by just overwriting those ranges of the source ROM file. Otherwise returns None.
+
+        Only possible if the modified files are the same size as in the source ROM file, the source
+        ROM file is unchanged, and :attr:`~Rom.rom` has not been exposed (since it could have been
+        modified in any way).
+        """
+        if self._is_rom_exposed or not self._is_source_unchanged():
+            return None
+
+        with LazyRomFile(self._filepath) as source:
+            file_ranges = [
+                source.get_file_range_by_name(modified_file.path)
+                for modified_file in modified_files
+            ]
+
+        for (start, end), modified_file in zip(file_ranges, modified_files):
+            if end - start != modified_file.size:
+                return None
+
+        return file_ranges
+
+    def _write_patched_copy(
+        self,
+        filepath: pathlib.Path,
+        modified_files: Sequence[ModifiedFile],
+    ) -> bool:
+        """
+        Writes the ROM by copying the source ROM file and overwriting just the modified files,
+        which is much faster than rebuilding the whole ROM.
+
+        Returns False without writing anything if not possible, see
+        :meth:`_get_patchable_file_ranges`.
+        """
+        file_ranges = self._get_patchable_file_ranges(modified_files)
+        if file_ranges is None:
+            return False
+
+        is_source = filepath.exists() and filepath.samefile(self._filepath)
+        if not is_source:
+            shutil.copyfile(self._filepath, filepath)
+
+        with filepath.open("r+b") as output_stream:
+            for (start, _), modified_file in zip(file_ranges, modified_files):
+                if self._rom is not None:
+                    # Keep the already read in ROM consistent with what was written
+                    buffer = self._write_file(modified_file)
+                else:
+                    buffer = self._get_modified_file_data(modified_file)
+
+                for range_start, range_end in modified_file.written_ranges:
+                    output_stream.seek(start + range_start)
+                    output_stream.write(memoryview(buffer)[range_start:range_end])
+
+        if is_source:
+            self._source_stat = self._filepath.stat()
+
+        return True
+
+    def _is_source_unchanged(self) -> bool:
+        try:
+            stat = self._filepath.stat()
+        except OSError:
+            return False
+
+        return (stat.st_size, stat.st_mtime_ns) == (
+            self._source_stat.st_size,
+            self._source_stat.st_mtime_ns,
+        )
+
+    def _write_file(self, modified_file: ModifiedFile) -> bytearray:
         """
-        if self._btl_enmy_prm.is_dirty:
-            output_stream = io.BytesIO()
-            self.btl_enmy_prm.write_bin(output_stream)
-            self._rom.setFileByName(BTL_ENMY_PRM_PATH, bytes(output_stream.getbuffer()))
+        Writes the data for the given file in the ROM, reusing the existing file buffer if it is
+        the same size (and not shared with forks), and otherwise replacing the file with a newly
+        allocated buffer.
 
-        if self._skill_tbl.is_dirty:
-            raise NotImplementedError
+        Returns the buffer that was written to.
+        """
+        rom = self._get_writeable_rom()
+        file_id = rom.filenames.idOf(modified_file.path)
+        if file_id is None:
+            raise FileNotFoundError(modified_file.path)
+
+        existing = rom.files[file_id]
+        if (
+            not self._is_rom_shared
+            and isinstance(existing, bytearray)
+            and len(existing) == modified_file.size
+        ):
+            buffer = existing
+        elif modified_file.ranges is not None:
+            buffer = bytearray(existing)
+        else:
+            buffer = bytearray(modified_file.size)
+
+        modified_file.write_into(buffer)
+        rom.files[file_id] = buffer
+
+        return buffer
+
+    def _get_arm9(self) -> bytes:
+        # Read once, as another thread may read in the ROM at any point
+        lazy_rom_file = self._lazy_rom_file
+        if lazy_rom_file is not None:
+            return lazy_rom_file.arm9
+
+        return self._get_rom().arm9
+
+    def _get_file(self, path: str) -> bytes:
+        lazy_rom_file = self._lazy_rom_file
+        if lazy_rom_file is not None:
+            return lazy_rom_file.get_file_by_name(path)
+
+        return self._get_rom().getFileByName(path)
+
+    def _compute_fingerprint(self) -> str:
+        if self._lazy_rom_file is not None:
+            header = self._lazy_rom_file.header
+        else:
+            with self._filepath.open("rb") as input_stream:
+                header = input_stream.read(ROM_HEADER_SIZE)
+
+        return rom_fingerprint(
+            header,
+            self._get_arm9(),
+            [self._get_file(BTL_ENMY_PRM_PATH), self._get_file(SKILL_TBL_PATH)],
+            self._region,
+        )
 
-        self._rom.saveToFile(filepath)
+    def _load_with_disk_cache(
+        self,
+        key: str,
+        load: Callable[[], T],
+        to_json: Callable[[T], Any],
+        from_json: Callable[[Any], T],
+    ) -> T:
+        """
+        Loads the data from the disk cache if it is enabled and has the data, otherwise loads it
+        with the given function (and then caches it).
+        """
+        if self._disk_cache is None:
+            return load()
+
+        cached = self._disk_cache.get(key)
+        if cached is not None:
+            return from_json(cached)
+
+        data = load()
+        self._disk_cache.set(key, to_json(data))
+
+        return data
 
     def _load_string_tables(self) -> StringTables:
-        return StringTables.from_rom(self._rom, self._region)
+        return self._load_with_disk_cache(
+            "string_tables",
+            lambda: StringTables.from_arm9(
+                self._get_arm9(), self._region, workers=self._string_table_workers
+            ),
+            to_json=dataclasses.asdict,
+            from_json=lambda data: StringTables(**data),
+        )
 
     def _load_btl_enmy_prm(self) -> BtlEnmyPrm:
-        data = self._rom.getFileByName(BTL_ENMY_PRM_PATH)
+        data = self._get_file(BTL_ENMY_PRM_PATH)
 
         input_stream = io.BytesIO(data)
         return BtlEnmyPrm.from_bin(input_stream)
 
-    def _load_encounters(self) -> list[Encounter]:
-        return [
-            Encounter.from_raw(entry, self.string_tables) for entry in self.btl_enmy_prm.entries
-        ]
+    def _load_btl_enmy_prm_entry(self, index: int) -> BtlEnmyPrmEntry:
+        btl_enmy_prm = self._btl_enmy_prm.peek()
+        if btl_enmy_prm is not None:
+            return btl_enmy_prm.entries[index]
+
+        return BtlEnmyPrm.entry_from_bytes(self._get_file(BTL_ENMY_PRM_PATH), index)
+
+    def _load_num_encounters(self) -> int:
+        btl_enmy_prm = self._btl_enmy_prm.peek()
+        if btl_enmy_prm is not None:
+            return len(btl_enmy_prm.entries)
+
+        return BtlEnmyPrm.num_entries_from_bytes(self._get_file(BTL_ENMY_PRM_PATH))
+
+    def _load_encounters(self) -> list[Optional[Encounter]]:
+        if self._disk_cache is None or self._btl_enmy_prm.is_modified:
+            # Encounters are only read as they are accessed, see encounter()
+            return [None] * self._load_num_encounters()
+
+        # Cache all of the encounters at once, so later runs only need to read the cache
+        encounters = self._load_with_disk_cache(
+            "encounters",
+            lambda: [self._load_encounter(i) for i in range(0, self._load_num_encounters())],
+            to_json=lambda encounters: [dataclasses.asdict(encounter) for encounter in encounters],
+            from_json=lambda data: [Encounter(**encounter) for encounter in data],
+        )
+        optional_encounters: list[Optional[Encounter]] = list(encounters)
+        return optional_encounters
+
+    def _load_encounter(self, index: int) -> Encounter:
+        return Encounter.from_raw(self._load_btl_enmy_prm_entry(index), self._string_tables.view())
 
     def _load_skill_tbl(self) -> SkillTbl:
-        data = self._rom.getFileByName(SKILL_TBL_PATH)
+        data = self._get_file(SKILL_TBL_PATH)
 
         input_stream = io.BytesIO(data)
         return SkillTbl.from_bin(input_stream, self._region)
 
-    def _load_skill_sets(self) -> list[SkillSet]:
-        return [
-            SkillSet.from_raw(
-                i, cast("SkillTblEntryJp | SkillTblEntryNaEu", entry), self.string_tables
-            )
-            for i, entry in enumerate(self.skill_tbl.entries)
-        ]
+    def _load_skill_tbl_entry(self, index: int) -> SkillTblEntryJp | SkillTblEntryNaEu:
+        skill_tbl = self._skill_tbl.peek()
+        if skill_tbl is not None:
+            return skill_tbl.entries[index]
+
+        return SkillTbl.entry_from_bytes(self._get_file(SKILL_TBL_PATH), index, self._region)
+
+    def _load_num_skill_sets(self) -> int:
+        skill_tbl = self._skill_tbl.peek()
+        if skill_tbl is not None:
+            return len(skill_tbl.entries)
 
-    def _load_skills(self) -> list[Skill]:
-        return [Skill.from_raw(i, self.string_tables) for i in range(0, 285)]
+        return SkillTbl.num_entries_from_bytes(self._get_file(SKILL_TBL_PATH))
+
+    def _load_skill_sets(self) -> list[Optional[SkillSet]]:
+        if self._disk_cache is None or self._skill_tbl.is_modified:
+            # Skill sets are only read as they are accessed, see skill_set()
+            return [None] * self._load_num_skill_sets()
+
+        # Cache all of the skill sets at once, so later runs only need to read the cache
+        skill_sets = self._load_with_disk_cache(
+            "skill_sets",
+            lambda: [self._load_skill_set(i) for i in range(0, self._load_num_skill_sets())],
+            to_json=lambda skill_sets: [dataclasses.asdict(skill_set) for skill_set in skill_sets],
+            from_json=lambda data: [Rom._skill_set_from_json(skill_set) for skill_set in data],
+        )
+        optional_skill_sets: list[Optional[SkillSet]] = list(skill_sets)
+        return optional_skill_sets
+
+    @staticmethod
+    def _skill_set_from_json(data: dict[str, Any]) -> SkillSet:
+        rewards = [SkillSet.Reward(**reward) for reward in data["rewards"]]
+
+        return SkillSet(**{**data, "rewards": rewards})
+
+    def _load_skill_set(self, index: int) -> SkillSet:
+        return SkillSet.from_raw(
+            index, self._load_skill_tbl_entry(index), self._string_tables.view()
+        )
+
+    def _load_skills(self) -> list[Optional[Skill]]:
+        if self._disk_cache is None:
+            # Skills are only read as they are accessed, see skill()
+            return [None] * NUM_SKILLS
+
+        # Cache all of the skills at once, so later runs only need to read the cache
+        skills = self._load_with_disk_cache(
+            "skills",
+            lambda: [self._load_skill(i) for i in range(0, NUM_SKILLS)],
+            to_json=lambda skills: [dataclasses.asdict(skill) for skill in skills],
+            from_json=lambda data: [Skill(**skill) for skill in data],
+        )
+        optional_skills: list[Optional[Skill]] = list(skills)
+        return optional_skills
+
+    def _load_skill(self, index: int) -> Skill:
+        return Skill.from_raw(index, self._string_tables.view())
+
+    def _get_lazy_item(
+        self, items: list[Optional[T]], index: int, load_item: Callable[[int], T]
+    ) -> T:
+        """
+        Returns the item at the given index of a lazily loaded list, loading the item if it has
+        not been loaded yet.
+
+        The item is returned without copying it, as the items are frozen dataclasses that are only
+        ever replaced rather than modified.
+        """
+        index = check_index(index, len(items))
+
+        item = items[index]
+        if item is None:
+            with self._lazy_item_lock:
+                # Another thread may have loaded the item while this one was waiting for the lock
+                item = items[index]
+                if item is None:
+                    item = load_item(index)
+                    items[index] = item
+
+        return item
 
     @property
     def string_tables(self) -> StringTables:
@@ -214,13 +1186,22 @@ class Rom:
         """
         return self._string_tables.get()
 
+    def view_string_tables(self) -> StringTables:
+        """
+        Returns :attr:`~Rom.string_tables` without copying it, for reading it repeatedly.
+
+        The returned string tables are shared with the ROM, so must not be modified.
+        """
+        return self._string_tables.view()
+
     @property
     def btl_enmy_prm(self) -> BtlEnmyPrm:
         """
         Encounters table containing data on monsters encountered in battles, received as gifts, or
         obtained as starters.
 
-        Read and write
+        Read and write. Returns a copy, so to modify it in place use
+        :meth:`~Rom.edit_btl_enmy_prm` instead.
         """
         return self._btl_enmy_prm.get()
 
@@ -228,22 +1209,72 @@ class Rom:
     def btl_enmy_prm(self, value: BtlEnmyPrm) -> None:
         self._btl_enmy_prm.set(value)
 
+    def view_btl_enmy_prm(self) -> BtlEnmyPrm:
+        """
+        Returns :attr:`~Rom.btl_enmy_prm` without copying it, for reading it repeatedly.
+
+        The returned table is shared with the ROM, so must not be modified. To modify it use
+        :meth:`~Rom.edit_btl_enmy_prm` instead.
+        """
+        return self._btl_enmy_prm.view()
+
+    def edit_btl_enmy_prm(self) -> contextlib.AbstractContextManager[BtlEnmyPrm]:
+        """
+        Context manager for modifying :attr:`~Rom.btl_enmy_prm` in place, without copying it.
+
+        .. code-block:: python
+
+           with rom.edit_btl_enmy_prm() as btl_enmy_prm:
+               btl_enmy_prm.entries[1].species_id = 318
+        """
+        return self._btl_enmy_prm.edit()
+
+    def edit_btl_enmy_prm_entry(
+        self, index: int
+    ) -> contextlib.AbstractContextManager[BtlEnmyPrmEntry]:
+        """
+        Context manager for modifying a single entry of :attr:`~Rom.btl_enmy_prm` in place.
+
+        Faster than :meth:`~Rom.edit_btl_enmy_prm` for small edits, as only the encounter at the
+        same index is re-read afterwards, and only the modified entries are written when the ROM is
+        written.
+
+        .. code-block:: python
+
+           with rom.edit_btl_enmy_prm_entry(1) as entry:
+               entry.species_id = 318
+        """
+        index = check_index(index, len(self.view_btl_enmy_prm().entries))
+
+        return self._btl_enmy_prm.edit_item(index, lambda btl_enmy_prm, i: btl_enmy_prm.entries[i])
+
     @property
-    def encounters(self) -> list[Encounter]:
+    def encounters(self) -> Sequence[Encounter]:
         """
         Encounters table containing data on monsters encountered in battles, received as gifts, or
         obtained as starters.
 
-        Read-only, to write/modify use :attr:`~Rom.btl_enmy_prm` instead.
+        Read-only, to write/modify use :attr:`~Rom.btl_enmy_prm` instead. Encounters are only
+        read as they are accessed, see :meth:`~Rom.encounter`.
+        """
+        return SequenceView(self.encounter, len(self._encounters.view()))
+
+    def encounter(self, index: int) -> Encounter:
+        """
+        Returns the encounter at the given index in :attr:`~Rom.encounters`.
+
+        Only reads the requested encounter from the ROM's data files, rather than the whole
+        encounters table.
         """
-        return self._encounters.get()
+        return self._get_lazy_item(self._encounters.view(), index, self._load_encounter)
 
     @property
     def skill_tbl(self) -> SkillTbl:
         """
         Skill sets that reward monsters with skill and/or traits as they allocate skill points.
 
-        Read and write
+        Read and write. Returns a copy, so to modify it in place use :meth:`~Rom.edit_skill_tbl`
+        instead.
         """
         return self._skill_tbl.get()
 
@@ -251,20 +1282,195 @@ class Rom:
     def skill_tbl(self, value: SkillTbl) -> None:
         self._skill_tbl.set(value)
 
+    def view_skill_tbl(self) -> SkillTbl:
+        """
+        Returns :attr:`~Rom.skill_tbl` without copying it, for reading it repeatedly.
+
+        The returned table is shared with the ROM, so must not be modified. To modify it use
+        :meth:`~Rom.edit_skill_tbl` instead.
+        """
+        return self._skill_tbl.view()
+
+    def edit_skill_tbl(self) -> contextlib.AbstractContextManager[SkillTbl]:
+        """
+        Context manager for modifying :attr:`~Rom.skill_tbl` in place, without copying it.
+        """
+        return self._skill_tbl.edit()
+
+    def edit_skill_tbl_entry(
+        self, index: int
+    ) -> contextlib.AbstractContextManager[SkillTblEntryJp | SkillTblEntryNaEu]:
+        """
+        Context manager for modifying a single entry of :attr:`~Rom.skill_tbl` in place.
+
+        Faster than :meth:`~Rom.edit_skill_tbl` for small edits, as only the skill set at the same
+        index is re-read afterwards, and only the modified entries are written when the ROM is
+        written.
+        """
+        index = check_index(index, len(self.view_skill_tbl().entries))
+
+        return self._skill_tbl.edit_item(index, lambda skill_tbl, i: skill_tbl.entries[i])
+
     @property
-    def skill_sets(self) -> list[SkillSet]:
+    def skill_sets(self) -> Sequence[SkillSet]:
         """
         Skill sets that reward monsters with skill and/or traits as they allocate skill points.
 
-        Read-only, to write/modify use :attr:`~Rom.skill_tbl` instead.
+        Read-only, to write/modify use :attr:`~Rom.skill_tbl` instead. Skill sets are only read as
+        they are accessed, see :meth:`~Rom.skill_set`.
+        """
+        return SequenceView(self.skill_set, len(self._skill_sets.view()))
+
+    def skill_set(self, index: int) -> SkillSet:
+        """
+        Returns the skill set at the given index in :attr:`~Rom.skill_sets`.
+
+        Only reads the requested skill set from the ROM's data files, rather than the whole skill
+        sets table.
         """
-        return self._skill_sets.get()
+        return self._get_lazy_item(self._skill_sets.view(), index, self._load_skill_set)
 
     @property
-    def skills(self) -> list[Skill]:
+    def skills(self) -> Sequence[Skill]:
         """
         Skills that monsters can obtain and use in battle.
 
-        Read-only, no read/write interface currently.
+        Read-only, no read/write interface currently. Skills are only read as they are accessed,
+        see :meth:`~Rom.skill`.
+        """
+        return SequenceView(self.skill, len(self._skills.view()))
+
+    def skill(self, index: int) -> Skill:
+        """
+        Returns the skill at the given index in :attr:`~Rom.skills`.
+        """
+        return self._get_lazy_item(self._skills.view(), index, self._load_skill)
+
+    @classmethod
+    async def open_async(
+        cls,
+        filepath: os.PathLike[Any] | str,
+        region: Region = Region.NorthAmerica,
+        lazy: bool = False,
+        cache_dir: Optional[os.PathLike[Any] | str] = None,
+        string_table_workers: Optional[int] = None,
+        preload: bool = True,
+        executor: Optional[concurrent.futures.Executor] = None,
+    ) -> Rom:
+        """
+        Creates a ROM object from the filepath to the ROM file, without blocking the event loop.
+
+        The ROM file is read in an executor, and the data that the ROM's other data is read from is
+        then loaded concurrently (see :meth:`~Rom.preload_async`).
+
+        .. code-block:: python
+
+           rom = await dqmj.Rom.open_async("your_ROM.nds")
+           encounters = await rom.encounters_async()
+
+        See the constructor for the other parameters.
+
+        :param preload: If True, waits for :meth:`~Rom.preload_async` before returning the ROM.
+        :param executor: Executor to run blocking work in, for this and the ROM's other async
+            methods. Defaults to the event loop's default executor.
+        """
+        loop = asyncio.get_running_loop()
+        rom: Rom = await loop.run_in_executor(
+            executor,
+            functools.partial(
+                cls,
+                filepath,
+                region=region,
+                lazy=lazy,
+                cache_dir=cache_dir,
+                string_table_workers=string_table_workers,
+            ),
+        )
+        rom._executor = executor
+
+        if preload:
+            await rom.preload_async()
+
+        return rom
+
+    async def preload_async(self) -> None:
+        """
+        Loads the string tables, :attr:`~Rom.btl_enmy_prm`, and :attr:`~Rom.skill_tbl` concurrently
+        in the executor.
+
+        These are read independently of each other, so the time taken is about that of the slowest
+        of them rather than the total. All of the ROM's other data is derived from them.
+        """
+        await asyncio.gather(
+            self._run_async(self._string_tables.view),
+            self._run_async(self._btl_enmy_prm.view),
+            self._run_async(self._skill_tbl.view),
+        )
+
+    async def string_tables_async(self) -> StringTables:
         """
-        return self._skills.get()
+        Async version of :attr:`~Rom.string_tables`.
+        """
+        return await self._run_async(lambda: self.string_tables)
+
+    async def btl_enmy_prm_async(self) -> BtlEnmyPrm:
+        """
+        Async version of :attr:`~Rom.btl_enmy_prm`.
+        """
+        return await self._run_async(lambda: self.btl_enmy_prm)
+
+    async def encounters_async(self) -> list[Encounter]:
+        """
+        Async version of :attr:`~Rom.encounters`. Reads all of the encounters.
+        """
+        return await self._run_async(lambda: list(self.encounters))
+
+    async def encounter_async(self, index: int) -> Encounter:
+        """
+        Async version of :meth:`~Rom.encounter`.
+        """
+        return await self._run_async(self.encounter, index)
+
+    async def skill_tbl_async(self) -> SkillTbl:
+        """
+        Async version of :attr:`~Rom.skill_tbl`.
+        """
+        return await self._run_async(lambda: self.skill_tbl)
+
+    async def skill_sets_async(self) -> list[SkillSet]:
+        """
+        Async version of :attr:`~Rom.skill_sets`. Reads all of the skill sets.
+        """
+        return await self._run_async(lambda: list(self.skill_sets))
+
+    async def skill_set_async(self, index: int) -> SkillSet:
+        """
+        Async version of :meth:`~Rom.skill_set`.
+        """
+        return await self._run_async(self.skill_set, index)
+
+    async def skills_async(self) -> list[Skill]:
+        """
+        Async version of :attr:`~Rom.skills`. Reads all of the skills.
+        """
+        return await self._run_async(lambda: list(self.skills))
+
+    async def skill_async(self, index: int) -> Skill:
+        """
+        Async version of :meth:`~Rom.skill`.
+        """
+        return await self._run_async(self.skill, index)
+
+    async def write_async(self, filepath: os.PathLike[Any] | str) -> None:
+        """
+        Async version of :meth:`~Rom.write`.
+        """
+        await self._run_async(self.write, filepath)
+
+    async def _run_async(self, function: Callable[..., T], *args: Any) -> T:
+        """
+        Runs the given blocking function in the executor, so that it does not block the event loop.
+        """
+        loop = asyncio.get_running_loop()
+
+        return await loop.run_in_executor(self._executor, functools.partial(function, *args))
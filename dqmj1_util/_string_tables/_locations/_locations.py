@@ -1,17 +1,27 @@
+import struct
 from dataclasses import dataclass
-from typing import Literal
 
 import ndspy.rom
 
 from dqmj1_util._character_encoding import CHARACTER_ENCODINGS
 from dqmj1_util._region import Region
 
-ENDIANESS: Literal["little"] = "little"
-
 POINTER_SIZE = 4
 FILE_OFFSETS = {"arm9.bin": 0x02000000}
 
 
+def read_pointers(data: bytes | memoryview, start: int, end: int) -> tuple[int, ...]:
+    """
+    Reads the table of pointers stored between the given start and end offsets into the data.
+
+    All of the pointers are unpacked at once rather than one at a time.
+    """
+    num_pointers = (end - start) // POINTER_SIZE
+    pointers: tuple[int, ...] = struct.unpack_from(f"<{num_pointers}I", data, start)
+
+    return pointers
+
+
 @dataclass
 class TableLocation:
     filepath: str
@@ -21,37 +31,49 @@ class TableLocation:
     def read(
         self, rom: ndspy.rom.NintendoDSRom, region: Region, max_string_length: int = 100
     ) -> list[str]:
-        offset = FILE_OFFSETS[self.filepath]
+        return self.read_from_arm9(rom.arm9, region, max_string_length=max_string_length)
+
+    def read_from_arm9(
+        self, arm9: bytes | memoryview, region: Region, max_string_length: int = 100
+    ) -> list[str]:
         character_encoding = CHARACTER_ENCODINGS[region]
 
-        start = self.start - offset
-        end = self.end - offset
+        return character_encoding.read_strings(
+            arm9, self.read_string_offsets(arm9), max_string_length=max_string_length
+        )
 
-        if self.filepath == "arm9.bin":
-            data = rom.arm9
-        else:
+    def read_string_offsets(self, arm9: bytes | memoryview) -> list[int]:
+        """
+        Reads the offsets into the arm9 binary of each of the table's strings, without decoding the
+        strings.
+
+        Pointers outside of the binary (ex. null pointers) are given as the end of the binary, so
+        that they are read as empty strings.
+        """
+        if self.filepath != "arm9.bin":
             raise ValueError(self.filepath)
 
-        string_pointers = []
-        current = start
-        while current < end:
-            string_pointers.append(
-                int.from_bytes(data[current : current + POINTER_SIZE], ENDIANESS)
-            )
+        offset = FILE_OFFSETS[self.filepath]
+
+        start = self.start - offset
+        end = self.end - offset
 
-            current += POINTER_SIZE
+        data = arm9
 
-        strings = []
-        for string_pointer in string_pointers:
-            string_pointer -= offset
+        string_offsets = [
+            string_pointer - offset for string_pointer in read_pointers(data, start, end)
+        ]
 
-            strings.append(
-                character_encoding.read_string(
-                    data[string_pointer : string_pointer + max_string_length]
-                )
-            )
+        # Check all of the pointers at once, since they almost always all point into the binary
+        if len(string_offsets) > 0 and (
+            min(string_offsets) < 0 or max(string_offsets) >= len(data)
+        ):
+            string_offsets = [
+                string_offset if 0 <= string_offset < len(data) else len(data)
+                for string_offset in string_offsets
+            ]
 
-        return strings
+        return string_offsets
 
 
 @dataclass
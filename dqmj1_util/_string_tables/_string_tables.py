@@ -1,11 +1,30 @@
 from __future__ import annotations
 
+import concurrent.futures
+import math
 from dataclasses import dataclass
+from typing import Optional
 
 import ndspy.rom
 
+from dqmj1_util._character_encoding import CHARACTER_ENCODINGS
 from dqmj1_util._region import Region
 from dqmj1_util._string_tables._locations import STRING_TABLE_LOCATIONS
+from dqmj1_util._string_tables._locations._locations import TableLocation
+
+CHUNKS_PER_WORKER = 2
+"""
+Number of chunks of strings to split the tables into per worker when decoding in parallel, so that
+workers that finish early can pick up more work.
+"""
+
+MIN_CHUNK_SIZE = 64
+"""
+Minimum number of strings to decode in each chunk, so that the overhead of sending chunks to the
+workers does not outweigh the decoding.
+"""
+
+_worker_arm9: Optional[bytes] = None
 
 
 @dataclass
@@ -23,7 +42,9 @@ class StringTables:
     item_names: list[str]
 
     @staticmethod
-    def from_rom(rom: ndspy.rom.NintendoDSRom, region: Region) -> StringTables:
+    def from_rom(
+        rom: ndspy.rom.NintendoDSRom, region: Region, workers: Optional[int] = None
+    ) -> StringTables:
         """
         Reads StringTables from the given ROM.
 
@@ -35,11 +56,103 @@ class StringTables:
 
         :param rom: ROM to read string tables from.
         :param region: Region the ROM is for.
+        :param workers: If more than 1, decodes the strings in parallel using this many worker
+            processes. See :meth:`from_arm9`.
+        """
+        return StringTables.from_arm9(rom.arm9, region, workers=workers)
+
+    @staticmethod
+    def from_arm9(
+        arm9: bytes | memoryview, region: Region, workers: Optional[int] = None
+    ) -> StringTables:
+        """
+        Reads StringTables from the given arm9 binary, without needing the rest of the ROM.
+
+        :param arm9: Data of the ROM's arm9 binary.
+        :param region: Region the ROM is for.
+        :param workers: If more than 1, decodes the strings in parallel using this many worker
+            processes, with the tables split into chunks of strings across the workers. Starting
+            the workers has a fixed cost, so this only helps when decoding is slow (ex. for the
+            Japanese version of the game).
         """
-        string_table_locations = STRING_TABLE_LOCATIONS[region]
+        string_table_locations: dict[str, TableLocation] = vars(STRING_TABLE_LOCATIONS[region])
 
-        tables = {
-            name: table.read(rom, region) for name, table in vars(string_table_locations).items()
-        }
+        if workers is not None and workers > 1:
+            tables = _read_tables_in_parallel(arm9, region, string_table_locations, workers)
+        else:
+            tables = {
+                name: table.read_from_arm9(arm9, region)
+                for name, table in string_table_locations.items()
+            }
 
         return StringTables(**tables)
+
+    def copy(self) -> StringTables:
+        """
+        Returns a copy of the string tables.
+
+        Much faster than :func:`copy.deepcopy`, since the strings themselves are immutable and so
+        only the lists need to be copied.
+        """
+        return StringTables(
+            species_names=list(self.species_names),
+            skill_names=list(self.skill_names),
+            trait_names=list(self.trait_names),
+            skill_set_names=list(self.skill_set_names),
+            item_names=list(self.item_names),
+        )
+
+
+def _read_tables_in_parallel(
+    arm9: bytes | memoryview,
+    region: Region,
+    string_table_locations: dict[str, TableLocation],
+    workers: int,
+) -> dict[str, list[str]]:
+    """
+    Reads the given string tables, decoding chunks of their strings in a pool of worker processes
+    and merging the decoded chunks back together in order.
+    """
+    # Reading the pointers is fast, so only decoding the strings is split across the workers
+    string_offsets = {
+        name: table.read_string_offsets(arm9) for name, table in string_table_locations.items()
+    }
+
+    num_strings = sum(len(offsets) for offsets in string_offsets.values())
+    chunk_size = max(MIN_CHUNK_SIZE, math.ceil(num_strings / (workers * CHUNKS_PER_WORKER)))
+
+    chunks = [
+        (name, offsets[start : start + chunk_size])
+        for name, offsets in string_offsets.items()
+        for start in range(0, len(offsets), chunk_size)
+    ]
+
+    # The arm9 binary is sent to each worker once, rather than with every chunk
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=min(workers, len(chunks)) if len(chunks) > 0 else 1,
+        initializer=_init_worker,
+        initargs=(bytes(arm9),),
+    ) as executor:
+        decoded_chunks = executor.map(
+            _read_strings_in_worker,
+            [region] * len(chunks),
+            [offsets for _, offsets in chunks],
+        )
+
+        tables: dict[str, list[str]] = {name: [] for name in string_table_locations}
+        for (name, _), strings in zip(chunks, decoded_chunks):
+            tables[name].extend(strings)
+
+    return tables
+
+
+def _init_worker(arm9: bytes) -> None:
+    global _worker_arm9
+    _worker_arm9 = arm9
+
+
+def _read_strings_in_worker(region: Region, string_offsets: list[int]) -> list[str]:
+    if _worker_arm9 is None:
+        raise RuntimeError
+
+    return CHARACTER_ENCODINGS[region].read_strings(_worker_arm9, string_offsets)
@@ -1,6 +1,7 @@
-from dqmj1_util.raw._btl_enmy_prm import BtlEnmyPrm, BtlEnmyPrmEntry
+from dqmj1_util.raw._btl_enmy_prm import BtlEnmyPrm, BtlEnmyPrmArray, BtlEnmyPrmEntry
 from dqmj1_util.raw._skill_tbl import (
     SkillTbl,
+    SkillTblArray,
     SkillTblEntry,
     SkillTblEntryBase,
     SkillTblEntryJp,
@@ -9,8 +10,10 @@ from dqmj1_util.raw._skill_tbl import (
 
 __all__ = [
     "BtlEnmyPrm",
+    "BtlEnmyPrmArray",
     "BtlEnmyPrmEntry",
     "SkillTbl",
+    "SkillTblArray",
     "SkillTblEntry",
     "SkillTblEntryBase",
     "SkillTblEntryJp",
@@ -1,15 +1,26 @@
 from __future__ import annotations
 
+from collections.abc import Iterable
 from dataclasses import dataclass
-from typing import IO, Annotated, Literal
+from typing import IO, Annotated, ClassVar, Literal
 
 import dataclasses_struct as dcs
+import numpy as np
+import numpy.typing as npt
 import pandas as pd
 
-from dqmj1_util.raw._util import BinaryReadWriteable
+from dqmj1_util.raw._util import (
+    BinaryReadWriteable,
+    flat_struct_codec,
+    flatten_structured_array,
+    struct_dtype,
+)
 
 ENDIANESS: Literal["little"] = "little"
 
+MAGIC = b"\x42\x45\x50\x54"
+HEADER_SIZE = 8
+
 
 @dcs.dataclass_struct(size="std", byteorder="little")
 class BtlEnmyPrmEntry(BinaryReadWriteable):
@@ -61,21 +72,142 @@ class BtlEnmyPrm:
     entries: list[BtlEnmyPrmEntry]
 
     def write_bin(self, output_stream: IO[bytes]) -> None:
-        magic = b"\x42\x45\x50\x54"
-
-        output_stream.write(magic)
+        output_stream.write(MAGIC)
         output_stream.write(len(self.entries).to_bytes(4, ENDIANESS))
-        for entry in self.entries:
-            entry.write_bin(output_stream)
+        BtlEnmyPrmEntry.write_bin_many(self.entries, output_stream)
+
+    @property
+    def bin_size(self) -> int:
+        """
+        Size in bytes of the :code:`"BtlEnmyPrm.bin"` file data written for this table.
+        """
+        return HEADER_SIZE + len(self.entries) * BtlEnmyPrmEntry.__dataclass_struct__.size
+
+    def write_into(self, buffer: bytearray | memoryview) -> None:
+        """
+        Writes the :code:`"BtlEnmyPrm.bin"` file data into the start of the given buffer, which must be
+        at least :attr:`bin_size` bytes long.
+        """
+        buffer[0:4] = MAGIC
+        buffer[4:HEADER_SIZE] = len(self.entries).to_bytes(4, ENDIANESS)
+
+        BtlEnmyPrmEntry.pack_many_into(self.entries, buffer, HEADER_SIZE)
+
+    def write_entries_into(self, buffer: bytearray | memoryview, indices: Iterable[int]) -> None:
+        """
+        Writes only the entries at the given indices into the given :code:`"BtlEnmyPrm.bin"` file
+        data, which must already contain the rest of the table (ex. the data it was read from).
+        """
+        codec = flat_struct_codec(BtlEnmyPrmEntry)
+        for index in indices:
+            codec.pack_into(buffer, BtlEnmyPrm.entry_range(index)[0], self.entries[index])
+
+    @staticmethod
+    def entry_range(index: int) -> tuple[int, int]:
+        """
+        Returns the start and end offsets of the entry at the given index in the
+        :code:`"BtlEnmyPrm.bin"` file data.
+        """
+        entry_size = BtlEnmyPrmEntry.__dataclass_struct__.size
+        start = HEADER_SIZE + index * entry_size
+
+        return start, start + entry_size
+
+    def to_bytes(self) -> bytearray:
+        """
+        Returns the :code:`"BtlEnmyPrm.bin"` file data, written into a single preallocated buffer.
+        """
+        buffer = bytearray(self.bin_size)
+        self.write_into(buffer)
+
+        return buffer
 
     @staticmethod
     def from_bin(input_stream: IO[bytes]) -> BtlEnmyPrm:
         input_stream.read(4)
         length = int.from_bytes(input_stream.read(4), ENDIANESS)
 
-        entries = [BtlEnmyPrmEntry.from_bin(input_stream) for _ in range(0, length)]
+        entries = BtlEnmyPrmEntry.from_bin_many(input_stream, length)
 
         return BtlEnmyPrm(entries)
 
+    @staticmethod
+    def num_entries_from_bytes(data: bytes | memoryview) -> int:
+        """
+        Returns the number of entries in the given :code:`"BtlEnmyPrm.bin"` file data, without
+        reading the entries.
+        """
+        return int.from_bytes(data[4:8], ENDIANESS)
+
+    @staticmethod
+    def entry_from_bytes(data: bytes | memoryview, index: int) -> BtlEnmyPrmEntry:
+        """
+        Reads only the entry at the given index from the given :code:`"BtlEnmyPrm.bin"` file data.
+
+        Supports negative indices in the same way as lists.
+        """
+        length = BtlEnmyPrm.num_entries_from_bytes(data)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError(index)
+
+        entry_size = BtlEnmyPrmEntry.__dataclass_struct__.size
+        start = HEADER_SIZE + index * entry_size
+
+        return BtlEnmyPrmEntry.from_packed(memoryview(data)[start : start + entry_size])
+
     def to_pd(self) -> pd.DataFrame:
         return pd.DataFrame(self.entries)
+
+
+@dataclass
+class BtlEnmyPrmArray:
+    """
+    Columnar version of a :class:`BtlEnmyPrm`, storing all of the entries in a single NumPy
+    structured array.
+
+    Reading is done with a single :func:`numpy.frombuffer` over the file data rather than creating
+    an object for each entry, which makes it well suited to analyzing all of the encounters at
+    once.
+    """
+
+    dtype: ClassVar[np.dtype[np.void]] = struct_dtype(BtlEnmyPrmEntry)
+    """
+    NumPy structured dtype with the same layout as :class:`BtlEnmyPrmEntry`.
+    """
+
+    entries: npt.NDArray[np.void]
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def write_bin(self, output_stream: IO[bytes]) -> None:
+        output_stream.write(MAGIC)
+        output_stream.write(len(self.entries).to_bytes(4, ENDIANESS))
+        output_stream.write(self.entries.astype(BtlEnmyPrmArray.dtype, copy=False).tobytes())
+
+    @staticmethod
+    def from_bin(input_stream: IO[bytes]) -> BtlEnmyPrmArray:
+        return BtlEnmyPrmArray.from_bytes(input_stream.read())
+
+    @staticmethod
+    def from_bytes(data: bytes | memoryview) -> BtlEnmyPrmArray:
+        """
+        Reads the entries from the given :code:`"BtlEnmyPrm.bin"` file data without copying them.
+
+        The entries array is read-only if the data is, so use :meth:`numpy.ndarray.copy` on it
+        before modifying it.
+        """
+        length = BtlEnmyPrm.num_entries_from_bytes(data)
+
+        entries = np.frombuffer(data, dtype=BtlEnmyPrmArray.dtype, count=length, offset=HEADER_SIZE)
+
+        return BtlEnmyPrmArray(entries)
+
+    def to_pd(self) -> pd.DataFrame:
+        """
+        Converts the entries into a DataFrame with one flat column per value, with lists expanded
+        into numbered columns (ex. :code:`skills_0_skill_id`, :code:`skill_set_ids_2`).
+        """
+        return pd.DataFrame(flatten_structured_array(self.entries))
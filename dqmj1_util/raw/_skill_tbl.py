@@ -1,15 +1,27 @@
 from __future__ import annotations
 
+from collections.abc import Iterable
 from dataclasses import dataclass
-from typing import IO, Annotated, Literal, cast
+from typing import IO, Annotated, ClassVar, Literal
 
 import dataclasses_struct as dcs
+import numpy as np
+import numpy.typing as npt
+import pandas as pd
 
 from dqmj1_util._region import Region
-from dqmj1_util.raw._util import BinaryReadWriteable
+from dqmj1_util.raw._util import (
+    BinaryReadWriteable,
+    flat_struct_codec,
+    flatten_structured_array,
+    struct_dtype,
+)
 
 ENDIANESS: Literal["little"] = "little"
 
+MAGIC = b"\x53\x4b\x49\x4c"
+HEADER_SIZE = 8
+
 
 class SkillTblEntryBase:
     can_upgrade: dcs.U8
@@ -129,21 +141,185 @@ class SkillTbl:
     entries: list[SkillTblEntryJp] | list[SkillTblEntryNaEu]
 
     def write_bin(self, output_stream: IO[bytes]) -> None:
-        magic = b"\x53\x4b\x49\x4c"
-
-        output_stream.write(magic)
+        output_stream.write(MAGIC)
         output_stream.write(len(self.entries).to_bytes(4, ENDIANESS))
-        for entry in self.entries:
-            entry.write_bin(output_stream)
+        if len(self.entries) > 0:
+            self.__entry_type().write_bin_many(self.entries, output_stream)
+
+    @property
+    def bin_size(self) -> int:
+        """
+        Size in bytes of the :code:`"SkillTbl.bin"` file data written for this table.
+        """
+        if len(self.entries) == 0:
+            return HEADER_SIZE
+
+        return HEADER_SIZE + len(self.entries) * flat_struct_codec(self.__entry_type()).size
+
+    def write_into(self, buffer: bytearray | memoryview) -> None:
+        """
+        Writes the :code:`"SkillTbl.bin"` file data into the start of the given buffer, which must be
+        at least :attr:`bin_size` bytes long.
+        """
+        buffer[0:4] = MAGIC
+        buffer[4:HEADER_SIZE] = len(self.entries).to_bytes(4, ENDIANESS)
+
+        if len(self.entries) > 0:
+            self.__entry_type().pack_many_into(self.entries, buffer, HEADER_SIZE)
+
+    def write_entries_into(self, buffer: bytearray | memoryview, indices: Iterable[int]) -> None:
+        """
+        Writes only the entries at the given indices into the given :code:`"SkillTbl.bin"` file
+        data, which must already contain the rest of the table (ex. the data it was read from).
+        """
+        codec = flat_struct_codec(self.__entry_type())
+        for index in indices:
+            codec.pack_into(buffer, self.entry_range(index)[0], self.entries[index])
+
+    def entry_range(self, index: int) -> tuple[int, int]:
+        """
+        Returns the start and end offsets of the entry at the given index in the
+        :code:`"SkillTbl.bin"` file data.
+        """
+        entry_size = flat_struct_codec(self.__entry_type()).size
+        start = HEADER_SIZE + index * entry_size
+
+        return start, start + entry_size
+
+    def __entry_type(self) -> type[BinaryReadWriteable]:
+        return type(self.entries[0])
+
+    def to_bytes(self) -> bytearray:
+        """
+        Returns the :code:`"SkillTbl.bin"` file data, written into a single preallocated buffer.
+        """
+        buffer = bytearray(self.bin_size)
+        self.write_into(buffer)
+
+        return buffer
 
     @staticmethod
     def from_bin(input_stream: IO[bytes], region: Region) -> SkillTbl:
         input_stream.read(4)
         length = int.from_bytes(input_stream.read(4), ENDIANESS)
 
-        entries = cast(
-            "list[SkillTblEntryJp] | list[SkillTblEntryNaEu]",
-            [SkillTblEntry.from_bin(input_stream, region) for _ in range(0, length)],
-        )
+        entry_type = SkillTblEntryJp if region == Region.Japan else SkillTblEntryNaEu
+        entries = entry_type.from_bin_many(input_stream, length)
 
         return SkillTbl(entries)
+
+    @staticmethod
+    def num_entries_from_bytes(data: bytes | memoryview) -> int:
+        """
+        Returns the number of entries in the given :code:`"SkillTbl.bin"` file data, without
+        reading the entries.
+        """
+        return int.from_bytes(data[4:8], ENDIANESS)
+
+    @staticmethod
+    def entry_from_bytes(
+        data: bytes | memoryview, index: int, region: Region
+    ) -> SkillTblEntryJp | SkillTblEntryNaEu:
+        """
+        Reads only the entry at the given index from the given :code:`"SkillTbl.bin"` file data.
+
+        Supports negative indices in the same way as lists.
+        """
+        length = SkillTbl.num_entries_from_bytes(data)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError(index)
+
+        entry_type = SkillTblEntryJp if region == Region.Japan else SkillTblEntryNaEu
+        entry_size = entry_type.__dataclass_struct__.size
+        start = HEADER_SIZE + index * entry_size
+
+        return entry_type.from_packed(memoryview(data)[start : start + entry_size])
+
+
+@dataclass
+class SkillTblArray:
+    """
+    Columnar version of a :class:`SkillTbl`, storing all of the entries in a single NumPy
+    structured array.
+
+    Reading is done with a single :func:`numpy.frombuffer` over the file data rather than creating
+    an object for each entry, which makes it well suited to analyzing all of the skill sets at once.
+    """
+
+    dtype_jp: ClassVar[np.dtype[np.void]] = struct_dtype(SkillTblEntryJp)
+    """
+    NumPy structured dtype with the same layout as :class:`SkillTblEntryJp`.
+    """
+
+    dtype_na_eu: ClassVar[np.dtype[np.void]] = struct_dtype(SkillTblEntryNaEu)
+    """
+    NumPy structured dtype with the same layout as :class:`SkillTblEntryNaEu`.
+    """
+
+    entries: npt.NDArray[np.void]
+    region: Region
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    @staticmethod
+    def dtype_for_region(region: Region) -> np.dtype[np.void]:
+        return SkillTblArray.dtype_jp if region == Region.Japan else SkillTblArray.dtype_na_eu
+
+    @property
+    def num_rewards(self) -> npt.NDArray[np.intp]:
+        """
+        Number of rewards of each skill set, computed for all of the entries at once.
+
+        Matches :attr:`SkillTblEntryBase.num_rewards`, where the rewards end at the first
+        requirement with the same points total as the one before it (starting from 0).
+        """
+        points_totals = self.entries["skill_point_requirements"]["points_total"]
+        num_requirements = points_totals.shape[1]
+
+        prev_points_totals = np.concatenate(
+            [np.zeros((len(points_totals), 1), dtype=points_totals.dtype), points_totals[:, :-1]],
+            axis=1,
+        )
+        is_end = points_totals == prev_points_totals
+
+        num_rewards: npt.NDArray[np.intp] = np.where(
+            is_end.any(axis=1), is_end.argmax(axis=1), num_requirements
+        )
+
+        return num_rewards
+
+    def write_bin(self, output_stream: IO[bytes]) -> None:
+        dtype = SkillTblArray.dtype_for_region(self.region)
+
+        output_stream.write(MAGIC)
+        output_stream.write(len(self.entries).to_bytes(4, ENDIANESS))
+        output_stream.write(self.entries.astype(dtype, copy=False).tobytes())
+
+    @staticmethod
+    def from_bin(input_stream: IO[bytes], region: Region) -> SkillTblArray:
+        return SkillTblArray.from_bytes(input_stream.read(), region)
+
+    @staticmethod
+    def from_bytes(data: bytes | memoryview, region: Region) -> SkillTblArray:
+        """
+        Reads the entries from the given :code:`"SkillTbl.bin"` file data without copying them.
+
+        The entries array is read-only if the data is, so use :meth:`numpy.ndarray.copy` on it
+        before modifying it.
+        """
+        length = SkillTbl.num_entries_from_bytes(data)
+        dtype = SkillTblArray.dtype_for_region(region)
+
+        entries = np.frombuffer(data, dtype=dtype, count=length, offset=HEADER_SIZE)
+
+        return SkillTblArray(entries, region)
+
+    def to_pd(self) -> pd.DataFrame:
+        """
+        Converts the entries into a DataFrame with one flat column per value, with lists expanded
+        into numbered columns (ex. :code:`skills_0_skill_ids_3`, :code:`species_learnt_by_1`).
+        """
+        return pd.DataFrame(flatten_structured_array(self.entries))
@@ -1,5 +1,16 @@
 import abc
-from typing import IO, Callable, Optional, Protocol, Self, cast
+import dataclasses
+import functools
+import itertools
+import struct
+import typing
+from collections.abc import Iterable, Iterator, Sequence
+from typing import IO, Any, Callable, Generic, Optional, Protocol, Self, TypeVar, cast
+
+import dataclasses_struct as dcs
+import numpy as np
+import numpy.typing as npt
+from numpy.typing import DTypeLike
 
 
 class BinaryRwNotDataclassStructError(TypeError):
@@ -9,8 +20,20 @@ class BinaryRwNotDataclassStructError(TypeError):
         )
 
 
+T = TypeVar("T")
+
+
+class NotEnoughEntryDataError(EOFError):
+    def __init__(self, cls: type, expected_count: int, actual_count: int):
+        super().__init__(
+            f"Expected to read {expected_count} {cls.__name__} entries, but the input only had "
+            f"enough data for {actual_count}"
+        )
+
+
 class DataclassStructProtocol(Protocol):
     size: int
+    format: str
 
 
 class BinaryReadWriteable(abc.ABC):  # noqa: B024
@@ -49,3 +72,259 @@ class BinaryReadWriteable(abc.ABC):  # noqa: B024
             raise BinaryRwNotDataclassStructError(cls)
 
         return from_packed(input_stream.read(struct_info.size))
+
+    @classmethod
+    def from_bin_many(cls, input_stream: IO[bytes], count: int) -> list[Self]:
+        """
+        Reads the given number of consecutive entries from the given binary input stream.
+
+        Uses a precompiled :class:`FlatStructCodec`, so is much faster than calling
+        :meth:`from_bin` for each entry.
+        """
+        codec = flat_struct_codec(cls)
+        data = input_stream.read(codec.size * count)
+        if len(data) != codec.size * count:
+            raise NotEnoughEntryDataError(cls, count, len(data) // codec.size)
+
+        return codec.unpack_many(data)
+
+    @classmethod
+    def write_bin_many(cls, entries: Sequence[Self], output_stream: IO[bytes]) -> None:
+        """
+        Writes the given entries as binary to the given output stream, packing them into a single
+        preallocated buffer first.
+        """
+        codec = flat_struct_codec(cls)
+
+        buffer = bytearray(codec.size * len(entries))
+        codec.pack_many_into(buffer, 0, entries)
+
+        output_stream.write(buffer)
+
+    @classmethod
+    def pack_many_into(
+        cls, entries: Iterable[Self], buffer: bytearray | memoryview, offset: int = 0
+    ) -> int:
+        """
+        Packs the given entries one after another into the given buffer, starting at the given
+        offset.
+
+        Returns the offset just after the last packed entry.
+        """
+        return flat_struct_codec(cls).pack_many_into(buffer, offset, entries)
+
+
+class FlatStructCodec(Generic[T]):
+    """
+    Precompiled codec for a dataclass-struct, using a single flat :class:`struct.Struct` for all
+    of its (possibly nested) fields.
+
+    The functions that convert between instances and the flat tuple of struct values are generated
+    from the struct layout, so packing and unpacking do no per-field lookups.
+    """
+
+    def __init__(self, cls: type[T]) -> None:
+        if not dcs.is_dataclass_struct(cast("type", cls)):
+            raise BinaryRwNotDataclassStructError(cls)
+
+        struct_info = cast("DataclassStructProtocol", getattr(cls, "__dataclass_struct__"))  # noqa: B009
+
+        self.struct = struct.Struct(struct_info.format)
+        self.size = self.struct.size
+
+        self._from_values: Callable[[tuple[Any, ...]], T] = _compile_from_values(cls)
+        self._to_values: Callable[[T], tuple[Any, ...]] = _compile_to_values(cls)
+
+    def unpack(self, data: bytes | bytearray | memoryview) -> T:
+        return self._from_values(self.struct.unpack(data))
+
+    def unpack_many(self, data: bytes | bytearray | memoryview) -> list[T]:
+        """
+        Unpacks the consecutive entries in the given data, which must be a multiple of the struct
+        size (otherwise raises :class:`struct.error`).
+        """
+        from_values = self._from_values
+        return [from_values(values) for values in self.struct.iter_unpack(data)]
+
+    def pack(self, entry: T) -> bytes:
+        return self.struct.pack(*self._to_values(entry))
+
+    def pack_into(self, buffer: bytearray | memoryview, offset: int, entry: T) -> None:
+        self.struct.pack_into(buffer, offset, *self._to_values(entry))
+
+    def pack_many_into(
+        self, buffer: bytearray | memoryview, offset: int, entries: Iterable[T]
+    ) -> int:
+        pack_into = self.struct.pack_into
+        to_values = self._to_values
+        size = self.size
+
+        for entry in entries:
+            pack_into(buffer, offset, *to_values(entry))
+            offset += size
+
+        return offset
+
+
+@functools.cache
+def flat_struct_codec(cls: type[T]) -> FlatStructCodec[T]:
+    """
+    Returns the :class:`FlatStructCodec` for the given dataclass-struct, compiling it on first use.
+    """
+    return FlatStructCodec(cls)
+
+
+def _compile_from_values(cls: type[T]) -> Callable[[tuple[Any, ...]], T]:
+    namespace: dict[str, Any] = {}
+    expression = _struct_from_values_expression(cls, itertools.count(), namespace)
+
+    exec(f"def from_values(values):\n    return {expression}\n", namespace)  # noqa: S102
+
+    return cast("Callable[[tuple[Any, ...]], T]", namespace["from_values"])
+
+
+def _struct_from_values_expression(
+    cls: type, indices: Iterator[int], namespace: dict[str, Any]
+) -> str:
+    class_name = f"_{cls.__name__}_{len(namespace)}"
+    namespace[class_name] = cls
+
+    arguments = [
+        f"{name}={_annotation_from_values_expression(annotation, indices, namespace)}"
+        for name, annotation in struct_field_annotations(cls)
+    ]
+
+    return f"{class_name}({', '.join(arguments)})"
+
+
+def _annotation_from_values_expression(
+    annotation: Any, indices: Iterator[int], namespace: dict[str, Any]
+) -> str:
+    if dcs.is_dataclass_struct(annotation):
+        return _struct_from_values_expression(annotation, indices, namespace)
+
+    base_type, arg = typing.get_args(annotation)
+    if typing.get_origin(base_type) is list:
+        (item_annotation,) = typing.get_args(base_type)
+        items = [
+            _annotation_from_values_expression(item_annotation, indices, namespace)
+            for _ in range(0, arg)
+        ]
+        return f"[{', '.join(items)}]"
+    else:
+        return f"values[{next(indices)}]"
+
+
+def _compile_to_values(cls: type[T]) -> Callable[[T], tuple[Any, ...]]:
+    namespace: dict[str, Any] = {}
+    expressions = _struct_to_values_expressions(cls, "entry")
+
+    exec(f"def to_values(entry):\n    return ({', '.join(expressions)},)\n", namespace)  # noqa: S102
+
+    return cast("Callable[[T], tuple[Any, ...]]", namespace["to_values"])
+
+
+def _struct_to_values_expressions(cls: type, path: str) -> list[str]:
+    expressions = []
+    for name, annotation in struct_field_annotations(cls):
+        expressions.extend(_annotation_to_values_expressions(annotation, f"{path}.{name}"))
+
+    return expressions
+
+
+def _annotation_to_values_expressions(annotation: Any, path: str) -> list[str]:
+    if dcs.is_dataclass_struct(annotation):
+        return _struct_to_values_expressions(annotation, path)
+
+    base_type, arg = typing.get_args(annotation)
+    if typing.get_origin(base_type) is list:
+        (item_annotation,) = typing.get_args(base_type)
+        expressions = []
+        for i in range(0, arg):
+            expressions.extend(_annotation_to_values_expressions(item_annotation, f"{path}[{i}]"))
+        return expressions
+    else:
+        return [path]
+
+
+class DtypeLayoutMismatchError(TypeError):
+    def __init__(self, cls: type, dtype_size: int, struct_size: int):
+        super().__init__(
+            f"NumPy dtype derived for {cls.__name__} is {dtype_size} bytes, but the struct is "
+            f"{struct_size} bytes"
+        )
+
+
+def struct_field_annotations(cls: type) -> list[tuple[str, Any]]:
+    """
+    Returns the name and type annotation of each field of the given dataclass-struct, in the order
+    they are packed.
+    """
+    type_hints = typing.get_type_hints(cls, include_extras=True)
+
+    return [(field.name, type_hints[field.name]) for field in dataclasses.fields(cls)]
+
+
+def struct_dtype(cls: type) -> np.dtype[np.void]:
+    """
+    Derives a NumPy structured dtype with the same memory layout as the given dataclass-struct.
+
+    Bytes fields are represented as arrays of unsigned bytes, and fixed length lists as NumPy
+    subarrays.
+    """
+    struct_info = cast("DataclassStructProtocol", getattr(cls, "__dataclass_struct__"))  # noqa: B009
+    byteorder = struct_info.format[0]
+
+    dtype = np.dtype(
+        [
+            (name, _annotation_dtype(annotation, byteorder))
+            for name, annotation in struct_field_annotations(cls)
+        ]
+    )
+    if dtype.itemsize != struct_info.size:
+        raise DtypeLayoutMismatchError(cls, dtype.itemsize, struct_info.size)
+
+    return dtype
+
+
+def _annotation_dtype(annotation: Any, byteorder: str) -> DTypeLike:
+    if dcs.is_dataclass_struct(annotation):
+        return struct_dtype(annotation)
+
+    base_type, arg = typing.get_args(annotation)
+    if base_type is bytes:
+        return ("u1", (arg,))
+    elif typing.get_origin(base_type) is list:
+        (item_annotation,) = typing.get_args(base_type)
+        return (_annotation_dtype(item_annotation, byteorder), (arg,))
+    else:
+        int_format = cast("str", arg.format())
+        return np.dtype(byteorder + int_format)
+
+
+def flatten_structured_array(array: npt.NDArray[np.void]) -> dict[str, npt.NDArray[Any]]:
+    """
+    Splits a 1D structured array into flat columns, expanding nested structs and subarrays into one
+    column per value (ex. :code:`skills_0_skill_id`).
+
+    Only slices out whole columns, so does no per-row Python work.
+    """
+    columns: dict[str, npt.NDArray[Any]] = {}
+    _flatten_column(columns, "", array)
+
+    return columns
+
+
+def _flatten_column(
+    columns: dict[str, npt.NDArray[Any]], name: str, column: npt.NDArray[Any]
+) -> None:
+    if column.ndim > 1:
+        for i in range(0, column.shape[1]):
+            _flatten_column(columns, f"{name}_{i}", column[:, i])
+    elif column.dtype.names is not None:
+        for field_name in column.dtype.names:
+            _flatten_column(
+                columns, f"{name}_{field_name}" if name else field_name, column[field_name]
+            )
+    else:
+        columns[name] = column
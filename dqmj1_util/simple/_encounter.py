@@ -10,7 +10,7 @@ from dqmj1_util.raw._btl_enmy_prm import BtlEnmyPrmEntry
 T = TypeVar("T")
 
 
-@dataclass
+@dataclass(frozen=True)
 class Encounter:
     species: str
     species_id: int
@@ -5,7 +5,7 @@ from dataclasses import dataclass
 from dqmj1_util._string_tables import StringTables
 
 
-@dataclass
+@dataclass(frozen=True)
 class Skill:
     name: str
 
@@ -7,17 +7,17 @@ from dqmj1_util._string_tables import StringTables
 from dqmj1_util.raw._skill_tbl import SkillTblEntryJp, SkillTblEntryNaEu
 
 
-@dataclass
+@dataclass(frozen=True)
 class SkillSet:
     name: str
     can_upgrade: bool
     category: int  # TODO: make into an enum
     max_skill_points: int
     rewards: list[Reward]
-    species_learnt_by: list[str]
+    species_learnt_by: list[int]
     species_learnt_by_ids: list[int]
 
-    @dataclass
+    @dataclass(frozen=True)
     class Reward:
         skill_point_requirement: int
         skill: Optional[str]
@@ -34,6 +34,7 @@ class SkillSet:
 
         params["name"] = string_tables.skill_set_names[skill_set_id]
         params["can_upgrade"] = raw.can_upgrade > 0
+        params["species_learnt_by"] = raw.species_learnt_by.copy()
         params["species_learnt_by_ids"] = []
 
         rewards: list[SkillSet.Reward] = []
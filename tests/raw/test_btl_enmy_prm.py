@@ -1,10 +1,13 @@
+import copy
 import io
 import unittest
 
 from dqmj1_util.raw import (
     BtlEnmyPrm,
+    BtlEnmyPrmArray,
     BtlEnmyPrmEntry,
 )
+from tests.util import ROM_BTL_ENMY_PRM
 
 
 class TestItemDrop(unittest.TestCase):
@@ -429,3 +432,83 @@ class TestBtlEnmyPrm(unittest.TestCase):
             b"\x00"
         )
         self.assertEqual(expected, actual)
+
+    def test_entry_from_bytes(self) -> None:
+        output_stream = io.BytesIO()
+        ROM_BTL_ENMY_PRM.write_bin(output_stream)
+        data = output_stream.getvalue()
+
+        self.assertEqual(20, BtlEnmyPrm.num_entries_from_bytes(data))
+        self.assertEqual(ROM_BTL_ENMY_PRM.entries[5], BtlEnmyPrm.entry_from_bytes(data, 5))
+        self.assertEqual(ROM_BTL_ENMY_PRM.entries[-1], BtlEnmyPrm.entry_from_bytes(data, -1))
+        with self.assertRaises(IndexError):
+            BtlEnmyPrm.entry_from_bytes(data, 20)
+
+    def test_to_bytes(self) -> None:
+        output_stream = io.BytesIO()
+        ROM_BTL_ENMY_PRM.write_bin(output_stream)
+        expected = output_stream.getvalue()
+
+        actual = ROM_BTL_ENMY_PRM.to_bytes()
+
+        self.assertEqual(len(expected), ROM_BTL_ENMY_PRM.bin_size)
+        self.assertEqual(expected, actual)
+
+    def test_write_entries_into(self) -> None:
+        buffer = ROM_BTL_ENMY_PRM.to_bytes()
+        btl_enmy_prm = copy.deepcopy(ROM_BTL_ENMY_PRM)
+        btl_enmy_prm.entries[1].gold = 1234
+        btl_enmy_prm.entries[3].level = 99
+
+        btl_enmy_prm.write_entries_into(buffer, [1, 3])
+
+        self.assertEqual(btl_enmy_prm.to_bytes(), buffer)
+        start, end = btl_enmy_prm.entry_range(3)
+        self.assertEqual(btl_enmy_prm.entries[3], BtlEnmyPrmEntry.from_packed(buffer[start:end]))
+
+
+class TestBtlEnmyPrmArray(unittest.TestCase):
+    def test_from_bin(self) -> None:
+        output_stream = io.BytesIO()
+        ROM_BTL_ENMY_PRM.write_bin(output_stream)
+        output_stream.seek(0)
+
+        actual = BtlEnmyPrmArray.from_bin(output_stream)
+
+        self.assertEqual(20, len(actual))
+        self.assertEqual(5, actual.entries["species_id"][5])
+        self.assertEqual(7, actual.entries["skills"]["skill_id"][5][2])
+        self.assertEqual([5, 0, 0], actual.entries["skill_set_ids"][5].tolist())
+
+    def test_write_bin(self) -> None:
+        output_stream = io.BytesIO()
+        ROM_BTL_ENMY_PRM.write_bin(output_stream)
+        expected = output_stream.getvalue()
+
+        btl_enmy_prm_array = BtlEnmyPrmArray.from_bytes(expected)
+        output_stream = io.BytesIO()
+        btl_enmy_prm_array.write_bin(output_stream)
+
+        actual = output_stream.getvalue()
+        self.assertEqual(expected, actual)
+
+    def test_to_pd(self) -> None:
+        output_stream = io.BytesIO()
+        ROM_BTL_ENMY_PRM.write_bin(output_stream)
+
+        actual = BtlEnmyPrmArray.from_bytes(output_stream.getvalue()).to_pd()
+
+        self.assertEqual(20, len(actual))
+        self.assertEqual(
+            [entry.max_hp for entry in ROM_BTL_ENMY_PRM.entries], actual["max_hp"].tolist()
+        )
+        self.assertEqual(
+            [entry.skills[5].skill_id for entry in ROM_BTL_ENMY_PRM.entries],
+            actual["skills_5_skill_id"].tolist(),
+        )
+        self.assertEqual(
+            [entry.item_drops[0].item_id for entry in ROM_BTL_ENMY_PRM.entries],
+            actual["item_drops_0_item_id"].tolist(),
+        )
+        self.assertIn("skill_set_ids_2", actual.columns)
+        self.assertIn("unknown_f_19", actual.columns)
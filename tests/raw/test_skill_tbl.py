@@ -2,7 +2,14 @@ import io
 import unittest
 
 from dqmj1_util import Region
-from dqmj1_util.raw import SkillTblEntry, SkillTblEntryJp, SkillTblEntryNaEu
+from dqmj1_util.raw import (
+    SkillTbl,
+    SkillTblArray,
+    SkillTblEntry,
+    SkillTblEntryJp,
+    SkillTblEntryNaEu,
+)
+from tests.util import ROM_SKILL_TBL
 
 
 class TestBtlEnmyPrmEntry(unittest.TestCase):
@@ -206,3 +213,93 @@ class TestBtlEnmyPrmEntry(unittest.TestCase):
             species_learnt_by=[1, 2, 0, 0, 0, 0],
         )
         self.assertEqual(expected, actual)
+
+
+class TestSkillTbl(unittest.TestCase):
+    def test_entry_from_bytes(self) -> None:
+        output_stream = io.BytesIO()
+        ROM_SKILL_TBL.write_bin(output_stream)
+        data = output_stream.getvalue()
+
+        self.assertEqual(10, SkillTbl.num_entries_from_bytes(data))
+        self.assertEqual(
+            ROM_SKILL_TBL.entries[3], SkillTbl.entry_from_bytes(data, 3, Region.NorthAmerica)
+        )
+        with self.assertRaises(IndexError):
+            SkillTbl.entry_from_bytes(data, 10, Region.NorthAmerica)
+
+    def test_to_bytes(self) -> None:
+        output_stream = io.BytesIO()
+        ROM_SKILL_TBL.write_bin(output_stream)
+        expected = output_stream.getvalue()
+
+        actual = ROM_SKILL_TBL.to_bytes()
+
+        self.assertEqual(len(expected), ROM_SKILL_TBL.bin_size)
+        self.assertEqual(expected, actual)
+
+
+class TestSkillTblArray(unittest.TestCase):
+    def test_dtype_sizes(self) -> None:
+        self.assertEqual(SkillTblEntryJp.__dataclass_struct__.size, SkillTblArray.dtype_jp.itemsize)
+        self.assertEqual(
+            SkillTblEntryNaEu.__dataclass_struct__.size, SkillTblArray.dtype_na_eu.itemsize
+        )
+
+    def test_from_bin(self) -> None:
+        output_stream = io.BytesIO()
+        ROM_SKILL_TBL.write_bin(output_stream)
+        output_stream.seek(0)
+
+        actual = SkillTblArray.from_bin(output_stream, Region.NorthAmerica)
+
+        self.assertEqual(10, len(actual))
+        self.assertEqual(3, actual.entries["skill_set_id"][3])
+        self.assertEqual(5, actual.entries["skills"]["skill_ids"][3][2][0])
+        self.assertEqual(20, len(actual.entries["unknown_c"][3]))
+
+    def test_write_bin(self) -> None:
+        output_stream = io.BytesIO()
+        ROM_SKILL_TBL.write_bin(output_stream)
+        expected = output_stream.getvalue()
+
+        skill_tbl_array = SkillTblArray.from_bytes(expected, Region.NorthAmerica)
+        output_stream = io.BytesIO()
+        skill_tbl_array.write_bin(output_stream)
+
+        actual = output_stream.getvalue()
+        self.assertEqual(expected, actual)
+
+    def test_num_rewards(self) -> None:
+        output_stream = io.BytesIO()
+        ROM_SKILL_TBL.write_bin(output_stream)
+        skill_tbl_array = SkillTblArray.from_bytes(output_stream.getvalue(), Region.NorthAmerica)
+        skill_tbl_array.entries = skill_tbl_array.entries.copy()
+
+        points_totals = skill_tbl_array.entries["skill_point_requirements"]["points_total"]
+        points_totals[0] = [0] * 10
+        points_totals[1] = list(range(1, 11))
+        points_totals[2] = [5, 10, 10, 10, 10, 10, 10, 10, 10, 10]
+
+        output_stream = io.BytesIO()
+        skill_tbl_array.write_bin(output_stream)
+        output_stream.seek(0)
+        expected = [
+            entry.num_rewards
+            for entry in SkillTbl.from_bin(output_stream, Region.NorthAmerica).entries
+        ]
+
+        actual = skill_tbl_array.num_rewards.tolist()
+        self.assertEqual([0, 10, 2] + [4] * 7, expected)
+        self.assertEqual(expected, actual)
+
+    def test_to_pd(self) -> None:
+        output_stream = io.BytesIO()
+        ROM_SKILL_TBL.write_bin(output_stream)
+
+        actual = SkillTblArray.from_bytes(output_stream.getvalue(), Region.NorthAmerica).to_pd()
+
+        self.assertEqual(10, len(actual))
+        self.assertEqual(4, actual["skills_2_skill_ids_0"][2])
+        self.assertEqual(12, actual["skill_point_requirements_9_points_total"][2])
+        self.assertEqual(2, actual["species_learnt_by_0"][2])
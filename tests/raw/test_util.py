@@ -0,0 +1,65 @@
+import io
+import unittest
+
+from dqmj1_util.raw import BtlEnmyPrmEntry, SkillTblEntryJp, SkillTblEntryNaEu
+from dqmj1_util.raw._util import (
+    BinaryRwNotDataclassStructError,
+    NotEnoughEntryDataError,
+    flat_struct_codec,
+)
+from tests.util import ROM_BTL_ENMY_PRM, ROM_SKILL_TBL
+
+
+class TestFlatStructCodec(unittest.TestCase):
+    def test_matches_dataclass_struct(self) -> None:
+        codec = flat_struct_codec(BtlEnmyPrmEntry)
+        entry = ROM_BTL_ENMY_PRM.entries[7]
+
+        self.assertEqual(BtlEnmyPrmEntry.__dataclass_struct__.size, codec.size)
+        self.assertEqual(entry.pack(), codec.pack(entry))
+        self.assertEqual(entry, codec.unpack(entry.pack()))
+
+    def test_unpack_many_jp(self) -> None:
+        entries = [
+            SkillTblEntryJp.from_packed(entry.pack()[:220]) for entry in ROM_SKILL_TBL.entries
+        ]
+        data = b"".join(entry.pack() for entry in entries)
+
+        actual = flat_struct_codec(SkillTblEntryJp).unpack_many(data)
+
+        self.assertEqual(entries, actual)
+
+    def test_not_dataclass_struct(self) -> None:
+        with self.assertRaises(BinaryRwNotDataclassStructError):
+            flat_struct_codec(int)
+
+
+class TestBinaryReadWriteable(unittest.TestCase):
+    def test_from_bin_many(self) -> None:
+        input_stream = io.BytesIO(b"".join(entry.pack() for entry in ROM_SKILL_TBL.entries))
+
+        actual = SkillTblEntryNaEu.from_bin_many(input_stream, len(ROM_SKILL_TBL.entries))
+
+        self.assertEqual(ROM_SKILL_TBL.entries, actual)
+
+    def test_from_bin_many_not_enough_data(self) -> None:
+        input_stream = io.BytesIO(b"".join(entry.pack() for entry in ROM_BTL_ENMY_PRM.entries[:3]))
+
+        with self.assertRaises(NotEnoughEntryDataError):
+            BtlEnmyPrmEntry.from_bin_many(input_stream, 4)
+
+    def test_write_bin_many(self) -> None:
+        output_stream = io.BytesIO()
+
+        BtlEnmyPrmEntry.write_bin_many(ROM_BTL_ENMY_PRM.entries, output_stream)
+
+        expected = b"".join(entry.pack() for entry in ROM_BTL_ENMY_PRM.entries)
+        self.assertEqual(expected, output_stream.getvalue())
+
+    def test_pack_many_into(self) -> None:
+        buffer = bytearray(4 + 2 * 88)
+
+        offset = BtlEnmyPrmEntry.pack_many_into(ROM_BTL_ENMY_PRM.entries[:2], buffer, 4)
+
+        self.assertEqual(len(buffer), offset)
+        self.assertEqual(ROM_BTL_ENMY_PRM.entries[1], BtlEnmyPrmEntry.from_packed(buffer[92:]))
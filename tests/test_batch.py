@@ -0,0 +1,147 @@
+import json
+import pathlib
+import tempfile
+import unittest
+
+from dqmj1_util import Region, read_roms
+from dqmj1_util._batch import FAILURE, SUCCESS, UnknownTableError, main
+from tests.util import ROM_BTL_ENMY_PRM, ROM_SKILL_TBL, write_rom
+
+
+class TestBatch(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_directory = tempfile.TemporaryDirectory()
+        self.directory = pathlib.Path(self.temp_directory.name)
+
+        self.rom_filepaths = [self.directory / f"rom_{i}.nds" for i in range(0, 3)]
+        for rom_filepath in self.rom_filepaths:
+            write_rom(rom_filepath)
+
+    def tearDown(self) -> None:
+        self.temp_directory.cleanup()
+
+    def test_read_roms(self) -> None:
+        results = list(
+            read_roms(
+                self.rom_filepaths,
+                ["encounters", "skill_sets", "btl_enmy_prm", "skill_tbl"],
+                workers=2,
+                max_in_flight=2,
+            )
+        )
+
+        self.assertEqual(
+            sorted(self.rom_filepaths), sorted(result.rom_filepath for result in results)
+        )
+        for result in results:
+            if result.tables is None:
+                self.fail(result.error)
+
+            self.assertEqual("Species3", result.tables["encounters"][3]["species"])
+            self.assertEqual(len(ROM_SKILL_TBL.entries), len(result.tables["skill_sets"]))
+            self.assertEqual(
+                [entry.species_id for entry in ROM_BTL_ENMY_PRM.entries],
+                result.tables["btl_enmy_prm"]["species_id"],
+            )
+
+    def test_error_isolation(self) -> None:
+        bad_filepath = self.directory / "bad.nds"
+        bad_filepath.write_bytes(b"not a rom")
+        missing_filepath = self.directory / "missing.nds"
+
+        results = {
+            result.rom_filepath: result
+            for result in read_roms(
+                [bad_filepath, self.rom_filepaths[0], missing_filepath], ["skills"], workers=2
+            )
+        }
+
+        self.assertIsNotNone(results[bad_filepath].error)
+        self.assertIsNotNone(results[missing_filepath].error)
+        self.assertIsNone(results[self.rom_filepaths[0]].error)
+
+    def test_read_roms_regions(self) -> None:
+        # The test ROMs are North American, so reading one as Japanese fails
+        results = {
+            result.rom_filepath: result
+            for result in read_roms(
+                [(self.rom_filepaths[0], Region.Japan), self.rom_filepaths[1]],
+                ["skill_sets"],
+                region=Region.NorthAmerica,
+                workers=2,
+            )
+        }
+
+        self.assertIsNotNone(results[self.rom_filepaths[0]].error)
+        self.assertIsNone(results[self.rom_filepaths[1]].error)
+
+    def test_unknown_table(self) -> None:
+        with self.assertRaises(UnknownTableError):
+            next(read_roms(self.rom_filepaths, ["unknown"]))
+
+    def test_main(self) -> None:
+        output_filepath = self.directory / "output.jsonl"
+
+        exit_code = main(
+            [
+                str(self.directory),
+                "--tables",
+                "string_tables",
+                "skills",
+                "--workers",
+                "2",
+                "--output_filepath",
+                str(output_filepath),
+            ]
+        )
+
+        lines = output_filepath.read_text(encoding="utf8").splitlines()
+        self.assertEqual(SUCCESS, exit_code)
+        self.assertEqual(len(self.rom_filepaths), len(lines))
+        for line in lines:
+            self.assertEqual({"string_tables", "skills"}, json.loads(line)["tables"].keys())
+
+    def test_main_failure(self) -> None:
+        output_filepath = self.directory / "output.jsonl"
+
+        exit_code = main(
+            [
+                str(self.directory / "missing.nds"),
+                "--tables",
+                "skills",
+                "--output_filepath",
+                str(output_filepath),
+            ]
+        )
+
+        self.assertEqual(FAILURE, exit_code)
+        self.assertIn("error", json.loads(output_filepath.read_text(encoding="utf8")))
+
+    def test_main_path_region(self) -> None:
+        output_filepath = self.directory / "output.jsonl"
+
+        exit_code = main(
+            [
+                str(self.directory),
+                "--tables",
+                "skill_sets",
+                "--path_region",
+                str(self.rom_filepaths[0]),
+                "Japan",
+                "--output_filepath",
+                str(output_filepath),
+            ]
+        )
+
+        results = [
+            json.loads(line) for line in output_filepath.read_text(encoding="utf8").splitlines()
+        ]
+        self.assertEqual(FAILURE, exit_code)
+        self.assertEqual(
+            [str(self.rom_filepaths[0])],
+            [result["rom_filepath"] for result in results if "error" in result],
+        )
+
+    def test_main_path_region_unknown(self) -> None:
+        with self.assertRaises(SystemExit):
+            main([str(self.directory), "--tables", "skills", "--path_region", ".", "Mars"])
@@ -1,6 +1,6 @@
 import unittest
 
-from dqmj1_util._character_encoding import CHARACTER_ENCODINGS
+from dqmj1_util._character_encoding import CHARACTER_ENCODINGS, Dmqj1BytesToStringDecodingError
 from dqmj1_util._region import Region
 
 
@@ -94,3 +94,50 @@ class TestCharacterEncoding(unittest.TestCase):
         actual = character_encoding.bytes_to_string(bs)
 
         self.assertEqual(expected, actual)
+
+    def test_bytes_to_string_multi_byte_characters(self) -> None:
+        bs = b"\x2e\x92\x2e\xe0\x00\xff"
+        character_encoding = CHARACTER_ENCODINGS[Region.Japan]
+
+        expected = "かが引"
+        actual = character_encoding.bytes_to_string(bs)
+
+        self.assertEqual(expected, actual)
+
+    def test_bytes_to_string_unmatched_multi_byte_prefix(self) -> None:
+        bs = b"\x92\xdd\x2e\xff"
+        character_encoding = CHARACTER_ENCODINGS[Region.Japan]
+
+        expected = "[0x92][0xdd]か"
+        actual = character_encoding.bytes_to_string(bs)
+
+        self.assertEqual(expected, actual)
+
+    def test_bytes_to_string_truncated_multi_byte_character(self) -> None:
+        bs = b"\x2e\xe0"
+        character_encoding = CHARACTER_ENCODINGS[Region.Japan]
+
+        with self.assertRaises(Dmqj1BytesToStringDecodingError):
+            character_encoding.bytes_to_string(bs)
+
+    def test_read_strings(self) -> None:
+        data = memoryview(b"\x25\xff\x00\x0a\x25\x26\xff\x26\xfe\x00\x99")
+        character_encoding = CHARACTER_ENCODINGS[Region.NorthAmerica]
+
+        expected = ["a", "ab", "b", ""]
+        actual = character_encoding.read_strings(data, [0, 2, 7, 11])
+
+        self.assertEqual(expected, actual)
+
+    def test_read_strings_missing_terminator(self) -> None:
+        data = b"\x25\x26\xff"
+        character_encoding = CHARACTER_ENCODINGS[Region.NorthAmerica]
+
+        with self.assertRaises(ValueError):
+            character_encoding.read_strings(data, [0], max_string_length=2)
+
+    def test_read_string_truncated_newline(self) -> None:
+        character_encoding = CHARACTER_ENCODINGS[Region.Japan]
+
+        with self.assertRaises(IndexError):
+            character_encoding.read_string(b"\xfe")
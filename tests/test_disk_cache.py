@@ -0,0 +1,60 @@
+import pathlib
+import tempfile
+import unittest
+
+from dqmj1_util._disk_cache import DiskCache, rom_fingerprint
+from dqmj1_util._region import Region
+
+
+class TestRomFingerprint(unittest.TestCase):
+    def test_fingerprint(self) -> None:
+        header = b"\x00" * 0x200
+        fingerprint = rom_fingerprint(header, b"arm9", [b"a", b"b"], Region.NorthAmerica)
+
+        self.assertEqual(
+            fingerprint, rom_fingerprint(header, b"arm9", [b"a", b"b"], Region.NorthAmerica)
+        )
+        self.assertNotEqual(
+            fingerprint, rom_fingerprint(header, b"arm9", [b"a", b"c"], Region.NorthAmerica)
+        )
+        self.assertNotEqual(
+            fingerprint, rom_fingerprint(header, b"arm9", [b"ab", b""], Region.NorthAmerica)
+        )
+        self.assertNotEqual(
+            fingerprint, rom_fingerprint(header, b"arm9", [b"a", b"b"], Region.Japan)
+        )
+        self.assertNotEqual(
+            fingerprint,
+            rom_fingerprint(
+                b"\x00" * 0x15E + b"\x01\x00" + b"\x00" * 0xA0,
+                b"arm9",
+                [b"a", b"b"],
+                Region.NorthAmerica,
+            ),
+        )
+
+
+class TestDiskCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_directory = tempfile.TemporaryDirectory()
+        self.cache_dir = pathlib.Path(self.temp_directory.name) / "cache"
+
+    def tearDown(self) -> None:
+        self.temp_directory.cleanup()
+
+    def test_set_and_get(self) -> None:
+        cache = DiskCache(self.cache_dir, lambda: "abc")
+        self.assertIsNone(cache.get("key"))
+
+        cache.set("key", [1, "a"])
+
+        self.assertEqual([1, "a"], cache.get("key"))
+        self.assertEqual([1, "a"], DiskCache(self.cache_dir, lambda: "abc").get("key"))
+        self.assertIsNone(DiskCache(self.cache_dir, lambda: "def").get("key"))
+
+    def test_corrupted_file(self) -> None:
+        cache = DiskCache(self.cache_dir, lambda: "abc")
+        cache.set("key", 1)
+        cache.filepath.write_bytes(b"not a cache file")
+
+        self.assertIsNone(DiskCache(self.cache_dir, lambda: "abc").get("key"))
@@ -1,8 +1,13 @@
+import copy
+import dataclasses
 import pathlib
+import tempfile
 import unittest
 
-from dqmj1_util._guide import GuideData, write_guide
-from tests.util import ENCOUNTERS, SKILL_SETS, SKILLS
+from dqmj1_util._guide import GuideData, get_environment, list_pages, write_guide
+from dqmj1_util._guide._manifest import MANIFEST_FILENAME, GuideManifest, ManifestEntry
+from dqmj1_util._rom import Rom
+from tests.util import ENCOUNTERS, SKILL_SETS, SKILLS, write_rom
 
 
 class TestGuide(unittest.TestCase):
@@ -14,3 +19,204 @@ class TestGuide(unittest.TestCase):
         guide_data = GuideData(skills=SKILLS, skill_sets=SKILL_SETS, encounters=ENCOUNTERS)
 
         write_guide(guide_data, output_directory)
+
+    def test_write_guide_in_parallel(self) -> None:
+        output_directory = pathlib.Path(__file__).parent / "output" / "write_guide_in_parallel"
+        guide_data = GuideData(skills=SKILLS, skill_sets=SKILL_SETS, encounters=ENCOUNTERS)
+
+        write_guide(guide_data, output_directory / "serial")
+        write_guide(guide_data, output_directory / "parallel", workers=2)
+
+        expected = read_files(output_directory / "serial")
+        actual = read_files(output_directory / "parallel")
+
+        self.assertGreater(len(expected), 4)
+        self.assertEqual(expected, actual)
+
+    def test_write_guide_incremental(self) -> None:
+        guide_data = GuideData(skills=SKILLS, skill_sets=SKILL_SETS, encounters=ENCOUNTERS)
+
+        with tempfile.TemporaryDirectory() as temp_directory:
+            output_directory = pathlib.Path(temp_directory)
+
+            written_paths = write_guide(guide_data, output_directory, incremental=True)
+            self.assertEqual(
+                sorted(str(page.path) for page in list_pages(guide_data)),
+                sorted(str(path) for path in written_paths),
+            )
+            self.assertEqual(
+                sorted(str(path) for path in written_paths),
+                sorted(GuideManifest.read(output_directory).entries.keys()),
+            )
+
+            self.assertEqual([], write_guide(guide_data, output_directory, incremental=True))
+
+            skill_sets = copy.deepcopy(SKILL_SETS)
+            skill_sets[1] = dataclasses.replace(skill_sets[1], max_skill_points=1)
+            modified_guide_data = dataclasses.replace(guide_data, skill_sets=skill_sets)
+
+            # The skill set's own page is rendered again, but does not show the max skill points,
+            # so is not written
+            expected = [pathlib.PurePosixPath("skill_sets.html")]
+            actual = write_guide(modified_guide_data, output_directory, incremental=True)
+
+            self.assertEqual(expected, actual)
+
+    def test_write_guide_encounter_and_species_pages(self) -> None:
+        output_directory = pathlib.Path(__file__).parent / "output" / "write_guide_species"
+        guide_data = GuideData(skills=SKILLS, skill_sets=SKILL_SETS, encounters=ENCOUNTERS)
+
+        write_guide(guide_data, output_directory)
+
+        species_html = (output_directory / "species" / "1.html").read_text(encoding="utf8")
+        self.assertIn("species_a", species_html)
+        self.assertIn('href="../encounters/1.html"', species_html)
+
+        encounter_html = (output_directory / "encounters" / "1.html").read_text(encoding="utf8")
+        self.assertIn('href="../species/1.html"', encounter_html)
+        self.assertIn('href="../skills/2.html"', encounter_html)
+
+        skill_html = (output_directory / "skills" / "2.html").read_text(encoding="utf8")
+        self.assertIn('href="../encounters/1.html"', skill_html)
+
+    def test_write_guide_species_pages_from_rom(self) -> None:
+        output_directory = pathlib.Path(__file__).parent / "output" / "write_guide_species_rom"
+
+        with tempfile.TemporaryDirectory() as temp_directory:
+            rom_filepath = pathlib.Path(temp_directory) / "rom.nds"
+            write_rom(rom_filepath)
+            rom = Rom(rom_filepath)
+
+            # Only keep the encounter of species 1, so other species only learn skill sets
+            guide_data = GuideData(
+                skills=rom.skills,
+                skill_sets=rom.skill_sets,
+                encounters=rom.encounters[0:2],
+                species_names=rom.string_tables.species_names,
+            )
+
+            write_guide(guide_data, output_directory)
+
+        species_html = (output_directory / "species" / "1.html").read_text(encoding="utf8")
+        self.assertIn('href="../encounters/1.html"', species_html)
+        self.assertIn('href="../skill_sets/1.html"', species_html)
+
+        species_html = (output_directory / "species" / "5.html").read_text(encoding="utf8")
+        self.assertIn("Species5", species_html)
+        self.assertIn('href="../skill_sets/5.html"', species_html)
+        self.assertNotIn('href="../encounters/', species_html)
+
+    def test_write_guide_not_incremental_deletes_manifest(self) -> None:
+        guide_data = GuideData(skills=SKILLS, skill_sets=SKILL_SETS, encounters=ENCOUNTERS)
+
+        with tempfile.TemporaryDirectory() as temp_directory:
+            output_directory = pathlib.Path(temp_directory)
+
+            write_guide(guide_data, output_directory, incremental=True)
+            self.assertTrue((output_directory / MANIFEST_FILENAME).exists())
+
+            # Would otherwise be out of date for the next incremental write
+            write_guide(guide_data, output_directory)
+            self.assertFalse((output_directory / MANIFEST_FILENAME).exists())
+
+            written_paths = write_guide(guide_data, output_directory, incremental=True)
+            self.assertEqual(len(list_pages(guide_data)), len(written_paths))
+
+    def test_write_guide_incremental_encounter(self) -> None:
+        guide_data = GuideData(skills=SKILLS, skill_sets=SKILL_SETS, encounters=ENCOUNTERS)
+
+        with tempfile.TemporaryDirectory() as temp_directory:
+            output_directory = pathlib.Path(temp_directory)
+
+            write_guide(guide_data, output_directory, incremental=True)
+
+            encounters = copy.deepcopy(ENCOUNTERS)
+            encounters[5] = dataclasses.replace(encounters[5], gold=12345)
+            modified_guide_data = dataclasses.replace(guide_data, encounters=encounters)
+
+            expected = [
+                pathlib.PurePosixPath("encounters.html"),
+                pathlib.PurePosixPath("encounters/5.html"),
+            ]
+            actual = write_guide(modified_guide_data, output_directory, incremental=True)
+
+            self.assertEqual(expected, actual)
+
+    def test_write_guide_leaves_no_temporary_files(self) -> None:
+        output_directory = pathlib.Path(__file__).parent / "output" / "write_guide_temporary_files"
+        guide_data = GuideData(skills=SKILLS, skill_sets=SKILL_SETS, encounters=ENCOUNTERS)
+
+        write_guide(guide_data, output_directory)
+        write_guide(guide_data, output_directory, incremental=True)
+
+        self.assertEqual([], list(output_directory.rglob("*.tmp")))
+
+    def test_write_guide_incremental_deletes_removed_pages(self) -> None:
+        output_directory = pathlib.Path(__file__).parent / "output" / "write_guide_deletes"
+        guide_data = GuideData(skills=SKILLS, skill_sets=SKILL_SETS, encounters=ENCOUNTERS)
+
+        write_guide(guide_data, output_directory, incremental=True)
+        self.assertTrue((output_directory / "skills" / f"{len(SKILLS) - 1}.html").exists())
+
+        write_guide(
+            dataclasses.replace(guide_data, skills=SKILLS[:-1]), output_directory, incremental=True
+        )
+        self.assertFalse((output_directory / "skills" / f"{len(SKILLS) - 1}.html").exists())
+
+    def test_list_pages_are_streamed_by_row(self) -> None:
+        guide_data = GuideData(skills=SKILLS, skill_sets=SKILL_SETS, encounters=ENCOUNTERS)
+        env = get_environment()
+
+        for page in list_pages(guide_data):
+            if page.path.name not in ["encounters.html", "skills.html", "skill_sets.html"]:
+                continue
+
+            with self.subTest(page=page.path):
+                chunks = list(env.get_template(page.template).generate(**page.context))
+
+                # No chunk contains more than a small part of the page's data
+                self.assertLess(max(len(chunk) for chunk in chunks), 10000)
+                self.assertGreater(sum(len(chunk) for chunk in chunks), 20000)
+
+    def test_template_cache_dir(self) -> None:
+        output_directory = pathlib.Path(__file__).parent / "output" / "template_cache_dir"
+        guide_data = GuideData(skills=SKILLS, skill_sets=SKILL_SETS, encounters=ENCOUNTERS)
+
+        write_guide(
+            guide_data, output_directory / "guide", template_cache_dir=output_directory / "cache"
+        )
+
+        self.assertIs(
+            get_environment(output_directory / "cache"),
+            get_environment(output_directory / "cache"),
+        )
+        self.assertGreater(len(list((output_directory / "cache").iterdir())), 0)
+
+    def test_template_cache_is_opt_in(self) -> None:
+        self.assertIsNone(get_environment().bytecode_cache)
+
+    def test_write_guide_incremental_does_not_delete_outside_output(self) -> None:
+        output_directory = pathlib.Path(__file__).parent / "output" / "write_guide_outside"
+        guide_data = GuideData(skills=SKILLS, skill_sets=SKILL_SETS, encounters=ENCOUNTERS)
+
+        write_guide(guide_data, output_directory, incremental=True)
+
+        outside_filepath = output_directory.parent / "write_guide_outside.txt"
+        outside_filepath.write_text("outside", encoding="utf8")
+
+        manifest = GuideManifest.read(output_directory)
+        manifest.entries["../write_guide_outside.txt"] = ManifestEntry("a", "b")
+        manifest.entries[str(outside_filepath.resolve())] = ManifestEntry("a", "b")
+        manifest.write(output_directory)
+
+        write_guide(guide_data, output_directory, incremental=True)
+
+        self.assertTrue(outside_filepath.exists())
+
+
+def read_files(directory: pathlib.Path) -> dict[pathlib.Path, bytes]:
+    return {
+        filepath.relative_to(directory): filepath.read_bytes()
+        for filepath in directory.rglob("*")
+        if filepath.is_file()
+    }
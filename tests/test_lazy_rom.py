@@ -0,0 +1,60 @@
+import pathlib
+import tempfile
+import unittest
+
+import ndspy.rom
+
+from dqmj1_util._lazy_rom import (
+    LazyRomFile,
+    LazyRomFileClosedError,
+    RomFileNotFoundError,
+    RomFileTooSmallError,
+)
+from tests.util import write_rom
+
+
+class TestLazyRomFile(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_directory = tempfile.TemporaryDirectory()
+        self.rom_filepath = pathlib.Path(self.temp_directory.name) / "rom.nds"
+        write_rom(self.rom_filepath)
+
+    def tearDown(self) -> None:
+        self.temp_directory.cleanup()
+
+    def test_matches_ndspy(self) -> None:
+        expected = ndspy.rom.NintendoDSRom.fromFile(self.rom_filepath)
+
+        lazy_rom_file = LazyRomFile(self.rom_filepath)
+
+        self.assertEqual(expected.arm9, lazy_rom_file.arm9)
+        self.assertEqual(
+            expected.getFileByName("BtlEnmyPrm.bin"),
+            lazy_rom_file.get_file_by_name("BtlEnmyPrm.bin"),
+        )
+        self.assertEqual(expected.files[1], lazy_rom_file.get_file_by_id(1))
+        self.assertEqual(expected.files, lazy_rom_file.to_ndspy_rom().files)
+
+    def test_file_not_found(self) -> None:
+        lazy_rom_file = LazyRomFile(self.rom_filepath)
+
+        with self.assertRaises(RomFileNotFoundError):
+            lazy_rom_file.get_file_by_name("Missing.bin")
+
+    def test_close(self) -> None:
+        lazy_rom_file = LazyRomFile(self.rom_filepath)
+        arm9 = lazy_rom_file.arm9
+
+        lazy_rom_file.close()
+
+        self.assertTrue(lazy_rom_file.closed)
+        self.assertEqual(arm9, lazy_rom_file.arm9)
+        with self.assertRaises(LazyRomFileClosedError):
+            lazy_rom_file.get_file_by_name("SkillTbl.bin")
+
+    def test_too_small(self) -> None:
+        filepath = pathlib.Path(self.temp_directory.name) / "small.nds"
+        filepath.write_bytes(b"\x00" * 0x10)
+
+        with self.assertRaises(RomFileTooSmallError):
+            LazyRomFile(filepath)
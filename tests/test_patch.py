@@ -0,0 +1,156 @@
+import io
+import unittest
+import zlib
+
+from dqmj1_util._patch import (
+    IPS_EOF_OFFSET,
+    IpsOffsetTooLargeError,
+    PatchChecksumError,
+    UnknownPatchFormatError,
+    apply_bps,
+    apply_ips,
+    apply_patch,
+    decode_bps_number,
+    diff,
+    encode_bps_number,
+    merge_changes,
+    write_bps,
+    write_ips,
+)
+
+
+def create_ips(source: bytes, target: bytes) -> bytes:
+    output_stream = io.BytesIO()
+    write_ips(source, diff(source, target), len(target), output_stream)
+    return output_stream.getvalue()
+
+
+def create_bps(source: bytes, target: bytes) -> bytes:
+    output_stream = io.BytesIO()
+    write_bps(source, diff(source, target), len(target), output_stream)
+    return output_stream.getvalue()
+
+
+class TestDiff(unittest.TestCase):
+    def test_diff(self) -> None:
+        source = b"abcdefghijklmnopqrstuvwxyz"
+        target = b"aBcdefghijklmNOpqrsTuvwxyz!!"
+
+        actual = diff(source, target, offset=100)
+
+        self.assertEqual([(101, b"B"), (113, b"NOpqrsT"), (126, b"!!")], actual)
+
+    def test_merge_changes(self) -> None:
+        source = b"abcdefghijklmnopqrstuvwxyz"
+        changes = [(1, b"B"), (2, b"C"), (10, b"K"), (25, b"Z")]
+
+        actual = merge_changes(source, changes)
+
+        self.assertEqual([(1, b"BC"), (10, b"K"), (25, b"Z")], actual)
+        self.assertEqual([(1, b"BcdefG")], merge_changes(source, [(1, b"B"), (6, b"G")]))
+
+    def test_no_changes(self) -> None:
+        self.assertEqual([], diff(b"abc", b"abc"))
+        self.assertEqual([], diff(b"", b""))
+        self.assertEqual([(0, b"abc")], diff(b"", b"abc"))
+
+
+class TestIps(unittest.TestCase):
+    def test_roundtrip(self) -> None:
+        source = bytes(i * 7 % 256 for i in range(0, 0x20000))
+        target = bytearray(source)
+        target[5:10] = b"\x00" * 5
+        target[0x10000:0x10002] = b"\xff\xff"
+        target += b"extra"
+
+        patch = create_ips(source, bytes(target))
+
+        self.assertEqual(target, apply_ips(source, patch))
+
+    def test_truncate(self) -> None:
+        source = b"abcdefgh"
+        target = b"abXd"
+
+        patch = create_ips(source, target)
+
+        self.assertEqual(target, apply_ips(source, patch))
+
+    def test_eof_offset(self) -> None:
+        source = bytes(IPS_EOF_OFFSET + 16)
+        target = bytearray(source)
+        target[IPS_EOF_OFFSET : IPS_EOF_OFFSET + 2] = b"\x01\x02"
+
+        patch = create_ips(source, bytes(target))
+
+        self.assertNotIn(IPS_EOF_OFFSET.to_bytes(3, "big") + b"\x00", patch[5:-3])
+        self.assertEqual(target, apply_ips(source, patch))
+
+    def test_eof_offset_adjacent_changes(self) -> None:
+        source = bytes(IPS_EOF_OFFSET + 16)
+        changes = [(IPS_EOF_OFFSET - 6, b"\x01" * 6), (IPS_EOF_OFFSET, b"\x02")]
+
+        output_stream = io.BytesIO()
+        write_ips(source, changes, len(source), output_stream)
+
+        target = bytearray(source)
+        target[IPS_EOF_OFFSET - 6 : IPS_EOF_OFFSET + 1] = b"\x01" * 6 + b"\x02"
+        self.assertEqual(target, apply_ips(source, output_stream.getvalue()))
+
+    def test_rle_record(self) -> None:
+        patch = b"PATCH" + b"\x00\x00\x02" + b"\x00\x00" + b"\x00\x03" + b"z" + b"EOF"
+
+        self.assertEqual(b"abzzzf", apply_ips(b"abcdef", patch))
+
+    def test_offset_too_large(self) -> None:
+        with self.assertRaises(IpsOffsetTooLargeError):
+            write_ips(b"", [(0x1000000, b"a")], 0x1000001, io.BytesIO())
+
+
+class TestBps(unittest.TestCase):
+    def test_numbers(self) -> None:
+        for number in [0, 1, 127, 128, 129, 16511, 16512, 2**32]:
+            encoded = encode_bps_number(number)
+            self.assertEqual((number, len(encoded)), decode_bps_number(encoded, 0))
+
+    def test_roundtrip(self) -> None:
+        source = bytes(i * 13 % 251 for i in range(0, 0x20000))
+        target = bytearray(source)
+        target[0:3] = b"abc"
+        target[0x1FFF0:] = b"end"
+
+        patch = create_bps(source, bytes(target))
+
+        self.assertEqual(target, apply_bps(source, patch))
+        self.assertEqual(target, apply_patch(source, patch))
+
+    def test_copy_actions(self) -> None:
+        source = b"0123456789"
+        target = b"6789ababab"
+
+        patch = bytearray(b"BPS1")
+        patch += encode_bps_number(len(source))
+        patch += encode_bps_number(len(target))
+        patch += encode_bps_number(0)
+        # SourceCopy of "6789"
+        patch += encode_bps_number(((4 - 1) << 2) | 2) + encode_bps_number(6 << 1)
+        # TargetRead of "ab"
+        patch += encode_bps_number(((2 - 1) << 2) | 1) + b"ab"
+        # TargetCopy of "abab", overlapping the data being written
+        patch += encode_bps_number(((4 - 1) << 2) | 3) + encode_bps_number(4 << 1)
+        patch += zlib.crc32(source).to_bytes(4, "little")
+        patch += zlib.crc32(target).to_bytes(4, "little")
+        patch += zlib.crc32(patch).to_bytes(4, "little")
+
+        self.assertEqual(target, apply_bps(source, bytes(patch)))
+
+    def test_wrong_source(self) -> None:
+        patch = create_bps(b"abcdef", b"abXdef")
+
+        with self.assertRaises(PatchChecksumError):
+            apply_bps(b"abcdeg", patch)
+
+
+class TestApplyPatch(unittest.TestCase):
+    def test_unknown_format(self) -> None:
+        with self.assertRaises(UnknownPatchFormatError):
+            apply_patch(b"abc", b"UPS1abc")
@@ -0,0 +1,600 @@
+import concurrent.futures
+import dataclasses
+import pathlib
+import tempfile
+import time
+import unittest
+from typing import Optional
+from unittest import mock
+
+from dqmj1_util._patch import PatchFormat
+from dqmj1_util._rom import CachedData, CacheStats, ForkedRomOverwriteError, Rom
+from dqmj1_util._string_tables import StringTables
+from dqmj1_util.simple._encounter import Encounter
+from tests.util import ROM_BTL_ENMY_PRM, ROM_SKILL_TBL, ROM_STRING_TABLES, write_rom
+
+
+class TestCachedData(unittest.TestCase):
+    def setUp(self) -> None:
+        self.source = [1, 2, 3]
+        self.num_loads = {"doubled": 0, "offset": 0}
+
+        self.values = CachedData(lambda: list(self.source), writeable=True)
+        self.doubled = CachedData(
+            self.load_doubled, inputs=[self.values], item_loader=self.load_doubled_item
+        )
+        # Items are loaded lazily, so are cleared rather than reloaded
+        self.offset = CachedData(
+            self.load_offset, inputs=[self.doubled], item_loader=lambda _: None
+        )
+
+    def load_doubled(self) -> list[Optional[int]]:
+        self.num_loads["doubled"] += 1
+        return [value * 2 for value in self.values.view()]
+
+    def load_doubled_item(self, index: int) -> int:
+        return self.values.view()[index] * 2
+
+    def load_offset(self) -> list[Optional[int]]:
+        self.num_loads["offset"] += 1
+        return [None] * len(self.doubled.view())
+
+    def test_recompute_on_modified_input(self) -> None:
+        self.assertEqual([2, 4, 6], self.doubled.view())
+        self.assertEqual([2, 4, 6], self.doubled.view())
+
+        with self.values.edit() as values:
+            values.append(4)
+
+        self.assertEqual([2, 4, 6, 8], self.doubled.view())
+        self.assertEqual(2, self.num_loads["doubled"])
+        self.assertEqual(CacheStats(hits=1, misses=1, recomputes=1), self.doubled.stats)
+
+    def test_loading_input_does_not_recompute(self) -> None:
+        derived = CachedData(lambda: "derived", inputs=[self.values])
+        derived.view()
+
+        self.values.view()
+        derived.view()
+
+        self.assertEqual(CacheStats(hits=1, misses=1, recomputes=0), derived.stats)
+
+    def test_modified_item(self) -> None:
+        self.assertEqual([None, None, None], self.offset.view())
+        self.offset.view()[2] = 100
+
+        with self.values.edit_item(1, lambda values, i: values) as values:
+            values[1] = 5
+
+        # Only the modified item is reloaded, both in the direct and indirectly derived data
+        self.assertEqual([2, 10, 6], self.doubled.view())
+        self.assertEqual([None, None, 100], self.offset.view())
+        self.assertEqual(1, self.num_loads["doubled"])
+        self.assertEqual(1, self.num_loads["offset"])
+        self.assertEqual({1}, self.doubled.changed_items_since(0))
+        self.assertEqual(frozenset({1}), self.values.dirty_items)
+
+    def test_modified_item_without_item_loader(self) -> None:
+        derived = CachedData(
+            lambda: [value * 2 for value in self.values.view()], inputs=[self.values]
+        )
+        self.assertEqual([2, 4, 6], derived.view())
+
+        with self.values.edit_item(1, lambda values, i: values) as values:
+            values[1] = 5
+
+        self.assertEqual([2, 10, 6], derived.view())
+        self.assertEqual(CacheStats(hits=0, misses=1, recomputes=1), derived.stats)
+
+    def test_single_flight_loading(self) -> None:
+        num_loads = 0
+
+        def load() -> int:
+            nonlocal num_loads
+            num_loads += 1
+            # Give the other threads time to try accessing the data while it is being loaded
+            time.sleep(0.05)
+            return 1
+
+        data = CachedData(load)
+        derived = CachedData(lambda: data.view() + 1, inputs=[data])
+        with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lambda _: derived.view(), range(0, 16)))
+
+        self.assertEqual([2] * 16, results)
+        self.assertEqual(1, num_loads)
+        self.assertEqual(1, derived.stats.misses)
+
+    def test_writeable_derived_data(self) -> None:
+        derived = CachedData(lambda: sum(self.values.view()), writeable=True, inputs=[self.values])
+        derived.set(11)
+        self.assertEqual(11, derived.view())
+
+        # The set value is kept rather than being overwritten by reloading
+        with self.values.edit() as values:
+            values.append(4)
+
+        self.assertEqual(11, derived.view())
+        self.assertTrue(derived.is_dirty)
+
+        derived.mark_clean()
+        with self.values.edit() as values:
+            values.append(5)
+
+        self.assertEqual(15, derived.view())
+
+
+class TestRom(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_directory = tempfile.TemporaryDirectory()
+        self.rom_filepath = pathlib.Path(self.temp_directory.name) / "rom.nds"
+        write_rom(self.rom_filepath)
+
+    def tearDown(self) -> None:
+        self.temp_directory.cleanup()
+
+    def test_string_tables(self) -> None:
+        rom = Rom(self.rom_filepath)
+
+        self.assertEqual(ROM_STRING_TABLES, rom.string_tables)
+
+    def test_lazy(self) -> None:
+        rom = Rom(self.rom_filepath, lazy=True)
+
+        self.assertEqual(ROM_STRING_TABLES, rom.string_tables)
+        self.assertEqual("Species3", rom.encounter(3).species)
+        self.assertEqual(len(ROM_SKILL_TBL.entries), len(rom.skill_sets))
+        self.assertTrue(rom.is_lazy)
+
+        self.assertEqual(ROM_BTL_ENMY_PRM.to_bytes(), rom.rom.getFileByName("BtlEnmyPrm.bin"))
+        self.assertFalse(rom.is_lazy)
+        self.assertEqual("Species3", rom.encounter(3).species)
+
+    def test_lazy_write(self) -> None:
+        rom = Rom(self.rom_filepath, lazy=True)
+        with rom.edit_btl_enmy_prm() as btl_enmy_prm:
+            btl_enmy_prm.entries[3].species_id = 318
+
+        rom.write(self.rom_filepath)
+
+        self.assertEqual("Species318", Rom(self.rom_filepath).encounters[3].species)
+
+    def test_cache_dir(self) -> None:
+        cache_dir = pathlib.Path(self.temp_directory.name) / "cache"
+        rom = Rom(self.rom_filepath, cache_dir=cache_dir)
+        expected_encounter = rom.encounter(3)
+        expected_skill_set = rom.skill_set(2)
+        expected_skill = rom.skill(5)
+
+        # Nothing should need to be decoded from the ROM, as it is all in the cache
+        with (
+            mock.patch("dqmj1_util._rom.StringTables.from_arm9") as from_arm9,
+            mock.patch("dqmj1_util._rom.Encounter.from_raw") as encounter_from_raw,
+            mock.patch("dqmj1_util._rom.SkillSet.from_raw") as skill_set_from_raw,
+        ):
+            cached_rom = Rom(self.rom_filepath, lazy=True, cache_dir=cache_dir)
+
+            self.assertEqual(ROM_STRING_TABLES, cached_rom.string_tables)
+            self.assertEqual(expected_encounter, cached_rom.encounter(3))
+            self.assertEqual(expected_skill_set, cached_rom.skill_set(2))
+            self.assertEqual(expected_skill, cached_rom.skill(5))
+
+            from_arm9.assert_not_called()
+            encounter_from_raw.assert_not_called()
+            skill_set_from_raw.assert_not_called()
+
+    def test_cache_dir_not_used_for_modified_data(self) -> None:
+        cache_dir = pathlib.Path(self.temp_directory.name) / "cache"
+        self.assertEqual(
+            "Species3", Rom(self.rom_filepath, cache_dir=cache_dir).encounter(3).species
+        )
+
+        rom = Rom(self.rom_filepath, cache_dir=cache_dir)
+        with rom.edit_btl_enmy_prm() as btl_enmy_prm:
+            btl_enmy_prm.entries[3].species_id = 318
+
+        self.assertEqual("Species318", rom.encounter(3).species)
+
+        rom.write(self.rom_filepath)
+        self.assertEqual(
+            "Species318", Rom(self.rom_filepath, cache_dir=cache_dir).encounter(3).species
+        )
+
+    def test_encounters(self) -> None:
+        rom = Rom(self.rom_filepath)
+
+        encounters = rom.encounters
+
+        self.assertEqual(len(ROM_BTL_ENMY_PRM.entries), len(encounters))
+        self.assertEqual("Species3", encounters[3].species)
+        self.assertEqual(["Species1", "Species2"], [e.species for e in encounters[1:3]])
+        self.assertEqual(list(encounters), encounters)
+        self.assertTrue(encounters == list(encounters))
+        self.assertNotEqual(list(encounters)[1:], encounters)
+
+    def test_encounters_are_frozen(self) -> None:
+        rom = Rom(self.rom_filepath)
+
+        encounter = rom.encounters[3]
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            encounter.species = "Modified"  # type: ignore[misc]
+
+        self.assertIs(encounter, rom.encounters[3])
+        self.assertEqual("Modified", dataclasses.replace(encounter, species="Modified").species)
+        self.assertEqual("Species3", rom.encounters[3].species)
+
+    def test_edit_btl_enmy_prm(self) -> None:
+        rom = Rom(self.rom_filepath)
+        self.assertEqual("Species3", rom.encounters[3].species)
+
+        with rom.edit_btl_enmy_prm() as btl_enmy_prm:
+            btl_enmy_prm.entries[3].species_id = 318
+
+        self.assertEqual(318, rom.btl_enmy_prm.entries[3].species_id)
+        self.assertEqual("Species318", rom.encounters[3].species)
+
+    def test_view_btl_enmy_prm(self) -> None:
+        rom = Rom(self.rom_filepath)
+
+        btl_enmy_prm = rom.view_btl_enmy_prm()
+
+        self.assertEqual(ROM_BTL_ENMY_PRM, btl_enmy_prm)
+        self.assertIs(btl_enmy_prm, rom.view_btl_enmy_prm())
+        self.assertIs(rom.view_skill_tbl(), rom.view_skill_tbl())
+        self.assertIs(rom.view_string_tables(), rom.view_string_tables())
+
+        with rom.edit_btl_enmy_prm_entry(3) as entry:
+            entry.species_id = 318
+
+        self.assertEqual(318, rom.view_btl_enmy_prm().entries[3].species_id)
+
+    def test_write_btl_enmy_prm(self) -> None:
+        rom = Rom(self.rom_filepath)
+        with rom.edit_btl_enmy_prm() as btl_enmy_prm:
+            btl_enmy_prm.entries[3].species_id = 318
+
+        output_filepath = pathlib.Path(self.temp_directory.name) / "output.nds"
+        rom.write(output_filepath)
+
+        self.assertEqual("Species318", Rom(output_filepath).encounters[3].species)
+
+    def test_write_skill_tbl(self) -> None:
+        rom = Rom(self.rom_filepath)
+        skill_tbl_file = rom.rom.getFileByName("SkillTbl.bin")
+        with rom.edit_skill_tbl() as skill_tbl:
+            skill_tbl.entries[2].skills[0].skill_ids[0] = 100
+
+        output_filepath = pathlib.Path(self.temp_directory.name) / "output.nds"
+        rom.write(output_filepath)
+
+        self.assertIs(skill_tbl_file, rom.rom.getFileByName("SkillTbl.bin"))
+        self.assertEqual("Skill100", Rom(output_filepath).skill_sets[2].rewards[0].skill)
+
+    def test_write_skill_tbl_resized(self) -> None:
+        rom = Rom(self.rom_filepath)
+        with rom.edit_skill_tbl() as skill_tbl:
+            skill_tbl.entries.pop()
+
+        output_filepath = pathlib.Path(self.temp_directory.name) / "output.nds"
+        rom.write(output_filepath)
+
+        self.assertEqual(len(ROM_SKILL_TBL.entries) - 1, len(Rom(output_filepath).skill_sets))
+
+    def test_fork(self) -> None:
+        rom = Rom(self.rom_filepath)
+        btl_enmy_prm = rom.btl_enmy_prm
+        self.assertEqual("Species3", rom.encounter(3).species)
+
+        rom_fork = rom.fork()
+        with rom_fork.edit_btl_enmy_prm() as fork_btl_enmy_prm:
+            fork_btl_enmy_prm.entries[3].species_id = 318
+        with rom.edit_skill_tbl() as skill_tbl:
+            skill_tbl.entries[2].skills[0].skill_ids[0] = 100
+
+        self.assertEqual("Species3", rom.encounter(3).species)
+        self.assertEqual("Species318", rom_fork.encounter(3).species)
+        self.assertEqual(btl_enmy_prm, rom.btl_enmy_prm)
+        self.assertEqual("Skill100", rom.skill_set(2).rewards[0].skill)
+        self.assertNotEqual("Skill100", rom_fork.skill_set(2).rewards[0].skill)
+
+    def test_fork_write(self) -> None:
+        for lazy in [False, True]:
+            with self.subTest(lazy=lazy):
+                rom = Rom(self.rom_filepath, lazy=lazy)
+                original_data = rom.read_file("BtlEnmyPrm.bin")
+
+                output_filepaths = []
+                for i in range(0, 3):
+                    rom_fork = rom.fork()
+                    with rom_fork.edit_btl_enmy_prm() as btl_enmy_prm:
+                        btl_enmy_prm.entries[3].species_id = 300 + i
+                        if i == 2:
+                            # Resized, so the ROM needs to be rebuilt
+                            btl_enmy_prm.entries.append(btl_enmy_prm.entries[0])
+
+                    output_filepath = pathlib.Path(self.temp_directory.name) / f"output_{i}.nds"
+                    rom_fork.write(output_filepath)
+                    output_filepaths.append(output_filepath)
+
+                self.assertEqual(original_data, rom.read_file("BtlEnmyPrm.bin"))
+                self.assertEqual("Species3", rom.encounter(3).species)
+                for i, output_filepath in enumerate(output_filepaths):
+                    self.assertEqual(f"Species{300 + i}", Rom(output_filepath).encounter(3).species)
+
+    def test_fork_write_copies_rom_once(self) -> None:
+        rom = Rom(self.rom_filepath)
+        rom_fork = rom.fork()
+        output_filepath = pathlib.Path(self.temp_directory.name) / "output.nds"
+
+        with rom_fork.edit_btl_enmy_prm_entry(3) as entry:
+            entry.species_id = 300
+        rom_fork.write(output_filepath)
+        fork_files = rom_fork.rom.files
+
+        with rom_fork.edit_btl_enmy_prm_entry(3) as entry:
+            entry.species_id = 301
+        rom_fork.write(output_filepath)
+
+        self.assertIs(fork_files, rom_fork.rom.files)
+        self.assertEqual("Species301", Rom(output_filepath).encounter(3).species)
+        self.assertEqual("Species3", rom.encounter(3).species)
+
+        # Forks of a fork that has written to its files don't share the written file buffers
+        rom_fork_fork = rom_fork.fork()
+        with rom_fork_fork.edit_btl_enmy_prm_entry(3) as entry:
+            entry.species_id = 302
+        rom_fork_fork.write(output_filepath)
+
+        self.assertEqual("Species301", rom_fork.encounter(3).species)
+        self.assertEqual("Species302", Rom(output_filepath).encounter(3).species)
+
+    def test_fork_write_over_source(self) -> None:
+        rom = Rom(self.rom_filepath, lazy=True)
+        rom_fork = rom.fork()
+        with rom_fork.edit_btl_enmy_prm_entry(3) as entry:
+            entry.species_id = 300
+
+        with self.assertRaises(ForkedRomOverwriteError):
+            rom_fork.write(self.rom_filepath)
+        with self.assertRaises(ForkedRomOverwriteError):
+            rom.write(self.rom_filepath)
+
+        self.assertEqual("Species3", rom.encounter(3).species)
+
+    def test_fork_rom_exposed(self) -> None:
+        rom = Rom(self.rom_filepath)
+        rom_fork = rom.fork()
+
+        original_data = bytes(rom.rom.files[0])
+        fork_file = rom_fork.rom.files[0]
+        if not isinstance(fork_file, bytearray):
+            self.fail()
+        fork_file[0:4] = b"abcd"
+
+        self.assertEqual(original_data, rom.rom.files[0])
+        self.assertEqual(b"abcd", rom_fork.rom.files[0][0:4])
+
+    def test_edit_btl_enmy_prm_entry(self) -> None:
+        rom = Rom(self.rom_filepath)
+        self.assertEqual("Species3", rom.encounter(3).species)
+        self.assertEqual("Species4", rom.encounter(4).species)
+
+        with rom.edit_btl_enmy_prm_entry(-len(rom.encounters) + 3) as entry:
+            entry.species_id = 318
+
+        with mock.patch(
+            "dqmj1_util._rom.Encounter.from_raw", wraps=Encounter.from_raw
+        ) as encounter_from_raw:
+            self.assertEqual("Species318", rom.encounter(3).species)
+            self.assertEqual("Species4", rom.encounter(4).species)
+            encounter_from_raw.assert_called_once()
+
+    def test_write_entries(self) -> None:
+        rom = Rom(self.rom_filepath, lazy=True)
+        with rom.edit_btl_enmy_prm_entry(3) as btl_enmy_prm_entry:
+            btl_enmy_prm_entry.species_id = 318
+        with rom.edit_skill_tbl_entry(2) as skill_tbl_entry:
+            skill_tbl_entry.skills[0].skill_ids[0] = 100
+
+        output_filepath = pathlib.Path(self.temp_directory.name) / "output.nds"
+        with (
+            mock.patch("dqmj1_util._rom.BtlEnmyPrm.write_into") as btl_enmy_prm_write_into,
+            mock.patch("dqmj1_util._rom.SkillTbl.write_into") as skill_tbl_write_into,
+        ):
+            rom.write(output_filepath)
+            btl_enmy_prm_write_into.assert_not_called()
+            skill_tbl_write_into.assert_not_called()
+
+        output_rom = Rom(output_filepath)
+        self.assertEqual("Species318", output_rom.encounter(3).species)
+        self.assertEqual("Skill100", output_rom.skill_set(2).rewards[0].skill)
+        self.assertEqual(rom.btl_enmy_prm, output_rom.btl_enmy_prm)
+        self.assertEqual(rom.skill_tbl, output_rom.skill_tbl)
+
+        # Also written into the already read in ROM when rebuilding it
+        rom.rom.arm9 = bytes(rom.rom.arm9)
+        rom.write(output_filepath)
+        self.assertEqual(rom.btl_enmy_prm.to_bytes(), rom.rom.getFileByName("BtlEnmyPrm.bin"))
+        self.assertEqual(rom.btl_enmy_prm, Rom(output_filepath).btl_enmy_prm)
+
+    def test_cache_stats(self) -> None:
+        rom = Rom(self.rom_filepath)
+        rom.encounter(3)
+        rom.skill(1)
+        rom.encounter(4)
+
+        with rom.edit_btl_enmy_prm_entry(3) as entry:
+            entry.species_id = 318
+        rom.encounter(3)
+
+        cache_stats = rom.cache_stats
+        self.assertEqual(CacheStats(hits=1, misses=1, recomputes=1), cache_stats["encounters"])
+        self.assertEqual(CacheStats(hits=0, misses=1, recomputes=0), cache_stats["skills"])
+
+    def test_concurrent_reads(self) -> None:
+        rom = Rom(self.rom_filepath, lazy=True)
+
+        with (
+            mock.patch(
+                "dqmj1_util._rom.StringTables.from_arm9", wraps=StringTables.from_arm9
+            ) as from_arm9,
+            concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor,
+        ):
+            species = list(executor.map(lambda i: rom.encounter(i % 8).species, range(0, 64)))
+            from_arm9.assert_called_once()
+
+        self.assertEqual([f"Species{i % 8}" for i in range(0, 64)], species)
+
+    def test_write_patched_copy(self) -> None:
+        rom = Rom(self.rom_filepath, lazy=True)
+        with rom.edit_btl_enmy_prm() as btl_enmy_prm:
+            btl_enmy_prm.entries[3].species_id = 318
+        with rom.edit_skill_tbl() as skill_tbl:
+            skill_tbl.entries[2].skills[0].skill_ids[0] = 100
+
+        output_filepath = pathlib.Path(self.temp_directory.name) / "output.nds"
+        with mock.patch("ndspy.rom.NintendoDSRom.saveToFile") as save_to_file:
+            rom.write(output_filepath)
+            save_to_file.assert_not_called()
+
+        self.assertTrue(rom.is_lazy)
+        self.assertEqual(self.rom_filepath.stat().st_size, output_filepath.stat().st_size)
+
+        output_rom = Rom(output_filepath)
+        self.assertEqual(rom.btl_enmy_prm, output_rom.btl_enmy_prm)
+        self.assertEqual(rom.skill_tbl, output_rom.skill_tbl)
+        self.assertEqual(ROM_STRING_TABLES, output_rom.string_tables)
+
+    def test_write_patched_source(self) -> None:
+        rom = Rom(self.rom_filepath)
+        with rom.edit_btl_enmy_prm() as btl_enmy_prm:
+            btl_enmy_prm.entries[3].species_id = 318
+
+        with mock.patch("ndspy.rom.NintendoDSRom.saveToFile") as save_to_file:
+            rom.write(self.rom_filepath)
+            rom.write(self.rom_filepath)
+            save_to_file.assert_not_called()
+
+        self.assertEqual("Species318", Rom(self.rom_filepath).encounter(3).species)
+        self.assertEqual(rom.btl_enmy_prm.to_bytes(), rom.rom.getFileByName("BtlEnmyPrm.bin"))
+
+    def test_write_rebuilds_if_rom_exposed(self) -> None:
+        rom = Rom(self.rom_filepath)
+        rom.rom.arm9 = bytes(rom.rom.arm9[:-4]) + b"\x01\x02\x03\x04"
+
+        output_filepath = pathlib.Path(self.temp_directory.name) / "output.nds"
+        rom.write(output_filepath)
+
+        self.assertEqual(b"\x01\x02\x03\x04", Rom(output_filepath).rom.arm9[-4:])
+
+    def test_write_rebuilds_if_source_changed(self) -> None:
+        rom = Rom(self.rom_filepath)
+        with rom.edit_btl_enmy_prm() as btl_enmy_prm:
+            btl_enmy_prm.entries[3].species_id = 318
+        self.rom_filepath.write_bytes(self.rom_filepath.read_bytes() + b"\x00" * 16)
+
+        output_filepath = pathlib.Path(self.temp_directory.name) / "output.nds"
+        with mock.patch("ndspy.rom.NintendoDSRom.saveToFile") as save_to_file:
+            rom.write(output_filepath)
+            save_to_file.assert_called_once()
+
+    def test_write_patch(self) -> None:
+        for patch_format in PatchFormat:
+            with self.subTest(patch_format=patch_format):
+                rom = Rom(self.rom_filepath, lazy=True)
+                with rom.edit_btl_enmy_prm() as btl_enmy_prm:
+                    btl_enmy_prm.entries[3].species_id = 318
+
+                patch_filepath = pathlib.Path(self.temp_directory.name) / "patch"
+                rom.write_patch(patch_filepath, patch_format=patch_format)
+
+                self.assertTrue(rom.is_lazy)
+                self.assertLess(patch_filepath.stat().st_size, 64)
+
+                output_filepath = pathlib.Path(self.temp_directory.name) / "output.nds"
+                Rom.apply_patch(self.rom_filepath, patch_filepath, output_filepath)
+
+                self.assertEqual("Species318", Rom(output_filepath).encounter(3).species)
+
+    def test_write_patch_resized(self) -> None:
+        rom = Rom(self.rom_filepath)
+        with rom.edit_skill_tbl() as skill_tbl:
+            skill_tbl.entries.pop()
+
+        patch_filepath = pathlib.Path(self.temp_directory.name) / "patch.bps"
+        rom.write_patch(patch_filepath)
+
+        output_filepath = pathlib.Path(self.temp_directory.name) / "output.nds"
+        Rom.apply_patch(self.rom_filepath, patch_filepath, output_filepath)
+
+        self.assertEqual(len(ROM_SKILL_TBL.entries) - 1, len(Rom(output_filepath).skill_sets))
+
+    def test_encounter(self) -> None:
+        rom = Rom(self.rom_filepath)
+
+        self.assertEqual("Species3", rom.encounter(3).species)
+        self.assertEqual("Species19", rom.encounter(-1).species)
+        with self.assertRaises(IndexError):
+            rom.encounter(len(ROM_BTL_ENMY_PRM.entries))
+
+    def test_encounter_after_edit(self) -> None:
+        rom = Rom(self.rom_filepath)
+        self.assertEqual("Species3", rom.encounter(3).species)
+
+        with rom.edit_btl_enmy_prm() as btl_enmy_prm:
+            btl_enmy_prm.entries[3].species_id = 318
+
+        self.assertEqual("Species318", rom.encounter(3).species)
+
+    def test_skill_set(self) -> None:
+        rom = Rom(self.rom_filepath)
+
+        self.assertEqual("SkillSet2", rom.skill_set(2).name)
+        self.assertEqual(["SkillSet8", "SkillSet9"], [s.name for s in rom.skill_sets[-2:]])
+        with self.assertRaises(IndexError):
+            rom.skill_set(len(ROM_SKILL_TBL.entries))
+
+    def test_skill(self) -> None:
+        rom = Rom(self.rom_filepath)
+
+        self.assertEqual("Skill5", rom.skill(5).name)
+        self.assertEqual(285, len(rom.skills))
+
+
+class TestRomAsync(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.temp_directory = tempfile.TemporaryDirectory()
+        self.rom_filepath = pathlib.Path(self.temp_directory.name) / "rom.nds"
+        write_rom(self.rom_filepath)
+
+    def tearDown(self) -> None:
+        self.temp_directory.cleanup()
+
+    async def test_open_async(self) -> None:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
+            rom = await Rom.open_async(self.rom_filepath, lazy=True, executor=executor)
+
+            # Already loaded by preloading
+            self.assertEqual(CacheStats(hits=0, misses=1), rom.cache_stats["string_tables"])
+            self.assertEqual(CacheStats(hits=0, misses=1), rom.cache_stats["btl_enmy_prm"])
+            self.assertEqual(CacheStats(hits=0, misses=1), rom.cache_stats["skill_tbl"])
+
+            self.assertEqual(ROM_STRING_TABLES, await rom.string_tables_async())
+            self.assertEqual("Species3", (await rom.encounter_async(3)).species)
+            self.assertEqual(len(ROM_SKILL_TBL.entries), len(await rom.skill_sets_async()))
+            self.assertEqual("Skill5", (await rom.skill_async(5)).name)
+
+    async def test_open_async_string_table_workers(self) -> None:
+        rom = await Rom.open_async(self.rom_filepath, string_table_workers=2)
+
+        self.assertEqual(ROM_STRING_TABLES, await rom.string_tables_async())
+
+    async def test_write_async(self) -> None:
+        rom = await Rom.open_async(self.rom_filepath, preload=False)
+        with rom.edit_btl_enmy_prm_entry(3) as entry:
+            entry.species_id = 318
+
+        output_filepath = pathlib.Path(self.temp_directory.name) / "output.nds"
+        await rom.write_async(output_filepath)
+
+        self.assertEqual("Species318", (await Rom.open_async(output_filepath)).encounter(3).species)
@@ -0,0 +1,81 @@
+import unittest
+from unittest import mock
+
+import ndspy.rom
+
+from dqmj1_util._region import Region
+from dqmj1_util._string_tables import StringTables
+from dqmj1_util._string_tables._locations import STRING_TABLE_LOCATIONS
+from dqmj1_util._string_tables._locations._locations import (
+    StringTableLocations,
+    TableLocation,
+    read_pointers,
+)
+
+
+class TestReadPointers(unittest.TestCase):
+    def test_read_pointers(self) -> None:
+        data = b"\x00\x00\x01\x00\x00\x02\x04\x00\x00\x02\xff"
+
+        expected = (0x02000001, 0x02000004)
+        actual = read_pointers(data, 2, 10)
+
+        self.assertEqual(expected, actual)
+
+
+class TestTableLocation(unittest.TestCase):
+    def test_read(self) -> None:
+        rom = ndspy.rom.NintendoDSRom()
+        rom.arm9 = (
+            # pointers
+            b"\x0c\x00\x00\x02"
+            b"\x0e\x00\x00\x02"
+            b"\x00\x00\x00\x00"
+            # strings
+            b"\x25\xff"
+            b"\x25\x26\xff"
+        )
+        table_location = TableLocation("arm9.bin", 0x02000000, 0x0200000C)
+
+        expected = ["a", "ab", ""]
+        actual = table_location.read(rom, Region.NorthAmerica)
+
+        self.assertEqual(expected, actual)
+
+    def test_read_string_offsets(self) -> None:
+        arm9 = b"\x0c\x00\x00\x02\x0e\x00\x00\x02\x00\x00\x00\x00\x25\xff\x25\x26\xff"
+        table_location = TableLocation("arm9.bin", 0x02000000, 0x0200000C)
+
+        expected = [0x0C, 0x0E, len(arm9)]
+        actual = table_location.read_string_offsets(arm9)
+
+        self.assertEqual(expected, actual)
+
+
+class TestStringTables(unittest.TestCase):
+    def test_from_arm9_in_parallel(self) -> None:
+        # Every table points to the same few strings, so decoding is split into multiple chunks
+        num_strings = 300
+        pointers = b"".join(
+            (0x02000000 + 4 * num_strings + 2 * (i % 3)).to_bytes(4, "little")
+            for i in range(0, num_strings)
+        )
+        arm9 = pointers + b"\x25\xff\x26\xff\x27\xff"
+
+        with mock.patch.dict(
+            STRING_TABLE_LOCATIONS,
+            {
+                Region.NorthAmerica: StringTableLocations(
+                    species_names=TableLocation("arm9.bin", 0x02000000, 0x02000000 + 4 * 100),
+                    skill_names=TableLocation("arm9.bin", 0x02000000, 0x02000000 + 4 * 300),
+                    trait_names=TableLocation("arm9.bin", 0x02000000, 0x02000000),
+                    skill_set_names=TableLocation("arm9.bin", 0x02000000, 0x02000000 + 4 * 7),
+                    item_names=TableLocation("arm9.bin", 0x02000000, 0x02000000 + 4 * 250),
+                )
+            },
+        ):
+            expected = StringTables.from_arm9(arm9, Region.NorthAmerica)
+            actual = StringTables.from_arm9(arm9, Region.NorthAmerica, workers=2)
+
+        self.assertEqual(["a", "b", "c", "a"], actual.species_names[0:4])
+        self.assertEqual(expected, actual)
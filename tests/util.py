@@ -1,4 +1,16 @@
+import io
+import os
+from typing import Any
+
+import ndspy.fnt
+import ndspy.rom
+
+from dqmj1_util._character_encoding import CHARACTER_ENCODINGS
+from dqmj1_util._region import Region
 from dqmj1_util._string_tables import StringTables
+from dqmj1_util._string_tables._locations import STRING_TABLE_LOCATIONS
+from dqmj1_util.raw._btl_enmy_prm import BtlEnmyPrm, BtlEnmyPrmEntry
+from dqmj1_util.raw._skill_tbl import SkillTbl, SkillTblEntry, SkillTblEntryNaEu
 from dqmj1_util.simple._encounter import Encounter
 from dqmj1_util.simple._skill import Skill
 from dqmj1_util.simple._skill_set import SkillSet
@@ -19,8 +31,8 @@ SKILL_SETS = [
         category=1,
         max_skill_points=100,
         rewards=[],
-        species_learnt_by=["species_a"],
-        species_learnt_by_ids=[2],
+        species_learnt_by=[2, 0, 0, 0, 0, 0],
+        species_learnt_by_ids=[],
     )
     for i in range(0, 257)
 ]
@@ -47,3 +59,105 @@ ENCOUNTERS = [
     )
     for _ in range(0, 257)
 ]
+
+ROM_STRING_TABLES = StringTables(
+    species_names=[f"Species{i}" for i in range(0, 512)],
+    skill_names=[f"Skill{i}" for i in range(0, 285)],
+    trait_names=[f"Trait{i}" for i in range(0, 256)],
+    skill_set_names=[f"SkillSet{i}" for i in range(0, 257)],
+    item_names=[f"Item{i}" for i in range(0, 257)],
+)
+
+ROM_BTL_ENMY_PRM = BtlEnmyPrm(
+    [
+        BtlEnmyPrmEntry(
+            species_id=i,
+            unknown_a=b"\x00\x00\x00\x00\x00\x00",
+            skills=[BtlEnmyPrmEntry.EnemySkill(b"\x00\x00", i + j) for j in range(0, 6)],
+            item_drops=[BtlEnmyPrmEntry.ItemDrop(i, 1), BtlEnmyPrmEntry.ItemDrop(0, 0)],
+            gold=10 * i,
+            unknown_b=b"\x00\x00",
+            exp=20 * i,
+            unknown_c=b"\x00\x00",
+            level=i,
+            unknown_d=b"\x00",
+            unknown_e=b"\x00",
+            scout_chance=5,
+            max_hp=100 + i,
+            max_mp=50 + i,
+            attack=30 + i,
+            defense=40 + i,
+            agility=20 + i,
+            wisdom=10 + i,
+            unknown_f=b"\x00" * 20,
+            skill_set_ids=[i, 0, 0],
+            unknown_g=b"\x00",
+        )
+        for i in range(0, 20)
+    ]
+)
+
+ROM_SKILL_TBL = SkillTbl(
+    [
+        SkillTblEntryNaEu(
+            can_upgrade=0,
+            category=1,
+            max_skill_points=30,
+            unknown_a=b"\x00",
+            skill_point_requirements=[
+                SkillTblEntry.SkillPointRequirement(points_delta=3, points_total=3 * min(j, 4))
+                for j in range(1, 11)
+            ],
+            skills=[
+                SkillTblEntry.Skills(skill_ids=[i + j, 0, 0, 0], unknown_a=b"\x00\x00\x00\x00")
+                for j in range(0, 10)
+            ],
+            traits=[SkillTblEntry.Traits(trait_ids=[0, 0, 0, 0]) for _ in range(0, 10)],
+            skill_set_id=i,
+            unknown_b=b"\x00\x00",
+            species_learnt_by=[i, 0, 0, 0, 0, 0],
+            unknown_c=b"\x00" * 20,
+        )
+        for i in range(0, 10)
+    ]
+)
+
+
+def create_rom() -> ndspy.rom.NintendoDSRom:
+    """
+    Creates a small North American ROM containing the string tables and data files that
+    :class:`dqmj1_util.Rom` reads.
+    """
+    string_table_locations = STRING_TABLE_LOCATIONS[Region.NorthAmerica]
+    character_encoding = CHARACTER_ENCODINGS[Region.NorthAmerica]
+    offset = 0x02000000
+
+    arm9 = bytearray(0x78100)
+    for name, table_location in vars(string_table_locations).items():
+        strings = getattr(ROM_STRING_TABLES, name)
+        for i in range(0, (table_location.end - table_location.start) // 4):
+            string_pointer = offset + len(arm9)
+            arm9.extend(character_encoding.string_to_bytes(strings[i]))
+
+            pointer_offset = table_location.start - offset + i * 4
+            arm9[pointer_offset : pointer_offset + 4] = string_pointer.to_bytes(4, "little")
+
+    btl_enmy_prm_stream = io.BytesIO()
+    ROM_BTL_ENMY_PRM.write_bin(btl_enmy_prm_stream)
+
+    skill_tbl_stream = io.BytesIO()
+    ROM_SKILL_TBL.write_bin(skill_tbl_stream)
+
+    rom = ndspy.rom.NintendoDSRom()
+    rom.arm9 = bytes(arm9)
+    rom.filenames = ndspy.fnt.Folder(files=["BtlEnmyPrm.bin", "SkillTbl.bin"])
+    rom.files = [btl_enmy_prm_stream.getvalue(), skill_tbl_stream.getvalue()]
+
+    return rom
+
+
+def write_rom(filepath: os.PathLike[Any] | str) -> None:
+    """
+    Writes the ROM created by :func:`create_rom` to the given filepath.
+    """
+    create_rom().saveToFile(filepath)